@@ -15,7 +15,8 @@ from app.models import User, Artist, Community, Category, ArtistCategory, Bookin
 from app.models.artist_tour_date import ArtistTourDate
 from app.models.conversation import Conversation, Message
 from app.models.tour import TourJoinRequest
-from app.models.notification import Notification
+from app.models.notification import Notification, NotificationArchive, NotificationCounter
+from app.models.daily_metric import DailyMetric
 from app.config import get_settings
 
 # Alembic Config object
@@ -0,0 +1,66 @@
+"""Add denormalized inbox summary columns to conversations.
+
+Revision ID: 000029
+Revises: 000028
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = "e5f6a7b8c9d0"
+down_revision = "d4e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("conversations", sa.Column("last_message_preview", sa.String(255), nullable=True))
+    op.add_column("conversations", sa.Column("last_message_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column(
+        "conversations",
+        sa.Column(
+            "last_sender_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "conversations",
+        sa.Column("message_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_index("ix_conversations_updated_at", "conversations", ["updated_at"])
+
+    # Backfill from existing messages (preview matches record_message's truncation)
+    op.execute("""
+        UPDATE conversations c
+        SET
+            message_count = s.message_count,
+            last_message_at = s.created_at,
+            last_sender_id = s.sender_id,
+            last_message_preview = CASE
+                WHEN length(s.content) > 100 THEN left(s.content, 100) || '...'
+                ELSE s.content
+            END
+        FROM (
+            SELECT DISTINCT ON (conversation_id)
+                conversation_id,
+                sender_id,
+                content,
+                created_at,
+                count(*) OVER (PARTITION BY conversation_id) AS message_count
+            FROM messages
+            ORDER BY conversation_id, created_at DESC, id DESC
+        ) s
+        WHERE c.id = s.conversation_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_conversations_updated_at", table_name="conversations")
+    op.drop_column("conversations", "message_count")
+    op.drop_column("conversations", "last_sender_id")
+    op.drop_column("conversations", "last_message_at")
+    op.drop_column("conversations", "last_message_preview")
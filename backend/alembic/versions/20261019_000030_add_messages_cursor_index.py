@@ -0,0 +1,31 @@
+"""Add composite (conversation_id, created_at, id) index on messages.
+
+Replaces the single-column conversation_id index, which the composite
+index covers.
+
+Revision ID: 000030
+Revises: 000029
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "f6a7b8c9d0e1"
+down_revision = "e5f6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_messages_conversation_created_id",
+        "messages",
+        ["conversation_id", "created_at", "id"],
+    )
+    op.drop_index("ix_messages_conversation_id", table_name="messages")
+
+
+def downgrade() -> None:
+    op.create_index("ix_messages_conversation_id", "messages", ["conversation_id"])
+    op.drop_index("ix_messages_conversation_created_id", table_name="messages")
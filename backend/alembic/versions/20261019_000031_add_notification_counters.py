@@ -0,0 +1,50 @@
+"""Add notification_counters table and composite notifications index.
+
+The (user_id, is_read, created_at) index replaces the single-column
+user_id and is_read indexes.
+
+Revision ID: 000031
+Revises: 000030
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = "a7b8c9d0e1f2"
+down_revision = "f6a7b8c9d0e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_counters",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("unread_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+    op.execute("""
+        INSERT INTO notification_counters (user_id, unread_count, updated_at)
+        SELECT user_id, count(*), NOW()
+        FROM notifications
+        WHERE is_read = false
+        GROUP BY user_id
+    """)
+
+    op.create_index(
+        "ix_notifications_user_read_created",
+        "notifications",
+        ["user_id", "is_read", "created_at"],
+    )
+    op.drop_index("ix_notifications_is_read", table_name="notifications")
+    op.drop_index("ix_notifications_user_id", table_name="notifications")
+
+
+def downgrade() -> None:
+    op.create_index("ix_notifications_user_id", "notifications", ["user_id"])
+    op.create_index("ix_notifications_is_read", "notifications", ["is_read"])
+    op.drop_index("ix_notifications_user_read_created", table_name="notifications")
+    op.drop_table("notification_counters")
@@ -0,0 +1,35 @@
+"""Add notifications_archive table for the notification retention job.
+
+Revision ID: 000032
+Revises: 000031
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = "b8c9d0e1f2a3"
+down_revision = "a7b8c9d0e1f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notifications_archive",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("type", sa.String(50), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("link", sa.String(500), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True)),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_notifications_archive_user_id", "notifications_archive", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notifications_archive_user_id", table_name="notifications_archive")
+    op.drop_table("notifications_archive")
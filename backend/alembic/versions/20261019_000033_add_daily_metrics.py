@@ -0,0 +1,42 @@
+"""Add daily_metrics rollup table for admin analytics.
+
+Revision ID: 000033
+Revises: 000032
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "c9d0e1f2a3b4"
+down_revision = "b8c9d0e1f2a3"
+branch_labels = None
+depends_on = None
+
+
+def counter(name: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), server_default="0", nullable=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_metrics",
+        sa.Column("day", sa.Date(), primary_key=True),
+        counter("users_new"),
+        counter("artist_signups"),
+        counter("community_signups"),
+        counter("agent_signups"),
+        counter("artists_new"),
+        counter("communities_new"),
+        counter("bookings_new"),
+        sa.Column("bookings_by_status", postgresql.JSONB(), server_default="{}", nullable=False),
+        counter("tour_dates_new"),
+        sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    # The rollup job backfills history on its first run.
+
+
+def downgrade() -> None:
+    op.drop_table("daily_metrics")
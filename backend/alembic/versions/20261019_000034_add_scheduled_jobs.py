@@ -0,0 +1,27 @@
+"""Add scheduled_jobs table so periodic jobs run once per interval across workers.
+
+Revision ID: 000034
+Revises: 000033
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = "d0e1f2a3b4c5"
+down_revision = "c9d0e1f2a3b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduled_jobs",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduled_jobs")
@@ -0,0 +1,132 @@
+"""Structured access log, written off the event loop and sampled per route.
+
+Request coroutines only put records on a queue (``QueueHandler``); a
+``QueueListener`` thread formats them and writes to stdout, so a slow
+terminal or log shipper never stalls the event loop.
+
+Each line is one JSON object (``ACCESS_LOG_FORMAT=json``) with the request
+id, user id, route template, status, duration, and the request's SQL
+statement count and time. Noisy routes can be sampled with
+``ACCESS_LOG_SAMPLE_RATES``, e.g. ``/api/health=0.01``; 5xx responses are
+always logged. Each entry records the rate it was sampled at.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from app.config import get_settings
+from app.query_stats import QueryStats
+
+settings = get_settings()
+logger = logging.getLogger("kolamba.access")
+
+TEXT_FORMAT = "%(asctime)s %(levelname)-8s [%(name)s] %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def parse_sample_rates(spec: str) -> dict[str, float]:
+    """``"/api/health=0.01,/api/metrics=0.1"`` -> {route template: fraction}."""
+    rates = {}
+    for item in spec.split(","):
+        route, _, rate = item.strip().rpartition("=")
+        if not route:
+            continue
+        try:
+            rates[route] = min(max(float(rate), 0.0), 1.0)
+        except ValueError:
+            logger.warning("Ignoring access log sample rate %r", item)
+    return rates
+
+
+sample_rates = parse_sample_rates(settings.access_log_sample_rates)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record; access fields come from ``extra={"access": {...}}``."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "access", {}),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queues records as they are, so formatting also happens on the listener thread.
+
+    Safe because access records only carry immutable arguments.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[QueueListener] = None
+
+
+def configure(format: str = settings.access_log_format, stream=None) -> None:
+    """Route the access logger through a queue to a stdout writer thread. Idempotent."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if format == "json" else logging.Formatter(TEXT_FORMAT, DATE_FORMAT))
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(records, handler)
+    _listener.start()
+    logger.handlers = [_DeferredQueueHandler(records)]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def flush() -> None:
+    """Write out every queued record and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(flush)
+
+
+def log_request(
+    scope,
+    route: str,
+    status_code: int,
+    seconds: float,
+    request_id: str,
+    db_stats: Optional[QueryStats],
+) -> None:
+    """Log one finished request, subject to its route's sample rate."""
+    rate = sample_rates.get(route, 1.0)
+    if status_code < 500 and rate < 1.0 and random.random() >= rate:
+        return
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    method, path, duration_ms = scope["method"], scope["path"], seconds * 1000
+    logger.info("%s %s %d %.0fms", method, path, status_code, duration_ms, extra={"access": {
+        "request_id": request_id,
+        "method": method,
+        "path": path,
+        "route": route,
+        "status": status_code,
+        "duration_ms": round(duration_ms, 2),
+        "user_id": scope.get("state", {}).get("user_id"),
+        "db_queries": db_stats.queries if db_stats is not None else None,
+        "db_ms": round(db_stats.seconds * 1000, 2) if db_stats is not None else None,
+        "sample_rate": rate,
+    }})
@@ -0,0 +1,393 @@
+"""Server-side response cache for public read endpoints.
+
+Responses are cached by method, path and query string, served with a strong
+ETag (``If-None-Match`` returns 304), and kept for a stale-while-revalidate
+window during which the stale copy is served while a single background
+request refreshes it. Write routes invalidate entries by tag, e.g.
+``await response_cache.invalidate("artists")``.
+
+Backends: an in-process LRU (default) or Redis, which is shared between
+workers and instances (``RESPONSE_CACHE_BACKEND=redis`` + ``REDIS_URL``).
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger("kolamba.cache")
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """Caching policy for one exact path."""
+    path: str
+    ttl: int  # Seconds a cached response is fresh
+    stale_ttl: int  # Extra seconds a stale response may be served while refreshing
+    tags: frozenset[str]
+
+
+# Public, non-personalised endpoints only: the cache key ignores auth headers.
+CACHE_RULES: dict[str, CacheRule] = {
+    rule.path: rule
+    for rule in [
+        CacheRule("/api/categories", ttl=300, stale_ttl=600, tags=frozenset({"categories"})),
+        CacheRule("/api/talents/featured", ttl=60, stale_ttl=300, tags=frozenset({"artists"})),
+        CacheRule("/api/talents/tour-dates/recent", ttl=60, stale_ttl=300, tags=frozenset({"artists", "tour_dates"})),
+        CacheRule("/api/tours/opportunities", ttl=60, stale_ttl=300, tags=frozenset({"artists", "tours"})),
+    ]
+}
+
+
+@dataclass
+class CacheEntry:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+    fresh_until: float
+    stale_until: float
+    tags: frozenset[str] = field(default_factory=frozenset)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "status": self.status,
+            "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in self.headers],
+            "body": base64.b64encode(self.body).decode(),
+            "etag": self.etag,
+            "fresh_until": self.fresh_until,
+            "stale_until": self.stale_until,
+            "tags": sorted(self.tags),
+        })
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "CacheEntry":
+        data = json.loads(raw)
+        return cls(
+            status=data["status"],
+            headers=[(k.encode("latin-1"), v.encode("latin-1")) for k, v in data["headers"]],
+            body=base64.b64decode(data["body"]),
+            etag=data["etag"],
+            fresh_until=data["fresh_until"],
+            stale_until=data["stale_until"],
+            tags=frozenset(data["tags"]),
+        )
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+# ── Backends ────────────────────────────────────────────────
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache. Each worker process has its own copy."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry.stale_until:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, tags: frozenset[str]) -> int:
+        keys = [k for k, e in self._entries.items() if e.tags & tags]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Redis-backed cache shared by all workers and instances."""
+
+    def __init__(self, url: str, prefix: str = "kolamba:cache:"):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        raw = await self._redis.get(self.prefix + key)
+        return CacheEntry.from_json(raw) if raw else None
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        ttl = max(int(entry.stale_until - time.time()), 1)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self.prefix + key, entry.to_json(), ex=ttl)
+            for tag in entry.tags:
+                pipe.sadd(f"{self.prefix}tag:{tag}", key)
+                # Outlives any entry; stale members are harmless on invalidation
+                pipe.expire(f"{self.prefix}tag:{tag}", 86400)
+            await pipe.execute()
+
+    async def invalidate(self, tags: frozenset[str]) -> int:
+        keys = set()
+        for tag in tags:
+            keys |= await self._redis.smembers(f"{self.prefix}tag:{tag}")
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for key in keys:
+                pipe.delete(self.prefix + key.decode())
+            for tag in tags:
+                pipe.delete(f"{self.prefix}tag:{tag}")
+            await pipe.execute()
+        return len(keys)
+
+    async def clear(self) -> None:
+        async for key in self._redis.scan_iter(match=self.prefix + "*"):
+            await self._redis.delete(key)
+
+
+# ── Cache ───────────────────────────────────────────────────
+
+
+class ResponseCache:
+    """Cache front-end: storage backend plus invalidation bookkeeping."""
+
+    def __init__(self, backend=None, enabled: bool = True):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.enabled = enabled
+        # Bumped on every invalidation so that a refresh which started before
+        # an invalidation does not store its now-outdated response.
+        self.generation = 0
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning("Response cache read failed: %s", e)
+            return None
+
+    async def set(self, key: str, entry: CacheEntry, generation: int) -> None:
+        if generation != self.generation:
+            return
+        try:
+            await self.backend.set(key, entry)
+        except Exception as e:
+            logger.warning("Response cache write failed: %s", e)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Drop every cached response carrying any of the given tags."""
+        if not self.enabled:
+            return
+        self.generation += 1
+        try:
+            count = await self.backend.invalidate(frozenset(tags))
+            logger.debug("Response cache invalidated %d entries for %s", count, ", ".join(tags))
+        except Exception as e:
+            logger.warning("Response cache invalidation failed for %s: %s", ", ".join(tags), e)
+
+    async def clear(self) -> None:
+        self.generation += 1
+        await self.backend.clear()
+
+
+def _build_response_cache() -> ResponseCache:
+    backend_name = settings.response_cache_backend
+    if backend_name == "off":
+        return ResponseCache(enabled=False)
+    if backend_name == "redis":
+        if not settings.redis_url:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires REDIS_URL")
+        return ResponseCache(RedisCacheBackend(settings.redis_url))
+    return ResponseCache(MemoryCacheBackend(settings.response_cache_max_entries))
+
+
+response_cache = _build_response_cache()
+
+
+# ── ASGI middleware ─────────────────────────────────────────
+
+
+async def _empty_receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+class ResponseCacheMiddleware:
+    """Pure ASGI middleware serving CACHE_RULES paths from the response cache."""
+
+    def __init__(self, app, cache: Optional[ResponseCache] = None, rules: Optional[dict[str, CacheRule]] = None):
+        self.app = app
+        self.cache = cache if cache is not None else response_cache
+        self.rules = rules if rules is not None else CACHE_RULES
+        # key -> future resolving to the freshly cached entry (None if uncacheable)
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._background: set[asyncio.Task] = set()
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or not self.cache.enabled
+            or scope["path"] not in self.rules
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        rule = self.rules[scope["path"]]
+        key = self._key(scope)
+        head = scope["method"] == "HEAD"
+        if_none_match = self._header(scope, b"if-none-match")
+
+        entry = await self.cache.get(key)
+        now = time.time()
+        if entry is not None and now < entry.fresh_until:
+            await self._send_entry(entry, "HIT", head, if_none_match, send)
+            return
+        if entry is not None and now < entry.stale_until:
+            self._refresh_in_background(key, scope, rule)
+            await self._send_entry(entry, "STALE", head, if_none_match, send)
+            return
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            # Another request is already rendering this response
+            entry = await asyncio.shield(pending)
+            if entry is None:
+                await self.app(scope, receive, send)
+            else:
+                await self._send_entry(entry, "HIT", head, if_none_match, send)
+            return
+
+        entry, cacheable = await self._fill(key, scope, rule)
+        if cacheable:
+            await self._send_entry(entry, "MISS", head, if_none_match, send)
+        else:
+            await self._send_raw(entry, head, send)
+
+    @staticmethod
+    def _key(scope) -> str:
+        query = scope.get("query_string", b"").decode("latin-1")
+        params = "&".join(sorted(query.split("&"))) if query else ""
+        return f"{scope['path']}?{params}"
+
+    @staticmethod
+    def _header(scope, name: bytes) -> Optional[str]:
+        for k, v in scope.get("headers", []):
+            if k == name:
+                return v.decode("latin-1")
+        return None
+
+    async def _fill(self, key: str, scope, rule: CacheRule) -> tuple[CacheEntry, bool]:
+        """Render the response once, publishing it to concurrent requests."""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            entry, cacheable = await self._render(key, scope, rule)
+            future.set_result(entry if cacheable else None)
+            return entry, cacheable
+        except BaseException:
+            # Waiters fall back to rendering the request themselves
+            future.set_result(None)
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _render(self, key: str, scope, rule: CacheRule) -> tuple[CacheEntry, bool]:
+        generation = self.cache.generation
+        start: dict = {}
+        chunks: list[bytes] = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        # Conditional headers are answered by us, not the endpoint
+        replay_scope = {**scope, "method": "GET", "headers": [
+            (k, v) for k, v in scope.get("headers", [])
+            if k not in (b"if-none-match", b"if-modified-since")
+        ]}
+        await self.app(replay_scope, _empty_receive, capture)
+
+        status = start.get("status", 500)
+        headers = [(k, v) for k, v in start.get("headers", []) if k.lower() != b"etag"]
+        body = b"".join(chunks)
+        now = time.time()
+        entry = CacheEntry(
+            status=status,
+            headers=headers,
+            body=body,
+            etag=make_etag(body),
+            fresh_until=now + rule.ttl,
+            stale_until=now + rule.ttl + rule.stale_ttl,
+            tags=rule.tags,
+        )
+        cacheable = status == 200 and not any(k.lower() == b"set-cookie" for k, _ in headers)
+        if cacheable:
+            await self.cache.set(key, entry, generation)
+        return entry, cacheable
+
+    def _refresh_in_background(self, key: str, scope, rule: CacheRule) -> None:
+        if key in self._inflight:
+            return
+
+        async def refresh():
+            try:
+                await self._fill(key, scope, rule)
+            except Exception as e:
+                logger.warning("Background refresh of %s failed: %s", key, e)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    @staticmethod
+    async def _send_entry(entry: CacheEntry, state: str, head: bool, if_none_match: Optional[str], send) -> None:
+        extra = [(b"etag", entry.etag.encode()), (b"x-cache", state.encode())]
+        if etag_matches(if_none_match, entry.etag):
+            passthrough = {b"cache-control", b"vary"}
+            headers = [(k, v) for k, v in entry.headers if k.lower() in passthrough] + extra
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({"type": "http.response.start", "status": entry.status, "headers": entry.headers + extra})
+        await send({"type": "http.response.body", "body": b"" if head else entry.body})
+
+    @staticmethod
+    async def _send_raw(entry: CacheEntry, head: bool, send) -> None:
+        """Send an uncacheable response exactly as the endpoint produced it."""
+        await send({"type": "http.response.start", "status": entry.status, "headers": entry.headers})
+        await send({"type": "http.response.body", "body": b"" if head else entry.body})
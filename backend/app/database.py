@@ -1,16 +1,105 @@
 """Database connection and session management."""
 
+import asyncio
+import logging
+import time
+from typing import Optional
+from uuid import uuid4
+
+from sqlalchemy import exc, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger("kolamba.database")
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool that records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.checkout_count += 1
+            self.wait_total += elapsed
+            if elapsed > self.wait_max:
+                self.wait_max = elapsed
+
+
+def engine_options(database_url: str) -> dict:
+    """Build create_async_engine() keyword arguments from settings."""
+    options = {"echo": settings.db_echo, "future": True}
+    if "postgresql" not in database_url:
+        return options
+
+    options.update(
+        poolclass=TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+
+    if settings.db_pgbouncer_mode:
+        # PgBouncer in transaction mode hands each transaction a different
+        # server connection, so named prepared statements must not be reused.
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    else:
+        options["connect_args"] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        }
+    return options
+
+
+def pool_stats(target=None) -> dict:
+    """Snapshot of connection pool usage for the health and metrics endpoints."""
+    pool = (target or engine).pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {"pool": type(pool).__name__}
+
+    stats = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+    }
+    if isinstance(pool, TimedQueuePool):
+        stats.update(
+            checkouts=pool.checkout_count,
+            wait_avg_ms=round(pool.wait_total / pool.checkout_count * 1000, 2) if pool.checkout_count else 0.0,
+            wait_max_ms=round(pool.wait_max * 1000, 2),
+            timeouts=pool.timeouts,
+        )
+    return stats
+
 
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.debug,
-    future=True,
+    **engine_options(settings.database_url),
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -20,6 +109,94 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Optional read replica. Without DATABASE_READ_URL every read goes to the primary.
+read_engine = (
+    create_async_engine(
+        settings.database_read_url,
+        **engine_options(settings.database_read_url),
+    )
+    if settings.database_read_url
+    else None
+)
+
+ReadSessionLocal = (
+    async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    if read_engine is not None
+    else None
+)
+
+# Opt-in slow-query log (SLOW_QUERY_THRESHOLD_MS)
+if settings.slow_query_threshold_ms > 0:
+    from app.slow_queries import slow_query_log
+
+    slow_query_log.attach(engine)
+    if read_engine is not None:
+        slow_query_log.attach(read_engine)
+
+# Lag is zero when the replica has replayed everything it received; otherwise
+# it is the age of the last replayed transaction.
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+class ReplicaMonitor:
+    """Tracks replica lag, re-checking at most once per interval."""
+
+    def __init__(self, target, max_lag: float, interval: float):
+        self.engine = target
+        self.max_lag = max_lag
+        self.interval = interval
+        self.lag: Optional[float] = None
+        self.healthy = False
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def _check(self) -> None:
+        try:
+            async with self.engine.connect() as conn:
+                self.lag = float((await conn.execute(_REPLICA_LAG_SQL)).scalar() or 0)
+            healthy = self.lag <= self.max_lag
+            if not healthy and self.healthy:
+                logger.warning("Read replica lagging %.1fs, routing reads to primary", self.lag)
+        except Exception as e:
+            self.lag = None
+            healthy = False
+            if self.healthy:
+                logger.warning("Read replica unreachable, routing reads to primary: %s", e)
+        self.healthy = healthy
+        self._checked_at = time.monotonic()
+
+    async def is_usable(self) -> bool:
+        if time.monotonic() - self._checked_at >= self.interval:
+            async with self._lock:
+                if time.monotonic() - self._checked_at >= self.interval:
+                    await self._check()
+        return self.healthy
+
+    def status(self) -> dict:
+        return {"healthy": self.healthy, "lag_seconds": self.lag}
+
+
+replica_monitor = (
+    ReplicaMonitor(
+        read_engine,
+        max_lag=settings.replica_max_lag_seconds,
+        interval=settings.replica_check_interval_seconds,
+    )
+    if read_engine is not None
+    else None
+)
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
     pass
@@ -32,3 +209,29 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+async def get_read_session_factory():
+    """Dependency returning the session factory for read-only work.
+
+    The read replica's when one is configured and within the allowed lag,
+    otherwise the primary's. Streaming responses use this to open their
+    own session, since request-scoped sessions close before the body is sent.
+    """
+    if replica_monitor is not None and await replica_monitor.is_usable():
+        return ReadSessionLocal
+    return AsyncSessionLocal
+
+
+async def get_read_db():
+    """Dependency for read-only endpoints.
+
+    Uses the read replica when one is configured and within the allowed lag,
+    otherwise the primary. Never write through this session.
+    """
+    session_factory = await get_read_session_factory()
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -0,0 +1,28 @@
+"""Periodic background jobs registered with the scheduler."""
+
+from app.config import get_settings
+from app.scheduler import scheduler
+from app.services.metrics_rollup import rollup_daily_metrics
+from app.services.notifications import purge_read_notifications, reconcile_unread_counters
+
+settings = get_settings()
+
+scheduler.add_job(
+    "reconcile_unread_counters",
+    reconcile_unread_counters,
+    interval=settings.unread_reconcile_interval_seconds,
+)
+
+scheduler.add_job(
+    "purge_read_notifications",
+    purge_read_notifications,
+    interval=settings.notification_cleanup_interval_seconds,
+)
+
+scheduler.add_job(
+    "rollup_daily_metrics",
+    rollup_daily_metrics,
+    interval=settings.metrics_rollup_interval_seconds,
+    # Soon after startup, so a fresh deploy backfills analytics
+    initial_delay=60,
+)
@@ -1,17 +1,25 @@
 """Kolamba Backend - FastAPI Application Entry Point."""
 
 import logging
-import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, EmailStr
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from app import access_log
+from app.cache import ResponseCacheMiddleware
 from app.config import get_settings
-from app.routers import auth, artists, communities, categories, bookings, search, tours, admin, artist_tour_dates, agents, uploads, conversations, notifications
+from app.database import engine, read_engine
+from app.metrics import collect_metrics, exporter as metrics_exporter
+from app.middleware import RequestMiddleware
+from app.query_stats import QueryInspectorMiddleware, instrument_engine
+from app.slow_queries import SlowQueryMiddleware, slow_query_log
+from app.serialization import ORJSONResponse
+from app.routers import auth, artists, communities, categories, bookings, search, tours, admin, artist_tour_dates, agents, uploads, conversations, notifications, events
 
 settings = get_settings()
 
@@ -24,6 +32,7 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 logger = logging.getLogger("kolamba")
+access_log.configure()
 
 
 @asynccontextmanager
@@ -36,8 +45,40 @@ async def lifespan(app: FastAPI):
         logger.warning("Resend API key not set — emails will be unavailable")
     if not settings.google_client_id:
         logger.warning("Google OAuth not configured — Google sign-in will be unavailable")
+
+    # Deliver real-time events to clients connected to any worker
+    fanout = None
+    if settings.realtime_pg_fanout and "postgresql" in settings.database_url:
+        from app.services.realtime import PostgresFanout, realtime_broker
+
+        _, connect_kwargs = engine.dialect.create_connect_args(engine.url)
+        fanout = PostgresFanout(realtime_broker, connect_kwargs)
+        await fanout.start()
+
+    scheduler = None
+    if settings.scheduler_enabled and "postgresql" in settings.database_url:
+        from app import jobs  # noqa: F401  (registers jobs)
+        from app.scheduler import scheduler
+
+        scheduler.start()
+
+    if settings.metrics_enabled and metrics_exporter is not None:
+        metrics_exporter.start()
+
+    # Ready only once connections are open and hot caches are filled
+    if settings.warmup_enabled and "postgresql" in settings.database_url:
+        from app.warmup import warm_up
+
+        await warm_up(app)
+
     yield
     logger.info("Shutting down Kolamba API...")
+    if settings.metrics_enabled and metrics_exporter is not None:
+        await metrics_exporter.stop()
+    if scheduler is not None:
+        await scheduler.stop()
+    if fanout is not None:
+        await fanout.stop()
 
 
 _is_dev = settings.env == "development"
@@ -46,6 +87,7 @@ app = FastAPI(
     description="Marketplace platform connecting Israeli/Jewish artists with Jewish communities worldwide",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs" if _is_dev else None,
     redoc_url="/api/redoc" if _is_dev else None,
     openapi_url="/api/openapi.json" if _is_dev else None,
@@ -55,6 +97,10 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Server-side response cache for public read endpoints (innermost, so
+# cached responses still get CORS headers, cache policy and request logging)
+app.add_middleware(ResponseCacheMiddleware)
+
 # CORS middleware - allow Vercel preview URLs via regex
 app.add_middleware(
     CORSMiddleware,
@@ -65,28 +111,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start = time.perf_counter()
-    response = await call_next(request)
-    duration_ms = (time.perf_counter() - start) * 1000
-    logger.info(
-        "%s %s %d %.0fms",
-        request.method,
-        request.url.path,
-        response.status_code,
-        duration_ms,
-    )
-    # Add cache headers for public read endpoints
-    path = request.url.path
-    if request.method == "GET" and response.status_code == 200:
-        if any(path.startswith(p) for p in ["/api/categories", "/api/health"]):
-            response.headers["Cache-Control"] = "public, max-age=300, stale-while-revalidate=600"
-        elif any(path.startswith(p) for p in ["/api/talents", "/api/hosts", "/api/search"]):
-            response.headers["Cache-Control"] = "public, max-age=60, stale-while-revalidate=300"
-
-    return response
+# Per-request query counts for the access log, metrics and the debug inspector
+instrument_engine(engine)
+if read_engine is not None:
+    instrument_engine(read_engine)
+
+# Lets the slow-query log attribute statements to routes
+if slow_query_log.enabled:
+    app.add_middleware(SlowQueryMiddleware)
+
+# Debug: per-request query count headers and N+1 warnings
+if settings.debug:
+    app.add_middleware(QueryInspectorMiddleware)
+
+# Request ids, access log, Cache-Control policy and per-route metrics (outermost, so it times everything)
+app.add_middleware(RequestMiddleware, routes=app.routes)
 
 
 # Include routers
@@ -103,20 +142,43 @@ app.include_router(agents.router, prefix="/api/agents", tags=["Agents"])
 app.include_router(uploads.router, prefix="/api/uploads", tags=["Uploads"])
 app.include_router(conversations.router, prefix="/api/conversations", tags=["Conversations"])
 app.include_router(notifications.router, prefix="/api/notifications", tags=["Notifications"])
+app.include_router(events.router, prefix="/api/events", tags=["Events"])
 
 
 @app.get("/api/health", tags=["Health"])
 async def health_check():
     """Health check endpoint for monitoring."""
     from app.services.email import is_configured as email_configured
+    from app.database import pool_stats, read_engine, replica_monitor
     return {
         "status": "healthy",
         "service": "kolamba-api",
         "email_configured": email_configured(),
         "frontend_url": settings.frontend_url,
+        "db_pool": pool_stats(),
+        "db_replica": (
+            {**replica_monitor.status(), "pool": pool_stats(read_engine)}
+            if replica_monitor is not None
+            else None
+        ),
     }
 
 
+@app.get("/api/metrics", tags=["Health"], include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus text-format metrics.
+
+    Outside development the endpoint is only served when METRICS_TOKEN is set.
+    """
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not settings.metrics_token and settings.env != "development":
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.metrics_token:
+        if request.headers.get("authorization") != f"Bearer {settings.metrics_token}":
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(collect_metrics(), media_type="text/plain; version=0.0.4")
+
 
 class ContactRequest(BaseModel):
     full_name: str
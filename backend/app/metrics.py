@@ -0,0 +1,365 @@
+"""In-process Prometheus-style metrics and the /api/metrics exposition.
+
+Metrics are plain dicts updated in the request path (no locks: the event
+loop is single-threaded), rendered in the Prometheus text format on scrape.
+
+With several workers, set METRICS_MULTIPROC_DIR to a directory shared by
+them. Each worker writes a JSON snapshot there periodically and on scrape;
+whichever worker serves /api/metrics merges every recent snapshot, so the
+totals cover all workers.
+
+Instrumented:
+- HTTP requests per templated route: counts by status, latency histogram
+- DB queries per route: count and time (cursor events, see app.query_stats)
+- Connection pool usage
+- Outbound calls (geocoding, email, uploads): latency histogram by outcome
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from starlette.routing import Match
+
+from app.config import get_settings
+from app.query_stats import QueryStats, unattributed
+
+settings = get_settings()
+logger = logging.getLogger("kolamba.metrics")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+# ── Metric types ────────────────────────────────────────────
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...]):
+        self.name, self.help, self.labels = name, help, labels
+        self.values: dict[tuple, float] = defaultdict(float)
+
+    def inc(self, *labelvalues, amount: float = 1.0) -> None:
+        self.values[labelvalues] += amount
+
+    def snapshot(self) -> dict:
+        return {"values": [[list(k), v] for k, v in self.values.items()]}
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        # Per label set: [count per bucket..., count above the last bucket], sum
+        self.counts: dict[tuple, list[int]] = {}
+        self.sums: dict[tuple, float] = defaultdict(float)
+
+    def observe(self, value: float, *labelvalues) -> None:
+        counts = self.counts.get(labelvalues)
+        if counts is None:
+            counts = self.counts[labelvalues] = [0] * (len(self.buckets) + 1)
+        counts[bisect_left(self.buckets, value)] += 1
+        self.sums[labelvalues] += value
+
+    def snapshot(self) -> dict:
+        return {
+            "buckets": list(self.buckets),
+            "values": [[list(k), counts, self.sums[k]] for k, counts in self.counts.items()],
+        }
+
+
+class CallbackMetric:
+    """Gauge or counter whose values are read from a function at collection time."""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], func: Callable[[], dict], type: str = "gauge"):
+        self.name, self.help, self.labels, self.func, self.type = name, help, labels, func, type
+
+    def snapshot(self) -> dict:
+        try:
+            values = self.func()
+        except Exception as e:
+            logger.debug("Metric %s collection failed: %s", self.name, e)
+            values = {}
+        return {"values": [[list(k), v] for k, v in values.items()]}
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: dict[str, object] = {}
+        self.collectors: list[Callable[[], None]] = []  # Run before each snapshot
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...]) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: tuple[str, ...], **kwargs) -> Histogram:
+        return self.register(Histogram(name, help, labels, **kwargs))
+
+    def callback(self, name: str, help: str, labels: tuple[str, ...], func: Callable[[], dict], type: str = "gauge"):
+        return self.register(CallbackMetric(name, help, labels, func, type))
+
+    def snapshot(self) -> dict:
+        for collect in self.collectors:
+            collect()
+        return {
+            name: {"type": m.type, "help": m.help, "labels": list(m.labels), **m.snapshot()}
+            for name, m in self.metrics.items()
+        }
+
+
+# ── Merging and rendering ───────────────────────────────────
+
+
+def merge_snapshots(snapshots: list[dict]) -> dict:
+    """Sum several workers' snapshots label set by label set."""
+    merged: dict[str, dict] = {}
+    for snap in snapshots:
+        for name, metric in snap.items():
+            target = merged.setdefault(name, {**metric, "values": {}})
+            for entry in metric["values"]:
+                key = tuple(entry[0])
+                if metric["type"] == "histogram":
+                    counts, total = target["values"].get(key, ([0] * len(entry[1]), 0.0))
+                    target["values"][key] = ([a + b for a, b in zip(counts, entry[1])], total + entry[2])
+                else:
+                    target["values"][key] = target["values"].get(key, 0) + entry[1]
+    return merged
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def render(merged: dict) -> str:
+    """Prometheus text exposition format (0.0.4)."""
+    lines = []
+    for name, metric in sorted(merged.items()):
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        labels = metric["labels"]
+        for key, value in sorted(metric["values"].items()):
+            if metric["type"] == "histogram":
+                counts, total = value
+                cumulative = 0
+                for bound, count in zip([*metric["buckets"], float("inf")], counts):
+                    cumulative += count
+                    le = 'le="' + _number(bound) + '"'
+                    lines.append(f"{name}_bucket{_labels(labels, key, le)} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels, key)} {_number(total)}")
+                lines.append(f"{name}_count{_labels(labels, key)} {cumulative}")
+            else:
+                lines.append(f"{name}{_labels(labels, key)} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# ── Application metrics ─────────────────────────────────────
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "kolamba_http_requests_total", "HTTP requests by templated route and status.", ("method", "route", "status"),
+)
+http_latency = registry.histogram(
+    "kolamba_http_request_duration_seconds", "HTTP request latency by templated route.", ("method", "route"),
+)
+db_queries = registry.counter(
+    "kolamba_db_queries_total", "SQL statements executed, by the route that issued them.", ("route",),
+)
+db_query_time = registry.counter(
+    "kolamba_db_query_seconds_total", "Time spent executing SQL, by the route that issued it.", ("route",),
+)
+outbound_latency = registry.histogram(
+    "kolamba_outbound_request_duration_seconds", "Latency of calls to external services.", ("service", "outcome"),
+)
+
+
+def _pool_metric(attr: Callable) -> Callable[[], dict]:
+    def collect() -> dict:
+        from app.database import engine, read_engine
+
+        values = {}
+        for label, target in (("primary", engine), ("replica", read_engine)):
+            if target is None:
+                continue
+            value = attr(target.pool)
+            if value is not None:
+                values[(label,)] = value
+        return values
+    return collect
+
+
+def _queue_pool_attr(name: str) -> Callable:
+    return lambda pool: getattr(pool, name)() if hasattr(pool, name) else None
+
+
+registry.callback("kolamba_db_pool_size", "Configured pool size.", ("pool",), _pool_metric(_queue_pool_attr("size")))
+registry.callback(
+    "kolamba_db_pool_checked_out", "Connections in use.", ("pool",), _pool_metric(_queue_pool_attr("checkedout")),
+)
+registry.callback(
+    "kolamba_db_pool_overflow", "Connections open beyond pool_size.", ("pool",),
+    _pool_metric(lambda pool: max(pool.overflow(), 0) if hasattr(pool, "overflow") else None),
+)
+registry.callback(
+    "kolamba_db_pool_checkouts_total", "Connection checkouts.", ("pool",),
+    _pool_metric(lambda pool: getattr(pool, "checkout_count", None)), type="counter",
+)
+registry.callback(
+    "kolamba_db_pool_wait_seconds_total", "Time spent waiting for a pooled connection.", ("pool",),
+    _pool_metric(lambda pool: getattr(pool, "wait_total", None)), type="counter",
+)
+registry.callback(
+    "kolamba_db_pool_timeouts_total", "Checkouts that timed out waiting for a connection.", ("pool",),
+    _pool_metric(lambda pool: getattr(pool, "timeouts", None)), type="counter",
+)
+
+
+def _collect_background_queries() -> None:
+    db_queries.values[("background",)] = unattributed.queries
+    db_query_time.values[("background",)] = unattributed.seconds
+
+
+registry.collectors.append(_collect_background_queries)
+
+
+@contextmanager
+def observe_outbound(service: str):
+    """Time a call to an external service; usable around sync or async code."""
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        outbound_latency.observe(time.perf_counter() - start, service, outcome)
+
+
+# ── Middleware ──────────────────────────────────────────────
+
+
+def route_template(scope) -> str:
+    """The matched route's path template, e.g. /api/talents/{artist_id}.
+
+    Requests answered before routing (response cache hits) are matched
+    against the app's routes here. Unknown paths share one label so
+    arbitrary URLs can't blow up the metric's cardinality.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return getattr(route, "path", "unmatched")
+    app = scope.get("app")
+    for candidate in getattr(getattr(app, "router", None), "routes", ()):
+        match, _ = candidate.matches(scope)
+        if match == Match.FULL:
+            return getattr(candidate, "path", "unmatched")
+    return "unmatched"
+
+
+def record_request(method: str, route: str, status_code: int, seconds: float, db_stats: QueryStats) -> None:
+    """Record one finished request. Called by app.middleware.RequestMiddleware."""
+    http_requests.inc(method, route, str(status_code))
+    http_latency.observe(seconds, method, route)
+    if db_stats.queries:
+        db_queries.inc(route, amount=db_stats.queries)
+        db_query_time.inc(route, amount=db_stats.seconds)
+
+
+# ── Multi-worker aggregation ────────────────────────────────
+
+
+class SnapshotExporter:
+    """Shares this worker's metrics through files in a common directory."""
+
+    def __init__(self, directory: str, interval: float, stale_after: float):
+        self.directory = directory
+        self.interval = interval
+        self.stale_after = stale_after
+        self.path = os.path.join(directory, f"worker-{os.getpid()}.json")
+        self._task: Optional[asyncio.Task] = None
+
+    def write(self) -> None:
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(registry.snapshot(), f)
+        os.replace(tmp, self.path)
+
+    def collect(self) -> dict:
+        self.write()
+        snapshots = []
+        now = time.time()
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                if now - entry.stat().st_mtime > self.stale_after:
+                    continue  # Worker gone; its counters drop out like a restart
+                with open(entry.path) as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.debug("Skipping metrics snapshot %s: %s", entry.name, e)
+        return merge_snapshots(snapshots)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.write()
+            except OSError as e:
+                logger.warning("Could not write metrics snapshot: %s", e)
+
+    def start(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self.write()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+exporter = (
+    SnapshotExporter(
+        settings.metrics_multiproc_dir,
+        interval=settings.metrics_flush_interval_seconds,
+        stale_after=settings.metrics_flush_interval_seconds * 4,
+    )
+    if settings.metrics_multiproc_dir
+    else None
+)
+
+
+def collect_metrics() -> str:
+    """Render metrics for this worker, or for all workers when sharing snapshots."""
+    if exporter is not None:
+        return render(exporter.collect())
+    return render(merge_snapshots([registry.snapshot()]))
@@ -0,0 +1,115 @@
+"""Request middleware: request ids, access log, timing, Cache-Control policy and metrics.
+
+A single pure ASGI middleware. An ``@app.middleware("http")`` function
+would run every request through Starlette's BaseHTTPMiddleware, which
+adds a task and a memory stream per request and buffers streaming
+responses such as /api/events/stream and the admin exports.
+
+Cache-Control is looked up per matched route in a table compiled from the
+app's routes when the middleware stack is built, instead of testing path
+prefixes on every response.
+
+Each request gets an id: the caller's X-Request-ID when it looks sane,
+otherwise a new one. It is echoed in the response, kept in
+``request.state.request_id`` and written to the access log.
+"""
+
+import re
+import time
+import uuid
+from typing import Iterable, Optional
+
+from app import access_log
+from app.config import get_settings
+from app.metrics import record_request, route_template
+from app.query_stats import track_queries
+
+settings = get_settings()
+
+_REQUEST_ID = re.compile(r"[A-Za-z0-9._:-]{1,64}")
+
+# Path prefix -> Cache-Control for successful GETs; the first matching prefix wins
+CACHE_CONTROL_POLICIES: tuple[tuple[str, str], ...] = (
+    ("/api/categories", "public, max-age=300, stale-while-revalidate=600"),
+    ("/api/health", "public, max-age=300, stale-while-revalidate=600"),
+    ("/api/talents", "public, max-age=60, stale-while-revalidate=300"),
+    ("/api/hosts", "public, max-age=60, stale-while-revalidate=300"),
+    ("/api/search", "public, max-age=60, stale-while-revalidate=300"),
+)
+
+
+def cache_control_for(path: str) -> Optional[bytes]:
+    for prefix, policy in CACHE_CONTROL_POLICIES:
+        if path.startswith(prefix):
+            return policy.encode("latin-1")
+    return None
+
+
+def request_id_for(scope) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == b"x-request-id":
+            candidate = value.decode("latin-1")
+            if _REQUEST_ID.fullmatch(candidate):
+                return candidate
+            break
+    return uuid.uuid4().hex
+
+
+def compile_cache_policies(routes: Iterable) -> dict[str, bytes]:
+    """Route path template -> Cache-Control value, for the routes that have one."""
+    table = {}
+    for route in routes:
+        path = getattr(route, "path", None)
+        if path and (policy := cache_control_for(path)) is not None:
+            table[path] = policy
+    return table
+
+
+class RequestMiddleware:
+    """Pure ASGI middleware identifying, logging, timing and measuring every HTTP request.
+
+    ``routes`` is the app's route list; it is read when the middleware stack
+    is built, after every router has been included.
+    """
+
+    def __init__(self, app, routes: Iterable, metrics: bool = settings.metrics_enabled):
+        self.app = app
+        self.cache_policies = compile_cache_policies(routes)
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        is_get = scope["method"] == "GET"
+        request_id = request_id_for(scope)
+        # Shared with request.state: the auth dependency records the user id here
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [*message.get("headers", ()), (b"x-request-id", request_id.encode("latin-1"))]
+                if is_get and status_code == 200:
+                    # Cached responses are served before routing; their paths are route templates
+                    route = scope.get("route")
+                    policy = self.cache_policies.get(route.path if route is not None else scope["path"])
+                    if policy is not None:
+                        headers = [(k, v) for k, v in headers if k.lower() != b"cache-control"]
+                        headers.append((b"cache-control", policy))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            with track_queries() as db_stats:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            seconds = time.perf_counter() - start
+            route = route_template(scope)
+            access_log.log_request(scope, route, status_code, seconds, request_id, db_stats)
+            if self.metrics:
+                record_request(scope["method"], route, status_code, seconds, db_stats)
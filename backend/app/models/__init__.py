@@ -9,7 +9,9 @@ from app.models.booking import Booking
 from app.models.tour import Tour, TourStop
 from app.models.artist_tour_date import ArtistTourDate
 from app.models.conversation import Conversation, Message
-from app.models.notification import Notification
+from app.models.notification import Notification, NotificationArchive, NotificationCounter
+from app.models.daily_metric import DailyMetric
+from app.models.scheduled_job import ScheduledJob
 
 __all__ = [
     "Base",
@@ -25,4 +27,8 @@ __all__ = [
     "Conversation",
     "Message",
     "Notification",
+    "NotificationCounter",
+    "NotificationArchive",
+    "DailyMetric",
+    "ScheduledJob",
 ]
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
-from sqlalchemy import String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import String, Integer, DateTime, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -28,10 +28,22 @@ class Conversation(Base):
     # Structured venue info filled by community manager
     venue_info: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
+    # Inbox summary, kept in sync by routers.conversations.record_message()
+    last_message_preview: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_message_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_sender_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    message_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        index=True,
     )
 
     # Relationships
@@ -45,12 +57,15 @@ class Message(Base):
     """Message model - individual messages in a conversation."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # Cursor pagination of a conversation's history
+        Index("ix_messages_conversation_created_id", "conversation_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     conversation_id: Mapped[int] = mapped_column(
         ForeignKey("conversations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     sender_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
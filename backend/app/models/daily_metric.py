@@ -0,0 +1,40 @@
+"""DailyMetric model - per-day activity rollup for admin analytics."""
+
+from datetime import date, datetime, timezone
+from sqlalchemy import Date, DateTime, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class DailyMetric(Base):
+    """New users, profiles, bookings and tour dates created on one (UTC) day.
+
+    Filled by the ``rollup_daily_metrics`` job. Recent days are recomputed
+    on every run, so ``bookings_by_status`` reflects booking status as of
+    the last recompute of that day.
+    """
+
+    __tablename__ = "daily_metrics"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    # Signups (users by role)
+    users_new: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    artist_signups: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    community_signups: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    agent_signups: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
+    # Profiles
+    artists_new: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    communities_new: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
+    # Bookings and tour dates
+    bookings_new: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    bookings_by_status: Mapped[dict] = mapped_column(JSONB, default=dict, server_default="{}", nullable=False)
+    tour_dates_new: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
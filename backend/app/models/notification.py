@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
-from sqlalchemy import String, Integer, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import String, Integer, Boolean, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -15,23 +15,26 @@ class Notification(Base):
     """In-app notification for users."""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Serves the per-user list (optionally unread only), newest first
+        Index("ix_notifications_user_read_created", "user_id", "is_read", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Notification content
     type: Mapped[str] = mapped_column(String(50), nullable=False)
-    # Types: booking_new, booking_accepted, booking_declined, message_new, tour_opportunity
+    # Types: booking_new, booking_accepted, booking_declined, message_new, tour_opportunity, announcement
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
     link: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Status
-    is_read: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    is_read: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -40,3 +43,49 @@ class Notification(Base):
 
     # Relationships
     user: Mapped["User"] = relationship("User")
+
+
+class NotificationCounter(Base):
+    """Per-user unread notification count.
+
+    Maintained alongside every notification insert/read/delete so the bell
+    reads one row instead of counting. A periodic job corrects any drift.
+    """
+
+    __tablename__ = "notification_counters"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    unread_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+class NotificationArchive(Base):
+    """Read notifications moved out of ``notifications`` by the retention job.
+
+    Only written when NOTIFICATION_RETENTION_MODE=archive; keeps the history
+    without weighing on the live table's indexes.
+    """
+
+    __tablename__ = "notifications_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    type: Mapped[str] = mapped_column(String(50), nullable=False)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    link: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
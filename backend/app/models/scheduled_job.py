@@ -0,0 +1,20 @@
+"""ScheduledJob model - when each periodic job last ran, across all workers."""
+
+from datetime import datetime
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ScheduledJob(Base):
+    """Last start time of a scheduler job.
+
+    Written by ``JobScheduler.run_job`` while it holds the job's advisory
+    lock, so every worker sees when the job is next due.
+    """
+
+    __tablename__ = "scheduled_jobs"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    last_run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
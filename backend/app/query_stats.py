@@ -0,0 +1,134 @@
+"""Per-request SQL statement counts and N+1 detection.
+
+Cursor events on each instrumented engine record every statement into the
+``QueryStats`` recorders active in the current context (``track_queries``).
+Recorders nest: the metrics middleware, the debug query inspector and a
+test's query budget can all watch the same request.
+
+In debug mode ``QueryInspectorMiddleware`` reports each request's count
+and time in response headers and logs statements that ran many times with
+the same shape (only the bound parameters differ), the usual sign of a
+query issued once per row of a previous result.
+"""
+
+import contextvars
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger("kolamba.queries")
+
+# "IN ($1, $2, $3)" and "IN ($1, $2)" are the same statement shape
+_PLACEHOLDER_RUN = re.compile(r"(?:\$\d+|\?|%\(\w+\)s)(?:\s*,\s*(?:\$\d+|\?|%\(\w+\)s))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so executions differing only in parameters match."""
+    return _PLACEHOLDER_RUN.sub("$n, ...", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    seconds: float = 0.0
+    # Statement shape -> executions; only kept when requested (it costs a regex per query)
+    statements: Optional[Counter] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.queries += 1
+        self.seconds += elapsed
+        if self.statements is not None:
+            self.statements[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed at least ``threshold`` times, most frequent first."""
+        if self.statements is None:
+            return []
+        return [(shape, n) for shape, n in self.statements.most_common() if n >= threshold]
+
+
+_active: contextvars.ContextVar[tuple[QueryStats, ...]] = contextvars.ContextVar("active_query_stats", default=())
+
+# Statements run outside any tracked context (background jobs, startup)
+unattributed = QueryStats()
+
+
+@contextmanager
+def track_queries(statements: bool = False):
+    """Record the statements run in this context (and tasks it spawns from here on)."""
+    stats = QueryStats(statements=Counter() if statements else None)
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    active = _active.get()
+    if not active:
+        unattributed.record(statement, elapsed)
+        return
+    for stats in active:
+        stats.record(statement, elapsed)
+
+
+def instrument_engine(target) -> None:
+    """Count and time every statement run through ``target`` (an AsyncEngine)."""
+    sync_engine = target.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryInspectorMiddleware:
+    """Debug-only: per-request query headers and N+1 warnings.
+
+    Adds ``X-DB-Queries``, ``X-DB-Time-Ms`` and ``X-DB-Repeated`` (number of
+    statement shapes run at least ``threshold`` times) to every response.
+    Counts cover the queries run before the response started.
+    """
+
+    def __init__(self, app, threshold: int = settings.query_repeat_threshold):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(statements=True) as stats:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers += [
+                        (b"x-db-queries", str(stats.queries).encode()),
+                        (b"x-db-time-ms", f"{stats.seconds * 1000:.1f}".encode()),
+                        (b"x-db-repeated", str(len(stats.repeated(self.threshold))).encode()),
+                    ]
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        for shape, count in stats.repeated(self.threshold):
+            logger.warning(
+                "Probable N+1 on %s %s: statement ran %d times: %s",
+                scope["method"], scope["path"], count, shape[:300],
+            )
@@ -1,15 +1,18 @@
 """Admin router - endpoints for super user administration."""
 
 import logging
+from datetime import date, datetime, timezone
 from typing import Optional, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from app.database import get_db
+from app.database import get_db, get_read_db, get_read_session_factory
+from app.cache import response_cache
 from app.models.user import User
 from app.models.artist import Artist
 from app.models.community import Community
@@ -22,12 +25,20 @@ from app.schemas.community import CommunityUpdate, CommunityResponse
 from app.utils.security import get_password_hash
 from app.config import get_settings
 from app.services.email import send_artist_status_change
+from app.services.admin_stats import StatsSnapshot
+from app.services.exports import EXPORT_FORMATS, stream_export
+from app.services.metrics_rollup import GRANULARITIES, analytics_series
+from app.services.notifications import notify_query
+from app.serialization import ORJSONResponse
+from app.slow_queries import slow_query_log
 
 settings = get_settings()
 
 router = APIRouter()
 logger = logging.getLogger("kolamba.admin")
 
+stats_snapshot = StatsSnapshot(ttl=settings.admin_stats_ttl_seconds)
+
 
 async def get_superuser(
     user: User = Depends(get_current_active_user),
@@ -78,6 +89,14 @@ class ArtistAdminResponse(BaseModel):
         from_attributes = True
 
 
+class BroadcastRequest(BaseModel):
+    """Schema for an admin notification broadcast."""
+    title: str = Field(..., min_length=1, max_length=255)
+    message: str = Field(..., min_length=1)
+    link: Optional[str] = Field(None, max_length=500)
+    role: Optional[str] = None  # artist, community, agent, admin; all active users if omitted
+
+
 class StatsResponse(BaseModel):
     """Dashboard statistics response."""
     total_users: int
@@ -90,86 +109,49 @@ class StatsResponse(BaseModel):
     pending_bookings: int
     total_tour_dates: int
     upcoming_tour_dates: int
+    # Snapshot freshness
+    generated_at: datetime
+    age_seconds: float
+    cached: bool
 
 
 @router.get("/stats", response_model=StatsResponse)
 async def get_admin_stats(
+    refresh: bool = Query(False, description="Recompute instead of serving the cached snapshot"),
     superuser: User = Depends(get_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get dashboard statistics."""
-    # Total users
-    total_users_result = await db.execute(select(func.count(User.id)))
-    total_users = total_users_result.scalar()
-
-    # Total artists
-    total_artists_result = await db.execute(select(func.count(Artist.id)))
-    total_artists = total_artists_result.scalar()
-
-    # Total communities
-    total_communities_result = await db.execute(select(func.count(Community.id)))
-    total_communities = total_communities_result.scalar()
-
-    # Pending artists
-    pending_artists_result = await db.execute(
-        select(func.count(Artist.id)).where(Artist.status == "pending")
-    )
-    pending_artists = pending_artists_result.scalar()
-
-    # Active artists
-    active_artists_result = await db.execute(
-        select(func.count(Artist.id)).where(Artist.status == "active")
-    )
-    active_artists = active_artists_result.scalar()
-
-    # Active communities
-    active_communities_result = await db.execute(
-        select(func.count(Community.id)).where(Community.status == "active")
-    )
-    active_communities = active_communities_result.scalar()
-
-    # Total bookings
-    total_bookings_result = await db.execute(select(func.count(Booking.id)))
-    total_bookings = total_bookings_result.scalar()
-
-    # Pending bookings
-    pending_bookings_result = await db.execute(
-        select(func.count(Booking.id)).where(Booking.status == "pending")
-    )
-    pending_bookings = pending_bookings_result.scalar()
-
-    # Total tour dates
-    total_tour_dates_result = await db.execute(select(func.count(ArtistTourDate.id)))
-    total_tour_dates = total_tour_dates_result.scalar()
-
-    # Upcoming tour dates
-    from datetime import date
-    upcoming_tour_dates_result = await db.execute(
-        select(func.count(ArtistTourDate.id)).where(ArtistTourDate.start_date >= date.today())
-    )
-    upcoming_tour_dates = upcoming_tour_dates_result.scalar()
-
+    """Get dashboard statistics (cached for ADMIN_STATS_TTL_SECONDS)."""
+    stats, generated_at, cached = await stats_snapshot.get(db, refresh=refresh)
     return StatsResponse(
-        total_users=total_users or 0,
-        total_artists=total_artists or 0,
-        total_communities=total_communities or 0,
-        pending_artists=pending_artists or 0,
-        active_artists=active_artists or 0,
-        active_communities=active_communities or 0,
-        total_bookings=total_bookings or 0,
-        pending_bookings=pending_bookings or 0,
-        total_tour_dates=total_tour_dates or 0,
-        upcoming_tour_dates=upcoming_tour_dates or 0,
+        **stats,
+        generated_at=generated_at,
+        age_seconds=round((datetime.now(timezone.utc) - generated_at).total_seconds(), 1),
+        cached=cached,
     )
 
 
 class AnalyticsPoint(BaseModel):
-    """Single data point for time-series charts."""
-    month: str
+    """Single data point for time-series charts.
+
+    users/artists/communities/bookings/tour_dates are cumulative totals at
+    the end of the period; the new_* and *_signups fields count the period.
+    """
+    month: str  # Period label (kept as "month" for the dashboard chart)
+    period: date
     users: int = 0
     artists: int = 0
     communities: int = 0
     bookings: int = 0
+    tour_dates: int = 0
+    new_users: int = 0
+    new_artists: int = 0
+    new_communities: int = 0
+    new_bookings: int = 0
+    new_tour_dates: int = 0
+    artist_signups: int = 0
+    community_signups: int = 0
+    agent_signups: int = 0
 
 
 class CategoryBreakdown(BaseModel):
@@ -185,52 +167,57 @@ class AnalyticsResponse(BaseModel):
     booking_status: list[CategoryBreakdown]
 
 
-@router.get("/analytics", response_model=AnalyticsResponse)
-async def get_analytics(
-    superuser: User = Depends(get_superuser),
-    db: AsyncSession = Depends(get_db),
-):
-    """Get analytics data for admin dashboard charts."""
-    from datetime import date, timedelta
-    from app.models.category import Category as CategoryModel
-
-    # Monthly growth over last 6 months
-    monthly_growth = []
-    today = date.today()
-    for i in range(5, -1, -1):
-        # Start of month, i months ago
-        month_start = today.replace(day=1) - timedelta(days=i * 30)
-        month_start = month_start.replace(day=1)
-        if month_start.month == 12:
-            month_end = month_start.replace(year=month_start.year + 1, month=1, day=1)
-        else:
-            month_end = month_start.replace(month=month_start.month + 1, day=1)
+_PERIOD_LABELS = {"day": "%Y-%m-%d", "week": "%d %b %Y", "month": "%b %Y"}
 
-        label = month_start.strftime("%b %Y")
 
-        users_count = (await db.execute(
-            select(func.count(User.id)).where(User.created_at < month_end)
-        )).scalar() or 0
+def _months_back(today: date, months: int) -> date:
+    """First day of the month ``months`` before today's month."""
+    index = today.year * 12 + today.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
 
-        artists_count = (await db.execute(
-            select(func.count(Artist.id)).where(Artist.created_at < month_end)
-        )).scalar() or 0
 
-        communities_count = (await db.execute(
-            select(func.count(Community.id)).where(Community.created_at < month_end)
-        )).scalar() or 0
+@router.get("/analytics", response_model=AnalyticsResponse)
+async def get_analytics(
+    start: Optional[date] = Query(None, description="First day (default: start of the month 5 months ago)"),
+    end: Optional[date] = Query(None, description="Last day (default: today)"),
+    granularity: str = Query("month", description="day, week or month"),
+    superuser: User = Depends(get_superuser),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Get analytics data for admin dashboard charts.
 
-        bookings_count = (await db.execute(
-            select(func.count(Booking.id)).where(Booking.created_at < month_end)
-        )).scalar() or 0
+    Growth series come from the daily_metrics rollup.
+    """
+    from app.models.category import Category as CategoryModel
 
-        monthly_growth.append(AnalyticsPoint(
-            month=label,
-            users=users_count,
-            artists=artists_count,
-            communities=communities_count,
-            bookings=bookings_count,
-        ))
+    if granularity not in GRANULARITIES:
+        raise HTTPException(status_code=400, detail="granularity must be day, week or month")
+    end = end or date.today()
+    start = start or _months_back(end, 5)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+
+    series = await analytics_series(db, start, end, granularity)
+    monthly_growth = [
+        AnalyticsPoint(
+            month=row["period"].strftime(_PERIOD_LABELS[granularity]),
+            period=row["period"],
+            users=row["users_total"],
+            artists=row["artists_total"],
+            communities=row["communities_total"],
+            bookings=row["bookings_total"],
+            tour_dates=row["tour_dates_total"],
+            new_users=row["users_new"],
+            new_artists=row["artists_new"],
+            new_communities=row["communities_new"],
+            new_bookings=row["bookings_new"],
+            new_tour_dates=row["tour_dates_new"],
+            artist_signups=row["artist_signups"],
+            community_signups=row["community_signups"],
+            agent_signups=row["agent_signups"],
+        )
+        for row in series
+    ]
 
     # Category breakdown (artists per category)
     from app.models.category import ArtistCategory
@@ -374,7 +361,8 @@ async def list_users(
             user_data["managed_count"] = agent_map.get(u.id, 0)
         response.append(user_data)
 
-    return response
+    # Plain dicts already: render directly rather than through jsonable_encoder
+    return ORJSONResponse(response)
 
 
 @router.get("/users/{user_id}")
@@ -443,6 +431,7 @@ async def update_user(
 
     logger.info("Admin %s updated user id=%d fields=%s", superuser.email, user_id, list(update_dict.keys()))
     await db.commit()
+    await response_cache.invalidate("artists")
     await db.refresh(user)
 
     return {
@@ -495,6 +484,7 @@ async def delete_user(
 
     logger.info("Admin %s deleted user id=%d email=%s", superuser.email, user.id, user.email)
     await db.commit()
+    await response_cache.invalidate("artists")
 
     return {"message": f"User {user.email} has been deleted"}
 
@@ -584,6 +574,7 @@ async def update_artist_status(
         superuser.email, artist_id, old_status, status,
     )
     await db.commit()
+    await response_cache.invalidate("artists")
 
     # Send email notification to artist
     if artist.user and status in ("active", "rejected"):
@@ -619,6 +610,7 @@ async def toggle_artist_featured(
 
     artist.is_featured = is_featured
     await db.commit()
+    await response_cache.invalidate("artists")
 
     return {
         "id": artist.id,
@@ -743,6 +735,7 @@ async def admin_update_artist(
 
     logger.info("Admin %s updated artist id=%d", superuser.email, artist_id)
     await db.commit()
+    await response_cache.invalidate("artists")
     await db.refresh(artist)
 
     return {"id": artist.id, "name_en": artist.name_en, "message": "Artist updated"}
@@ -892,6 +885,8 @@ async def update_booking_status(
     booking.status = status
     logger.info("Admin %s changed booking id=%d status: %s -> %s", superuser.email, booking_id, old_status, status)
     await db.commit()
+    if booking.tour_id:
+        await response_cache.invalidate("tours")
 
     return {
         "id": booking.id,
@@ -940,3 +935,144 @@ async def list_tour_dates_admin(
         }
         for td in tour_dates
     ]
+
+
+@router.post("/notifications/broadcast")
+async def broadcast_notification(
+    data: BroadcastRequest,
+    superuser: User = Depends(get_superuser),
+    db: AsyncSession = Depends(get_db),
+):
+    """Send an in-app notification to all active users, optionally of one role."""
+    if data.role is not None and data.role not in ["artist", "community", "agent", "admin"]:
+        raise HTTPException(status_code=400, detail="Invalid role")
+
+    recipients = select(User.id).where(User.is_active.is_(True), User.status == "active")
+    if data.role is not None:
+        recipients = recipients.where(User.role == data.role)
+
+    result = await notify_query(
+        db,
+        recipients,
+        type="announcement",
+        title=data.title,
+        message=data.message,
+        link=data.link,
+    )
+    await db.commit()
+    logger.info(
+        "Admin %s broadcast notification to %d users (role=%s)",
+        superuser.email, result["recipients"], data.role or "all",
+    )
+    return result
+
+
+# ── Exports ─────────────────────────────────────────────────
+
+
+def _export_response(dataset: str, query, format: str, session_factory) -> StreamingResponse:
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+    filename = f"kolamba-{dataset}-{date.today().isoformat()}.{format}"
+    return StreamingResponse(
+        stream_export(session_factory, query, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/export/users")
+async def export_users(
+    format: str = Query("csv", description="csv or ndjson"),
+    role: Optional[str] = Query(None, description="Filter by role"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    superuser: User = Depends(get_superuser),
+    session_factory=Depends(get_read_session_factory),
+):
+    """Stream every user as CSV or NDJSON."""
+    query = select(
+        User.id, User.email, User.name, User.role, User.status,
+        User.is_active, User.is_superuser, User.created_at,
+    ).order_by(User.id)
+    if role:
+        query = query.where(User.role == role)
+    if status:
+        query = query.where(User.status == status)
+    logger.info("Admin %s exported users (%s)", superuser.email, format)
+    return _export_response("users", query, format, session_factory)
+
+
+@router.get("/export/artists")
+async def export_artists(
+    format: str = Query("csv", description="csv or ndjson"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    superuser: User = Depends(get_superuser),
+    session_factory=Depends(get_read_session_factory),
+):
+    """Stream every talent profile as CSV or NDJSON."""
+    query = (
+        select(
+            Artist.id, Artist.user_id, User.email, Artist.name_en, Artist.name_he,
+            Artist.status, Artist.city, Artist.country, Artist.is_featured,
+            Artist.price_single, Artist.price_tour, Artist.created_at,
+        )
+        .join(User, Artist.user_id == User.id)
+        .order_by(Artist.id)
+    )
+    if status:
+        query = query.where(Artist.status == status)
+    logger.info("Admin %s exported artists (%s)", superuser.email, format)
+    return _export_response("artists", query, format, session_factory)
+
+
+@router.get("/export/bookings")
+async def export_bookings(
+    format: str = Query("csv", description="csv or ndjson"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    created_from: Optional[date] = Query(None, description="Created on or after"),
+    created_to: Optional[date] = Query(None, description="Created before"),
+    superuser: User = Depends(get_superuser),
+    session_factory=Depends(get_read_session_factory),
+):
+    """Stream every booking with talent and host names as CSV or NDJSON."""
+    query = (
+        select(
+            Booking.id, Booking.status,
+            Booking.artist_id, Artist.name_en.label("artist_name"),
+            Booking.community_id, Community.name.label("community_name"),
+            Booking.tour_id, Booking.requested_date, Booking.location, Booking.event_type,
+            Booking.is_online, Booking.budget, Booking.quote_amount, Booking.deposit_amount,
+            Booking.deposit_paid_at, Booking.created_at, Booking.updated_at,
+        )
+        .join(Artist, Booking.artist_id == Artist.id)
+        .join(Community, Booking.community_id == Community.id)
+        .order_by(Booking.id)
+    )
+    if status:
+        query = query.where(Booking.status == status)
+    if created_from:
+        query = query.where(Booking.created_at >= created_from)
+    if created_to:
+        query = query.where(Booking.created_at < created_to)
+    logger.info("Admin %s exported bookings (%s)", superuser.email, format)
+    return _export_response("bookings", query, format, session_factory)
+
+
+@router.get("/slow-queries")
+async def list_slow_queries(
+    limit: int = Query(50, ge=1, le=200),
+    superuser: User = Depends(get_superuser),
+):
+    """Slow statements seen by this worker, slowest in total first, with EXPLAIN plans."""
+    return {
+        "enabled": slow_query_log.enabled,
+        "threshold_ms": slow_query_log.threshold_ms,
+        "queries": slow_query_log.report(limit),
+    }
+
+
+@router.delete("/slow-queries")
+async def clear_slow_queries(superuser: User = Depends(get_superuser)):
+    """Forget the slow statements recorded by this worker."""
+    slow_query_log.clear()
+    return {"message": "Slow query log cleared"}
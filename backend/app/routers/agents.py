@@ -1,12 +1,12 @@
 """Agents router - endpoints for talent agents to manage their artists."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
 from app.database import get_db
 from app.models.user import User
@@ -37,6 +37,25 @@ class AgentArtistResponse(BaseModel):
         from_attributes = True
 
 
+class AgentBookingItem(BaseModel):
+    """A booking for one of the agent's artists."""
+    id: int
+    artist_id: int
+    artist_name: str
+    location: Optional[str]
+    requested_date: Optional[date]
+    budget: Optional[int]
+    status: str
+    created_at: datetime
+
+
+class AgentBookingsPage(BaseModel):
+    """One page of the agent's bookings, newest first."""
+    bookings: list[AgentBookingItem]
+    total: int
+    has_more: bool
+
+
 class AgentDashboardStats(BaseModel):
     """Stats for agent dashboard."""
     total_artists: int
@@ -45,49 +64,60 @@ class AgentDashboardStats(BaseModel):
     upcoming_tour_dates: int
 
 
+def _require_agent(user: User) -> None:
+    if user.role != "agent" and not user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only agents can access this endpoint",
+        )
+
+
+def _pending_bookings_per_artist(agent_id: int):
+    """Subquery (artist_id, n) of pending bookings for one agent's artists."""
+    return (
+        select(Booking.artist_id, func.count().label("n"))
+        .join(Artist, Booking.artist_id == Artist.id)
+        .where(Artist.agent_user_id == agent_id, Booking.status == "pending")
+        .group_by(Booking.artist_id)
+        .subquery()
+    )
+
+
+def _upcoming_tour_dates_per_artist(agent_id: int):
+    """Subquery (artist_id, n) of upcoming tour dates for one agent's artists."""
+    return (
+        select(ArtistTourDate.artist_id, func.count().label("n"))
+        .join(Artist, ArtistTourDate.artist_id == Artist.id)
+        .where(
+            Artist.agent_user_id == agent_id,
+            ArtistTourDate.start_date >= datetime.now(timezone.utc).date(),
+        )
+        .group_by(ArtistTourDate.artist_id)
+        .subquery()
+    )
+
+
 @router.get("/me/artists", response_model=list[AgentArtistResponse])
 async def get_my_artists(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all artists managed by the current agent."""
-    if current_user.role != "agent" and not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only agents can access this endpoint",
-        )
+    _require_agent(current_user)
 
-    # Get all artists where agent_user_id matches current user
+    pending = _pending_bookings_per_artist(current_user.id)
+    upcoming = _upcoming_tour_dates_per_artist(current_user.id)
     result = await db.execute(
-        select(Artist)
+        select(
+            Artist,
+            func.coalesce(pending.c.n, 0),
+            func.coalesce(upcoming.c.n, 0),
+        )
+        .outerjoin(pending, pending.c.artist_id == Artist.id)
+        .outerjoin(upcoming, upcoming.c.artist_id == Artist.id)
         .where(Artist.agent_user_id == current_user.id)
         .order_by(Artist.created_at.desc())
     )
-    artists = result.scalars().all()
-    artist_ids = [a.id for a in artists]
-
-    # Batch query: count pending bookings per artist
-    booking_counts: dict[int, int] = {}
-    if artist_ids:
-        bookings_result = await db.execute(
-            select(Booking.artist_id, func.count(Booking.id))
-            .where(Booking.artist_id.in_(artist_ids), Booking.status == "pending")
-            .group_by(Booking.artist_id)
-        )
-        booking_counts = dict(bookings_result.all())
-
-    # Batch query: count upcoming tour dates per artist
-    tour_date_counts: dict[int, int] = {}
-    if artist_ids:
-        tour_dates_result = await db.execute(
-            select(ArtistTourDate.artist_id, func.count(ArtistTourDate.id))
-            .where(
-                ArtistTourDate.artist_id.in_(artist_ids),
-                ArtistTourDate.start_date >= datetime.now(timezone.utc),
-            )
-            .group_by(ArtistTourDate.artist_id)
-        )
-        tour_date_counts = dict(tour_dates_result.all())
 
     return [
         AgentArtistResponse(
@@ -99,10 +129,10 @@ async def get_my_artists(
             country=artist.country,
             status=artist.status,
             created_at=artist.created_at,
-            pending_bookings=booking_counts.get(artist.id, 0),
-            tour_dates_count=tour_date_counts.get(artist.id, 0),
+            pending_bookings=pending_count,
+            tour_dates_count=tour_dates_count,
         )
-        for artist in artists
+        for artist, pending_count, tour_dates_count in result.all()
     ]
 
 
@@ -112,97 +142,92 @@ async def get_my_stats(
     db: AsyncSession = Depends(get_db),
 ):
     """Get dashboard stats for the current agent."""
-    if current_user.role != "agent" and not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only agents can access this endpoint",
-        )
-
-    # Get all artists managed by this agent
-    artists_result = await db.execute(
-        select(Artist).where(Artist.agent_user_id == current_user.id)
-    )
-    artists = artists_result.scalars().all()
-    artist_ids = [a.id for a in artists]
-
-    total_artists = len(artists)
-    active_artists = len([a for a in artists if a.status == "active"])
-
-    # Count pending bookings across all artists
-    if artist_ids:
-        bookings_result = await db.execute(
-            select(Booking).where(
-                Booking.artist_id.in_(artist_ids),
-                Booking.status == "pending"
-            )
+    _require_agent(current_user)
+
+    pending = _pending_bookings_per_artist(current_user.id)
+    upcoming = _upcoming_tour_dates_per_artist(current_user.id)
+    row = (await db.execute(
+        select(
+            func.count(Artist.id),
+            func.count(Artist.id).filter(Artist.status == "active"),
+            func.coalesce(func.sum(pending.c.n), 0),
+            func.coalesce(func.sum(upcoming.c.n), 0),
         )
-        pending_bookings = len(bookings_result.scalars().all())
-
-        # Count upcoming tour dates
-        tour_dates_result = await db.execute(
-            select(ArtistTourDate).where(
-                ArtistTourDate.artist_id.in_(artist_ids),
-                ArtistTourDate.start_date >= datetime.now(timezone.utc)
-            )
-        )
-        upcoming_tour_dates = len(tour_dates_result.scalars().all())
-    else:
-        pending_bookings = 0
-        upcoming_tour_dates = 0
+        .select_from(Artist)
+        .outerjoin(pending, pending.c.artist_id == Artist.id)
+        .outerjoin(upcoming, upcoming.c.artist_id == Artist.id)
+        .where(Artist.agent_user_id == current_user.id)
+    )).one()
 
     return AgentDashboardStats(
-        total_artists=total_artists,
-        active_artists=active_artists,
-        pending_bookings=pending_bookings,
-        upcoming_tour_dates=upcoming_tour_dates,
+        total_artists=row[0],
+        active_artists=row[1],
+        pending_bookings=row[2],
+        upcoming_tour_dates=row[3],
     )
 
 
-@router.get("/me/bookings")
+@router.get("/me/bookings", response_model=AgentBookingsPage)
 async def get_my_artists_bookings(
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by booking status"),
+    artist_id: Optional[int] = Query(None, description="Only this artist's bookings"),
+    date_from: Optional[date] = Query(None, description="Requested date on or after"),
+    date_to: Optional[date] = Query(None, description="Requested date on or before"),
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get all bookings for artists managed by the current agent."""
-    if current_user.role != "agent" and not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only agents can access this endpoint",
+    """Get bookings for artists managed by the current agent, newest first.
+
+    ``total`` counts every booking matching the filters; page on with
+    ``offset`` while ``has_more`` is true.
+    """
+    _require_agent(current_user)
+
+    query = (
+        select(
+            Booking.id,
+            Booking.artist_id,
+            Artist.name_en,
+            Booking.location,
+            Booking.requested_date,
+            Booking.budget,
+            Booking.status,
+            Booking.created_at,
         )
-
-    # Get artist IDs managed by this agent
-    artists_result = await db.execute(
-        select(Artist.id, Artist.name_en).where(Artist.agent_user_id == current_user.id)
+        .join(Artist, Booking.artist_id == Artist.id)
+        .where(Artist.agent_user_id == current_user.id)
     )
-    artists_data = artists_result.all()
-    artist_ids = [a[0] for a in artists_data]
-    artist_names = {a[0]: a[1] for a in artists_data}
-
-    if not artist_ids:
-        return []
-
-    # Get all bookings for these artists
-    bookings_result = await db.execute(
-        select(Booking)
-        .where(Booking.artist_id.in_(artist_ids))
-        .order_by(Booking.created_at.desc())
+    if status_filter:
+        query = query.where(Booking.status == status_filter)
+    if artist_id is not None:
+        query = query.where(Booking.artist_id == artist_id)
+    if date_from:
+        query = query.where(Booking.requested_date >= date_from)
+    if date_to:
+        query = query.where(Booking.requested_date <= date_to)
+
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    result = await db.execute(
+        query.order_by(Booking.created_at.desc(), Booking.id.desc()).offset(offset).limit(limit)
     )
-    bookings = bookings_result.scalars().all()
-
-    return [
+    bookings = [
         {
             "id": b.id,
             "artist_id": b.artist_id,
-            "artist_name": artist_names.get(b.artist_id, "Unknown"),
+            "artist_name": b.name_en or "Unknown",
             "location": b.location,
             "requested_date": b.requested_date,
             "budget": b.budget,
             "status": b.status,
             "created_at": b.created_at,
         }
-        for b in bookings
+        for b in result.all()
     ]
 
+    return {"bookings": bookings, "total": total, "has_more": offset + len(bookings) < total}
+
 
 @router.get("/me/artists/{artist_id}")
 async def get_my_artist(
@@ -211,11 +236,7 @@ async def get_my_artist(
     db: AsyncSession = Depends(get_db),
 ):
     """Get full artist profile for an artist managed by the current agent."""
-    if current_user.role != "agent" and not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only agents can access this endpoint",
-        )
+    _require_agent(current_user)
 
     result = await db.execute(
         select(Artist)
@@ -257,11 +278,7 @@ async def update_my_artist(
     db: AsyncSession = Depends(get_db),
 ):
     """Update a specific artist's profile (agent must own the artist)."""
-    if current_user.role != "agent" and not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only agents can access this endpoint",
-        )
+    _require_agent(current_user)
 
     result = await db.execute(
         select(Artist)
@@ -8,9 +8,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.cache import response_cache
 from app.models.artist_tour_date import ArtistTourDate
 from app.models.artist import Artist
+from app.models.community import Community
 from app.models.booking import Booking
 from app.models.tour import Tour, TourStop
 from app.schemas.artist_tour_date import (
@@ -21,14 +23,52 @@ from app.schemas.artist_tour_date import (
 from app.models.user import User
 from app.routers.auth import get_current_user
 from app.services.geocoding import geocode_location
+from app.services.notifications import notify_query
+from app.services.tour_grouping import sql_distance_km
 
 router = APIRouter()
 
+# Communities that opted into artist offers hear about tour dates this close
+NEARBY_OFFER_RADIUS_KM = 300
+
+
+async def _notify_nearby_communities(db: AsyncSession, artist: Artist, tour_date: ArtistTourDate) -> dict:
+    """Tell opted-in communities near a new tour date that the artist is coming."""
+    lat, lng = float(tour_date.latitude), float(tour_date.longitude)
+    # Cheap latitude band first so the distance is only computed for candidates
+    band = NEARBY_OFFER_RADIUS_KM / 111.0
+    nearby = (
+        select(Community.user_id)
+        .where(
+            Community.receive_artist_offers.is_(True),
+            Community.status == "active",
+            Community.latitude.between(lat - band, lat + band),
+            Community.longitude.is_not(None),
+            sql_distance_km(Community.latitude, Community.longitude, lat, lng) <= NEARBY_OFFER_RADIUS_KM,
+        )
+    )
+    artist_name = artist.name_en or artist.name_he or "A talent"
+    return await notify_query(
+        db,
+        nearby,
+        type="tour_opportunity",
+        title="Talent touring near you",
+        message=f"{artist_name} will be in {tour_date.location} from {tour_date.start_date.isoformat()}.",
+        link=f"/talents/{artist.id}",
+    )
+
+
+def _check_can_manage(artist: Artist, user: User) -> None:
+    """Only the talent, their agent or an admin may add tour dates (which notify hosts)."""
+    if user.is_superuser or user.id in (artist.user_id, artist.agent_user_id):
+        return
+    raise HTTPException(status_code=403, detail="Not authorized to manage this talent's tour dates")
+
 
 @router.get("/tour-dates/recent")
 async def get_recent_tour_dates(
     limit: int = Query(10, description="Number of tour dates to return"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get recent upcoming tour dates across all artists (for home page)."""
     from datetime import date
@@ -278,6 +318,7 @@ async def create_artist_tour_date(
     artist = artist_result.scalar_one_or_none()
     if not artist:
         raise HTTPException(status_code=404, detail="Talent not found")
+    _check_can_manage(artist, current_user)
 
     # Geocode location if lat/long not provided
     latitude = tour_date_data.latitude
@@ -298,7 +339,10 @@ async def create_artist_tour_date(
         description=tour_date_data.description,
     )
     db.add(tour_date)
+    if artist.status == "active" and latitude is not None and longitude is not None:
+        await _notify_nearby_communities(db, artist, tour_date)
     await db.commit()
+    await response_cache.invalidate("tour_dates")
     await db.refresh(tour_date)
 
     return tour_date
@@ -358,6 +402,7 @@ async def update_artist_tour_date(
         setattr(tour_date, field, value)
 
     await db.commit()
+    await response_cache.invalidate("tour_dates")
     await db.refresh(tour_date)
 
     return tour_date
@@ -384,5 +429,6 @@ async def delete_artist_tour_date(
 
     await db.delete(tour_date)
     await db.commit()
+    await response_cache.invalidate("tour_dates")
 
     return {"message": "Tour date deleted successfully"}
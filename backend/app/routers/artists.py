@@ -7,17 +7,19 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.cache import response_cache
 from app.models.artist import Artist
 from app.models.category import Category
 from app.models.user import User
 from app.models.community import Community
 from app.models.booking import Booking
 from app.models.artist_tour_date import ArtistTourDate
-from app.models.conversation import Conversation, Message
+from app.models.conversation import Conversation
 from app.schemas.artist import ArtistResponse, ArtistListResponse, ArtistUpdate
 from app.utils.security import get_password_hash
 from app.routers.auth import get_current_active_user
+from app.routers.conversations import record_message
 from app.config import get_settings
 
 settings = get_settings()
@@ -32,7 +34,7 @@ async def list_artists(
     language: Optional[str] = Query(None, description="Filter by language"),
     limit: int = Query(20, le=100),
     offset: int = Query(0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """List all artists with optional filters."""
     query = select(Artist).options(selectinload(Artist.categories)).where(
@@ -63,7 +65,7 @@ async def list_artists(
 @router.get("/featured", response_model=list[ArtistListResponse])
 async def get_featured_artists(
     limit: int = Query(4, le=10),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get featured artists for homepage."""
     result = await db.execute(
@@ -184,6 +186,7 @@ async def update_my_artist_profile(
             setattr(artist, field, value)
 
     await db.commit()
+    await response_cache.invalidate("artists")
     await db.refresh(artist)
 
     return artist
@@ -720,14 +723,10 @@ async def seed_artists(
             else:
                 sender_id = artist_users[bk["artist_idx"]].id
 
-            msg = Message(
-                conversation_id=conversation.id,
-                sender_id=sender_id,
-                content=content,
-            )
-            db.add(msg)
+            await record_message(db, conversation.id, sender_id, content)
 
     await db.commit()
+    await response_cache.invalidate("artists")
 
     return {
         "message": "Database seeded successfully!",
@@ -825,6 +824,7 @@ async def seed_tour_dates(
         })
 
     await db.commit()
+    await response_cache.invalidate("tour_dates")
 
     return {
         "message": "Tour dates seeded successfully!",
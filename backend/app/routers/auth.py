@@ -80,11 +80,8 @@ class ArtistRegisterRequest(BaseModel):
     is_agent_submission: bool = False  # Whether this is submitted by an agent
 
 
-async def get_current_user_optional(
-    token: Optional[str] = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> Optional[User]:
-    """Get current user from token, return None if not authenticated."""
+def decode_access_token(token: Optional[str]) -> Optional[int]:
+    """Return the user id from a valid access token, or None."""
     if not token:
         return None
 
@@ -96,12 +93,25 @@ async def get_current_user_optional(
         user_id = payload.get("sub")
         if user_id is None:
             return None
-        user_id = int(user_id)
+        return int(user_id)
     except (JWTError, ValueError):
         return None
 
+
+async def get_current_user_optional(
+    request: Request,
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> Optional[User]:
+    """Get current user from token, return None if not authenticated."""
+    user_id = decode_access_token(token)
+    if user_id is None:
+        return None
+
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
+    if user is not None:
+        request.state.user_id = user.id  # For the access log
     return user
 
 
@@ -804,8 +814,7 @@ async def google_auth(
     db: AsyncSession = Depends(get_db),
 ):
     """Authenticate with Google ID token."""
-    from google.oauth2 import id_token as google_id_token
-    from google.auth.transport import requests as google_requests
+    from app.services.google_auth import google_token_verifier, GoogleKeysUnavailable
 
     if not settings.google_client_id:
         raise HTTPException(
@@ -813,13 +822,17 @@ async def google_auth(
             detail="Google OAuth is not configured",
         )
 
-    # Verify the Google ID token using google-auth library (official method)
+    # Verify the Google ID token locally against the cached Google signing keys
     try:
-        token_data = google_id_token.verify_oauth2_token(
+        token_data = await google_token_verifier.verify(
             body.credential,
-            google_requests.Request(),
             settings.google_client_id,
         )
+    except GoogleKeysUnavailable:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Google sign-in is temporarily unavailable",
+        )
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -3,22 +3,24 @@
 from typing import Optional
 from datetime import date, datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import select
+from sqlalchemy import or_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
 
 from app.database import get_db
+from app.cache import response_cache
 from app.models.booking import Booking
 from app.models.artist import Artist
 from app.models.community import Community
 from app.models.user import User
-from app.models.conversation import Conversation, Message
+from app.models.conversation import Conversation
 from app.schemas.booking import BookingUpdate, BookingResponse, QuoteSubmit, QuoteResponse
 from app.routers.auth import get_current_user
 
 from app.rate_limit import limiter
 from app.routers.notifications import create_notification
+from app.routers.conversations import record_message
 from app.services.email import (
     send_new_booking_request,
     send_quote_submitted,
@@ -293,6 +295,28 @@ async def list_bookings(
     return bookings
 
 
+def _booking_access(user: User):
+    """SQL condition: ``user`` is the booking's artist or community, or a superuser."""
+    if user.is_superuser:
+        return true()
+    return or_(
+        Booking.artist_id.in_(select(Artist.id).where(Artist.user_id == user.id)),
+        Booking.community_id.in_(select(Community.id).where(Community.user_id == user.id)),
+    )
+
+
+async def _get_booking_for_user(db: AsyncSession, booking_id: int, user: User, action: str) -> Booking:
+    """Load a booking and check ownership in one query (404 if missing, 403 if not theirs)."""
+    row = (await db.execute(
+        select(Booking, _booking_access(user).label("allowed")).where(Booking.id == booking_id)
+    )).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    if not row.allowed:
+        raise HTTPException(status_code=403, detail=f"Not authorized to {action} this booking")
+    return row.Booking
+
+
 @router.get("/{booking_id}", response_model=BookingResponse)
 async def get_booking(
     booking_id: int,
@@ -300,20 +324,7 @@ async def get_booking(
     current_user: User = Depends(get_current_user),
 ):
     """Get booking details. Requires authentication."""
-    result = await db.execute(
-        select(Booking).where(Booking.id == booking_id)
-    )
-    booking = result.scalar_one_or_none()
-
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
-
-    # Ownership check: user must be the artist, the community, or a superuser
-    if not current_user.is_superuser:
-        user_artist = (await db.execute(select(Artist.id).where(Artist.user_id == current_user.id))).scalar_one_or_none()
-        user_community = (await db.execute(select(Community.id).where(Community.user_id == current_user.id))).scalar_one_or_none()
-        if booking.artist_id != user_artist and booking.community_id != user_community:
-            raise HTTPException(status_code=403, detail="Not authorized to view this booking")
+    booking = await _get_booking_for_user(db, booking_id, current_user, "view")
 
     return booking
 
@@ -326,20 +337,7 @@ async def update_booking(
     current_user: User = Depends(get_current_user),
 ):
     """Update booking status (approve/reject). Requires authentication."""
-    result = await db.execute(
-        select(Booking).where(Booking.id == booking_id)
-    )
-    booking = result.scalar_one_or_none()
-
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
-
-    # Ownership check
-    if not current_user.is_superuser:
-        user_artist = (await db.execute(select(Artist.id).where(Artist.user_id == current_user.id))).scalar_one_or_none()
-        user_community = (await db.execute(select(Community.id).where(Community.user_id == current_user.id))).scalar_one_or_none()
-        if booking.artist_id != user_artist and booking.community_id != user_community:
-            raise HTTPException(status_code=403, detail="Not authorized to update this booking")
+    booking = await _get_booking_for_user(db, booking_id, current_user, "update")
 
     # Update fields
     update_dict = update_data.model_dump(exclude_unset=True)
@@ -347,6 +345,8 @@ async def update_booking(
         setattr(booking, field, value)
 
     await db.commit()
+    if booking.tour_id:
+        await response_cache.invalidate("tours")
     await db.refresh(booking)
 
     return booking
@@ -359,23 +359,12 @@ async def cancel_booking(
     current_user: User = Depends(get_current_user),
 ):
     """Cancel a booking. Requires authentication."""
-    result = await db.execute(
-        select(Booking).where(Booking.id == booking_id)
-    )
-    booking = result.scalar_one_or_none()
-
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
-
-    # Ownership check
-    if not current_user.is_superuser:
-        user_artist = (await db.execute(select(Artist.id).where(Artist.user_id == current_user.id))).scalar_one_or_none()
-        user_community = (await db.execute(select(Community.id).where(Community.user_id == current_user.id))).scalar_one_or_none()
-        if booking.artist_id != user_artist and booking.community_id != user_community:
-            raise HTTPException(status_code=403, detail="Not authorized to cancel this booking")
+    booking = await _get_booking_for_user(db, booking_id, current_user, "cancel")
 
     booking.status = "cancelled"
     await db.commit()
+    if booking.tour_id:
+        await response_cache.invalidate("tours")
 
     return {"message": "Booking cancelled successfully"}
 
@@ -424,12 +413,7 @@ async def submit_quote(
         quote_msg = f"Quote submitted: ${body.quote_amount:,.2f}"
         if body.quote_notes:
             quote_msg += f"\n\nWhat's included:\n{body.quote_notes}"
-        message = Message(
-            conversation_id=booking.conversation.id,
-            sender_id=current_user.id,
-            content=quote_msg,
-        )
-        db.add(message)
+        await record_message(db, booking.conversation.id, current_user.id, quote_msg)
 
     # Notify the host
     community_result = await db.execute(
@@ -585,13 +569,10 @@ async def respond_to_quote(
 
     # Auto-create message in conversation
     if booking.conversation:
-        message = Message(
-            conversation_id=booking.conversation.id,
-            sender_id=current_user.id,
-            content=auto_msg,
-        )
-        db.add(message)
+        await record_message(db, booking.conversation.id, current_user.id, auto_msg)
 
     await db.commit()
+    if booking.tour_id:
+        await response_cache.invalidate("tours")
     await db.refresh(booking)
     return booking
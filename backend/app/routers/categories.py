@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models.category import Category
 from app.schemas.category import CategoryResponse
 
@@ -12,7 +12,7 @@ router = APIRouter()
 
 
 @router.get("", response_model=list[CategoryResponse])
-async def list_categories(db: AsyncSession = Depends(get_db)):
+async def list_categories(db: AsyncSession = Depends(get_read_db)):
     """List all performance categories."""
     result = await db.execute(
         select(Category).order_by(Category.sort_order)
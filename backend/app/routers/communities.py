@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 
 from datetime import date
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.community import Community, COMMUNITY_TYPES, EVENT_TYPES, CONTACT_ROLES
 from app.models.user import User
 from app.models.artist_tour_date import ArtistTourDate
@@ -23,6 +23,7 @@ from app.services.tour_grouping import find_nearby_tours, haversine_distance
 from app.services.interest_matching import get_matched_categories, calculate_interest_score, EVENT_TYPE_TO_CATEGORIES
 from app.services.geocoding import geocode_location
 from app.routers.auth import get_current_active_user
+from app.serialization import ORJSONResponse, RowSerializer
 from app.utils.security import get_password_hash
 
 router = APIRouter()
@@ -182,34 +183,54 @@ class MapLocation(BaseModel):
     details: Optional[str] = None
 
 
+community_locations = RowSerializer(
+    MapLocation,
+    latitude=lambda row: float(row.latitude),
+    longitude=lambda row: float(row.longitude),
+    type=lambda row: "community",
+    details=lambda row: row.location,
+)
+tour_date_locations = RowSerializer(
+    MapLocation,
+    name=lambda row: f"{row.name_en or 'Artist'} Tour",
+    latitude=lambda row: float(row.latitude),
+    longitude=lambda row: float(row.longitude),
+    type=lambda row: "tour_date",
+    details=lambda row: f"{row.location} - {row.start_date}",
+)
+
+
 @router.get("/locations", response_model=list[MapLocation])
 async def get_map_locations(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get all communities and upcoming tour dates with coordinates for map display."""
-    locations: list[MapLocation] = []
-
     # Communities with coordinates
     result = await db.execute(
-        select(Community).where(
+        select(
+            Community.id,
+            Community.name,
+            Community.latitude,
+            Community.longitude,
+            Community.location,
+        ).where(
             Community.status == "active",
             Community.latitude.isnot(None),
             Community.longitude.isnot(None),
         )
     )
-    for community in result.scalars().all():
-        locations.append(MapLocation(
-            id=community.id,
-            name=community.name,
-            latitude=float(community.latitude),
-            longitude=float(community.longitude),
-            type="community",
-            details=community.location,
-        ))
+    locations = community_locations.rows(result.all())
 
     # Upcoming tour dates with coordinates
     tour_result = await db.execute(
-        select(ArtistTourDate, Artist.name_en).join(
+        select(
+            ArtistTourDate.id,
+            ArtistTourDate.latitude,
+            ArtistTourDate.longitude,
+            ArtistTourDate.location,
+            ArtistTourDate.start_date,
+            Artist.name_en,
+        ).join(
             Artist, ArtistTourDate.artist_id == Artist.id
         ).where(
             ArtistTourDate.start_date >= date.today(),
@@ -217,22 +238,14 @@ async def get_map_locations(
             ArtistTourDate.longitude.isnot(None),
         )
     )
-    for tour_date, artist_name in tour_result.all():
-        locations.append(MapLocation(
-            id=tour_date.id,
-            name=f"{artist_name or 'Artist'} Tour",
-            latitude=float(tour_date.latitude),
-            longitude=float(tour_date.longitude),
-            type="tour_date",
-            details=f"{tour_date.location} - {tour_date.start_date}",
-        ))
+    locations += tour_date_locations.rows(tour_result.all())
 
-    return locations
+    return ORJSONResponse(locations)
 
 
 @router.get("/filters")
 async def get_host_filters(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get distinct countries and cities from active community locations."""
     result = await db.execute(
@@ -284,7 +297,7 @@ async def list_communities(
     max_members: Optional[int] = Query(None, ge=0, description="Maximum member count"),
     limit: int = Query(20, le=100),
     offset: int = Query(0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """List all communities with optional filters."""
     query = select(Community).where(Community.status == "active")
@@ -442,7 +455,7 @@ async def discover_artists(
     sort_by: str = Query("relevance", description="Sort: relevance|price_asc|price_desc|distance|name"),
     limit: int = Query(12, le=50),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Discover artists matched to a community's interests.
@@ -520,8 +533,8 @@ async def discover_artists(
     for tour in tours_result.scalars().all():
         active_tours_by_artist.setdefault(tour.artist_id, []).append(tour)
 
-    # 5. Build discover items
-    items: list[DiscoverArtistItem] = []
+    # 5. Score every artist; response items are only built for the requested page
+    candidates: list[tuple[Artist, float, list[str], NearbyTourDateInfo | None]] = []
     for artist in artists:
         artist_cat_slugs = [c.slug for c in artist.categories]
 
@@ -538,20 +551,20 @@ async def discover_artists(
         # Nearest tour date within radius
         nearest_tour: NearbyTourDateInfo | None = None
         if community_lat is not None and community_lng is not None:
-            artist_tour_dates = tour_dates_by_artist.get(artist.id, [])
-            best_dist = float("inf")
-            for td in artist_tour_dates:
+            nearest_td, best_dist = None, float("inf")
+            for td in tour_dates_by_artist.get(artist.id, []):
                 dist = haversine_distance(
                     community_lat, community_lng,
                     float(td.latitude), float(td.longitude),
                 )
                 if dist < best_dist:
-                    best_dist = dist
-                    nearest_tour = NearbyTourDateInfo(
-                        location=td.location,
-                        start_date=td.start_date,
-                        distance_km=round(dist, 1),
-                    )
+                    nearest_td, best_dist = td, dist
+            if nearest_td is not None:
+                nearest_tour = NearbyTourDateInfo(
+                    location=nearest_td.location,
+                    start_date=nearest_td.start_date,
+                    distance_km=round(best_dist, 1),
+                )
 
         # Also check for active tours (even if no geocoded tour dates)
         if nearest_tour is None:
@@ -570,7 +583,31 @@ async def discover_artists(
             if nearest_tour is None or nearest_tour.distance_km > radius_km:
                 continue
 
-        items.append(DiscoverArtistItem(
+        candidates.append((artist, interest_score, artist_matched_events, nearest_tour))
+
+    # 6. Sort
+    if sort_by == "price_asc":
+        candidates.sort(key=lambda x: (x[0].price_single or 0,))
+    elif sort_by == "price_desc":
+        candidates.sort(key=lambda x: (x[0].price_single or 0,), reverse=True)
+    elif sort_by == "distance":
+        candidates.sort(key=lambda x: (x[3].distance_km if x[3] else float("inf"),))
+    elif sort_by == "name":
+        candidates.sort(key=lambda x: (x[0].name_en or x[0].name_he).lower())
+    else:
+        # relevance: featured first, then touring-nearby, then interest_score desc
+        candidates.sort(
+            key=lambda x: (
+                not x[0].is_featured,
+                x[3] is None,
+                -x[1],
+                (x[0].name_en or x[0].name_he).lower(),
+            )
+        )
+
+    total = len(candidates)
+    paged = [
+        DiscoverArtistItem(
             id=artist.id,
             name_he=artist.name_he,
             name_en=artist.name_en,
@@ -588,30 +625,9 @@ async def discover_artists(
             interest_score=interest_score,
             matched_event_types=artist_matched_events,
             nearest_tour_date=nearest_tour,
-        ))
-
-    # 6. Sort
-    if sort_by == "price_asc":
-        items.sort(key=lambda x: (x.price_single or 0,))
-    elif sort_by == "price_desc":
-        items.sort(key=lambda x: (x.price_single or 0,), reverse=True)
-    elif sort_by == "distance":
-        items.sort(key=lambda x: (x.nearest_tour_date.distance_km if x.nearest_tour_date else float("inf"),))
-    elif sort_by == "name":
-        items.sort(key=lambda x: (x.name_en or x.name_he).lower())
-    else:
-        # relevance: featured first, then touring-nearby, then interest_score desc
-        items.sort(
-            key=lambda x: (
-                not x.is_featured,
-                x.nearest_tour_date is None,
-                -x.interest_score,
-                (x.name_en or x.name_he).lower(),
-            )
         )
-
-    total = len(items)
-    paged = items[offset : offset + limit]
+        for artist, interest_score, artist_matched_events, nearest_tour in candidates[offset : offset + limit]
+    ]
 
     return DiscoverResponse(
         artists=paged,
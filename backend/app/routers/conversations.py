@@ -1,7 +1,11 @@
 """Conversations router - inbox messaging between artists and communities."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, func
+import base64
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, func, update, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -16,12 +20,73 @@ from app.schemas.conversation import (
     MessageResponse,
     ConversationResponse,
     ConversationListItem,
+    MessagePage,
     VenueInfoSchema,
 )
 from app.routers.auth import get_current_active_user
+from app.services.realtime import publish_after_commit
+from app.serialization import RowSerializer
 
 router = APIRouter()
 
+PREVIEW_LENGTH = 100
+
+
+def _preview(content: str) -> str:
+    """Truncate message content for the inbox preview."""
+    if len(content) > PREVIEW_LENGTH:
+        return content[:PREVIEW_LENGTH] + "..."
+    return content
+
+
+async def record_message(db: AsyncSession, conversation_id: int, sender_id: int, content: str) -> Message:
+    """Add a message, update the conversation's inbox summary and push it.
+
+    The summary is updated with a single UPDATE in the caller's transaction,
+    so concurrent senders cannot lose a message_count increment. The caller
+    commits; participants are notified in real time after the commit.
+    """
+    message = Message(
+        conversation_id=conversation_id,
+        sender_id=sender_id,
+        content=content,
+        created_at=datetime.now(timezone.utc),
+    )
+    db.add(message)
+    await db.flush()
+
+    await db.execute(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(
+            message_count=Conversation.message_count + 1,
+            last_message_preview=_preview(content),
+            last_message_at=message.created_at,
+            last_sender_id=sender_id,
+            updated_at=message.created_at,
+        )
+    )
+
+    # Push to everyone on the thread once the caller commits
+    participants = (await db.execute(
+        select(Artist.user_id, Artist.agent_user_id, Community.user_id)
+        .select_from(Conversation)
+        .join(Booking, Conversation.booking_id == Booking.id)
+        .outerjoin(Artist, Booking.artist_id == Artist.id)
+        .outerjoin(Community, Booking.community_id == Community.id)
+        .where(Conversation.id == conversation_id)
+    )).one_or_none()
+    recipients = {uid for uid in (participants or ()) if uid is not None}
+    publish_after_commit(db, recipients, {
+        "type": "message",
+        "conversation_id": conversation_id,
+        "message_id": message.id,
+        "sender_id": sender_id,
+        "preview": _preview(content),
+        "created_at": message.created_at.isoformat(),
+    })
+    return message
+
 
 async def _get_user_artist_and_community_ids(user: User, db: AsyncSession):
     """Get the artist_id and community_id for a user."""
@@ -79,6 +144,16 @@ async def _verify_conversation_access(conversation: Conversation, user: User, db
     return False
 
 
+# Inbox rows go straight from the result to JSON, one dict per conversation
+inbox_serializer = RowSerializer(
+    ConversationListItem,
+    artist_name=lambda row: row.name_en or row.name_he,
+    community_name=lambda row: row.name,
+    last_message=lambda row: row.last_message_preview,
+    booking_status=lambda row: row.status,
+)
+
+
 @router.get("", response_model=list[ConversationListItem])
 async def list_conversations(
     current_user: User = Depends(get_current_active_user),
@@ -87,14 +162,24 @@ async def list_conversations(
     """List conversations for the current user (inbox)."""
     artist_id, community_id, is_agent = await _get_user_artist_and_community_ids(current_user, db)
 
+    # Summary columns only: no message rows are loaded for the inbox
     query = (
-        select(Conversation)
-        .join(Booking, Conversation.booking_id == Booking.id)
-        .options(
-            selectinload(Conversation.booking).selectinload(Booking.artist),
-            selectinload(Conversation.booking).selectinload(Booking.community),
-            selectinload(Conversation.messages),
+        select(
+            Conversation.id,
+            Conversation.booking_id,
+            Conversation.last_message_preview,
+            Conversation.last_message_at,
+            Conversation.last_sender_id,
+            Conversation.message_count,
+            Conversation.updated_at,
+            Booking.status,
+            Artist.name_en,
+            Artist.name_he,
+            Community.name,
         )
+        .join(Booking, Conversation.booking_id == Booking.id)
+        .outerjoin(Artist, Booking.artist_id == Artist.id)
+        .outerjoin(Community, Booking.community_id == Community.id)
     )
 
     if current_user.role == "community" and community_id:
@@ -112,42 +197,14 @@ async def list_conversations(
     query = query.order_by(Conversation.updated_at.desc())
 
     result = await db.execute(query)
-    conversations = result.scalars().unique().all()
+    return inbox_serializer.response(result.all())
 
-    items = []
-    for conv in conversations:
-        last_msg = conv.messages[-1].content if conv.messages else None
-        # Truncate last message for preview
-        if last_msg and len(last_msg) > 100:
-            last_msg = last_msg[:100] + "..."
 
-        items.append(ConversationListItem(
-            id=conv.id,
-            booking_id=conv.booking_id,
-            artist_name=conv.booking.artist.name_en or conv.booking.artist.name_he if conv.booking.artist else None,
-            community_name=conv.booking.community.name if conv.booking.community else None,
-            last_message=last_msg,
-            message_count=len(conv.messages),
-            booking_status=conv.booking.status,
-            updated_at=conv.updated_at,
-        ))
-
-    return items
-
-
-@router.get("/{conversation_id}", response_model=ConversationResponse)
-async def get_conversation(
-    conversation_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
-):
-    """Get a full conversation with all messages."""
+async def _get_conversation_for_user(conversation_id: int, user: User, db: AsyncSession) -> Conversation:
+    """Load a conversation (with its booking) or raise 404/403."""
     result = await db.execute(
         select(Conversation)
-        .options(
-            selectinload(Conversation.booking),
-            selectinload(Conversation.messages).selectinload(Message.sender),
-        )
+        .options(selectinload(Conversation.booking))
         .where(Conversation.id == conversation_id)
     )
     conversation = result.scalar_one_or_none()
@@ -155,32 +212,141 @@ async def get_conversation(
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    if not await _verify_conversation_access(conversation, current_user, db):
+    if not await _verify_conversation_access(conversation, user, db):
         raise HTTPException(status_code=403, detail="Access denied")
 
-    # Build message responses with sender info
+    return conversation
+
+
+def encode_cursor(created_at: datetime, message_id: int) -> str:
+    """Opaque cursor for a message position in (created_at, id) order."""
+    raw = f"{created_at.isoformat()}|{message_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, message_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(message_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def _message_page(
+    db: AsyncSession,
+    conversation_id: int,
+    limit: int,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+) -> MessagePage:
+    """Fetch one page of messages in chronological order.
+
+    Without a cursor this is the newest page. ``before`` pages back through
+    older history; ``after`` returns messages newer than a previous page,
+    which is what polling clients use. Served by the
+    (conversation_id, created_at, id) index.
+    """
+    if before and after:
+        raise HTTPException(status_code=400, detail="Use either 'before' or 'after', not both")
+
+    position = tuple_(Message.created_at, Message.id)
+    query = (
+        select(
+            Message.id,
+            Message.sender_id,
+            Message.content,
+            Message.created_at,
+            User.name,
+            User.role,
+        )
+        .outerjoin(User, Message.sender_id == User.id)
+        .where(Message.conversation_id == conversation_id)
+    )
+    if after:
+        query = query.where(position > tuple_(*decode_cursor(after))).order_by(
+            Message.created_at.asc(), Message.id.asc()
+        )
+    else:
+        if before:
+            query = query.where(position < tuple_(*decode_cursor(before)))
+        query = query.order_by(Message.created_at.desc(), Message.id.desc())
+
+    # One extra row tells us whether another page exists
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if not after:
+        rows.reverse()
+
     messages = [
         MessageResponse(
-            id=msg.id,
-            sender_id=msg.sender_id,
-            sender_name=msg.sender.name if msg.sender else None,
-            sender_role=msg.sender.role if msg.sender else None,
-            content=msg.content,
-            created_at=msg.created_at,
+            id=row.id,
+            sender_id=row.sender_id,
+            sender_name=row.name,
+            sender_role=row.role,
+            content=row.content,
+            created_at=row.created_at,
         )
-        for msg in conversation.messages
+        for row in rows
     ]
+    if messages:
+        before_cursor = encode_cursor(messages[0].created_at, messages[0].id)
+        after_cursor = encode_cursor(messages[-1].created_at, messages[-1].id)
+    else:
+        before_cursor = before
+        after_cursor = after
+
+    return MessagePage(
+        messages=messages,
+        has_more=has_more,
+        before_cursor=before_cursor,
+        after_cursor=after_cursor,
+    )
+
+
+@router.get("/{conversation_id}", response_model=ConversationResponse)
+async def get_conversation(
+    conversation_id: int,
+    message_limit: int = Query(50, ge=1, le=200, description="Number of most recent messages to include"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get a conversation with its most recent messages.
+
+    Older history is available from ``GET /{conversation_id}/messages?before=``
+    using the returned ``before_cursor``.
+    """
+    conversation = await _get_conversation_for_user(conversation_id, current_user, db)
+    page = await _message_page(db, conversation_id, message_limit)
 
     return ConversationResponse(
         id=conversation.id,
         booking_id=conversation.booking_id,
         venue_info=conversation.venue_info,
-        messages=messages,
+        messages=page.messages,
+        has_more_messages=page.has_more,
+        before_cursor=page.before_cursor,
+        after_cursor=page.after_cursor,
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
     )
 
 
+@router.get("/{conversation_id}/messages", response_model=MessagePage)
+async def list_messages(
+    conversation_id: int,
+    before: Optional[str] = Query(None, description="Cursor: return messages older than this"),
+    after: Optional[str] = Query(None, description="Cursor: return messages newer than this"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Page through a conversation's messages, oldest first within a page."""
+    await _get_conversation_for_user(conversation_id, current_user, db)
+    return await _message_page(db, conversation_id, limit, before=before, after=after)
+
+
 @router.post("/{conversation_id}/messages", response_model=MessageResponse)
 async def send_message(
     conversation_id: int,
@@ -202,19 +368,8 @@ async def send_message(
     if not await _verify_conversation_access(conversation, current_user, db):
         raise HTTPException(status_code=403, detail="Access denied")
 
-    message = Message(
-        conversation_id=conversation_id,
-        sender_id=current_user.id,
-        content=message_data.content,
-    )
-    db.add(message)
-
-    # Update conversation timestamp
-    from datetime import datetime, timezone
-    conversation.updated_at = datetime.now(timezone.utc)
-
+    message = await record_message(db, conversation_id, current_user.id, message_data.content)
     await db.commit()
-    await db.refresh(message)
 
     return MessageResponse(
         id=message.id,
@@ -251,8 +406,6 @@ async def update_venue_info(
         raise HTTPException(status_code=403, detail="Access denied")
 
     conversation.venue_info = venue_info.model_dump(exclude_none=True)
-
-    from datetime import datetime, timezone
     conversation.updated_at = datetime.now(timezone.utc)
 
     await db.commit()
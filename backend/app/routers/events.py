@@ -0,0 +1,85 @@
+"""Events router - Server-Sent Events stream of real-time updates."""
+
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.models.user import User
+from app.routers.auth import decode_access_token, oauth2_scheme
+from app.services.realtime import realtime_broker
+
+router = APIRouter()
+
+HEARTBEAT_SECONDS = 15
+
+
+async def get_stream_user(
+    token: Optional[str] = Depends(oauth2_scheme),
+    query_token: Optional[str] = Query(
+        None, alias="token", description="Access token, for clients (EventSource) that cannot send headers"
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """Authenticate the stream from the Authorization header or ?token=."""
+    user_id = decode_access_token(token or query_token)
+    user = None
+    if user_id is not None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+    if user is None or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+def _format_event(evt: dict) -> str:
+    return f"event: {evt.get('type', 'message')}\ndata: {json.dumps(evt, default=str)}\n\n"
+
+
+async def _event_stream(request: Request, user_id: int):
+    sub = realtime_broker.subscribe(user_id)
+    try:
+        # Tell EventSource to reconnect after 5s if the connection drops
+        yield "retry: 5000\nevent: ready\ndata: {}\n\n"
+        while True:
+            try:
+                evt = await asyncio.wait_for(sub.queue.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                # Comment line keeps proxies from closing an idle connection
+                yield ": ping\n\n"
+                continue
+            yield _format_event(evt)
+    finally:
+        realtime_broker.unsubscribe(sub)
+
+
+@router.get("/stream")
+async def event_stream(
+    request: Request,
+    current_user: User = Depends(get_stream_user),
+):
+    """Stream new messages and notifications for the current user.
+
+    Events: ``notification`` and ``message``. Payloads carry ids and
+    previews; fetch details from the notifications and conversations
+    endpoints.
+    """
+    return StreamingResponse(
+        _event_stream(request, current_user.id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx, Railway)
+        },
+    )
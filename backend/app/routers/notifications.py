@@ -1,7 +1,7 @@
 """Notifications router - CRUD operations for in-app notifications."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, update, func, delete
+from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -9,6 +9,8 @@ from app.models.notification import Notification
 from app.models.user import User
 from app.routers.auth import get_current_user
 from app.schemas.notification import NotificationResponse, NotificationCount
+from app.services.notifications import adjust_unread_count, get_unread_count as read_unread_count
+from app.services.realtime import publish_after_commit
 
 router = APIRouter()
 
@@ -42,15 +44,15 @@ async def get_unread_count(
     db: AsyncSession = Depends(get_db),
 ):
     """Get unread notification count for the current user."""
-    result = await db.execute(
-        select(func.count(Notification.id))
-        .where(Notification.user_id == current_user.id)
-        .where(Notification.is_read == False)
-    )
-    count = result.scalar() or 0
+    count = await read_unread_count(db, current_user.id)
     return NotificationCount(unread_count=count)
 
 
+def _publish_unread_count(db: AsyncSession, user_id: int, count: int) -> None:
+    """Keep other open tabs' bells in sync after a read/delete."""
+    publish_after_commit(db, [user_id], {"type": "unread_count", "unread_count": count})
+
+
 @router.put("/{notification_id}/read")
 async def mark_as_read(
     notification_id: int,
@@ -58,18 +60,30 @@ async def mark_as_read(
     db: AsyncSession = Depends(get_db),
 ):
     """Mark a notification as read."""
+    # Conditional update so the counter is decremented at most once
     result = await db.execute(
-        select(Notification).where(
+        update(Notification)
+        .where(
             Notification.id == notification_id,
             Notification.user_id == current_user.id,
+            Notification.is_read == False,
         )
+        .values(is_read=True)
+        .returning(Notification.id)
     )
-    notification = result.scalar_one_or_none()
-
-    if not notification:
-        raise HTTPException(status_code=404, detail="Notification not found")
+    if result.scalar_one_or_none() is None:
+        exists = await db.execute(
+            select(Notification.id).where(
+                Notification.id == notification_id,
+                Notification.user_id == current_user.id,
+            )
+        )
+        if exists.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Notification not found")
+        return {"message": "Notification marked as read"}
 
-    notification.is_read = True
+    count = await adjust_unread_count(db, current_user.id, -1)
+    _publish_unread_count(db, current_user.id, count)
     await db.commit()
     return {"message": "Notification marked as read"}
 
@@ -80,12 +94,17 @@ async def mark_all_as_read(
     db: AsyncSession = Depends(get_db),
 ):
     """Mark all notifications as read for the current user."""
-    await db.execute(
+    result = await db.execute(
         update(Notification)
         .where(Notification.user_id == current_user.id)
         .where(Notification.is_read == False)
         .values(is_read=True)
     )
+    # Subtract what we marked rather than zeroing, so a notification created
+    # concurrently keeps its count
+    if result.rowcount:
+        count = await adjust_unread_count(db, current_user.id, -result.rowcount)
+        _publish_unread_count(db, current_user.id, count)
     await db.commit()
     return {"message": "All notifications marked as read"}
 
@@ -98,17 +117,21 @@ async def delete_notification(
 ):
     """Delete a notification."""
     result = await db.execute(
-        select(Notification).where(
+        delete(Notification)
+        .where(
             Notification.id == notification_id,
             Notification.user_id == current_user.id,
         )
+        .returning(Notification.is_read)
     )
-    notification = result.scalar_one_or_none()
+    was_read = result.scalar_one_or_none()
 
-    if not notification:
+    if was_read is None:
         raise HTTPException(status_code=404, detail="Notification not found")
 
-    await db.delete(notification)
+    if not was_read:
+        count = await adjust_unread_count(db, current_user.id, -1)
+        _publish_unread_count(db, current_user.id, count)
     await db.commit()
     return {"message": "Notification deleted"}
 
@@ -131,4 +154,14 @@ async def create_notification(
     )
     db.add(notification)
     await db.flush()
+    unread_count = await adjust_unread_count(db, user_id, 1)
+
+    publish_after_commit(db, [user_id], {
+        "type": "notification",
+        "id": notification.id,
+        "notification_type": type,
+        "title": title,
+        "link": link,
+        "unread_count": unread_count,
+    })
     return notification
@@ -6,7 +6,7 @@ from sqlalchemy import select, or_, func, text, case, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models.artist import Artist
 from app.models.category import Category
 from app.schemas.artist import ArtistListResponse
@@ -47,7 +47,7 @@ async def search_artists(
     sort_order: str = Query("desc", description="Sort order: asc, desc"),
     limit: int = Query(20, le=100),
     offset: int = Query(0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Search artists with full-text search and advanced filters.
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
+from app.cache import response_cache
 from app.models.tour import Tour, TourStop, TourJoinRequest
 from app.models.booking import Booking
 from app.models.artist import Artist
@@ -135,6 +136,7 @@ async def create_test_tour(
     )
     db.add(tour)
     await db.commit()
+    await response_cache.invalidate("tours")
     await db.refresh(tour)
 
     return {
@@ -476,6 +478,7 @@ async def update_join_request_status(
         # Auto-check if tour should be approved now
         await _check_and_update_tour_status(db, tour_id)
         await db.commit()
+        await response_cache.invalidate("tours")
 
         return {
             "message": "Join request approved. A booking has been created.",
@@ -549,6 +552,7 @@ async def create_tour(
     # Auto-check if tour should be approved based on added bookings
     await _check_and_update_tour_status(db, tour.id)
     await db.commit()
+    await response_cache.invalidate("tours")
 
     tour = await _load_tour_with_relations(db, tour.id)
     return tour
@@ -611,6 +615,7 @@ async def update_tour(
         setattr(tour, field, value)
 
     await db.commit()
+    await response_cache.invalidate("tours")
 
     tour = await _load_tour_with_relations(db, tour.id)
     return tour
@@ -779,6 +784,7 @@ async def add_booking_to_tour(
     # Auto-check if tour should be approved now
     await _check_and_update_tour_status(db, tour_id)
     await db.commit()
+    await response_cache.invalidate("tours")
 
     return {"message": "Booking added to tour successfully", "stop_id": stop.id}
 
@@ -818,6 +824,7 @@ async def remove_booking_from_tour(
     # Re-check tour status after removing a booking
     await _check_and_update_tour_status(db, tour_id)
     await db.commit()
+    await response_cache.invalidate("tours")
 
     return {"message": "Booking removed from tour successfully"}
 
@@ -848,5 +855,6 @@ async def delete_tour(
     # Delete the tour (cascade will delete stops)
     await db.delete(tour)
     await db.commit()
+    await response_cache.invalidate("tours")
 
     return {"message": "Tour deleted successfully"}
@@ -1,15 +1,15 @@
 """Uploads router - file upload handling with Cloudinary."""
 
 import logging
+from functools import cache
 
-import cloudinary
-import cloudinary.uploader
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, status
 from app.rate_limit import limiter
 from pydantic import BaseModel
 from typing import Optional
 
 from app.config import get_settings
+from app.metrics import observe_outbound
 from app.models.user import User
 from app.routers.auth import get_current_active_user
 
@@ -17,17 +17,25 @@ settings = get_settings()
 router = APIRouter()
 logger = logging.getLogger("kolamba.uploads")
 
-# Configure Cloudinary
-if settings.cloudinary_cloud_name and settings.cloudinary_api_key and settings.cloudinary_api_secret:
+if settings.cloudinary_cloud_name and not (settings.cloudinary_api_key and settings.cloudinary_api_secret):
+    logger.warning("Cloudinary partially configured — missing api_key or api_secret")
+
+
+@cache
+def _uploader():
+    """The configured ``cloudinary.uploader``, imported on first upload (it is slow to import)."""
+    import cloudinary
+    import cloudinary.uploader
+
     cloudinary.config(
         cloud_name=settings.cloudinary_cloud_name,
         api_key=settings.cloudinary_api_key,
         api_secret=settings.cloudinary_api_secret,
         secure=True,
+        upload_prefix=settings.cloudinary_upload_prefix or None,
     )
     logger.info("Cloudinary configured (cloud=%s)", settings.cloudinary_cloud_name)
-elif settings.cloudinary_cloud_name:
-    logger.warning("Cloudinary partially configured — missing api_key or api_secret")
+    return cloudinary.uploader
 
 
 class UploadResponse(BaseModel):
@@ -82,16 +90,17 @@ async def upload_image(
 
     try:
         # Upload to Cloudinary
-        result = cloudinary.uploader.upload(
-            contents,
-            folder=f"kolamba/artists/{current_user.id}",
-            resource_type="image",
-            transformation=[
-                {"width": 1200, "height": 1200, "crop": "limit"},
-                {"quality": "auto:good"},
-                {"fetch_format": "auto"},
-            ],
-        )
+        with observe_outbound("uploads"):
+            result = _uploader().upload(
+                contents,
+                folder=f"kolamba/artists/{current_user.id}",
+                resource_type="image",
+                transformation=[
+                    {"width": 1200, "height": 1200, "crop": "limit"},
+                    {"quality": "auto:good"},
+                    {"fetch_format": "auto"},
+                ],
+            )
 
         return UploadResponse(
             url=result["secure_url"],
@@ -135,15 +144,16 @@ async def upload_video(
 
     try:
         # Upload to Cloudinary
-        result = cloudinary.uploader.upload(
-            contents,
-            folder=f"kolamba/artists/{current_user.id}/videos",
-            resource_type="video",
-            eager=[
-                {"streaming_profile": "hd", "format": "m3u8"},
-            ],
-            eager_async=True,
-        )
+        with observe_outbound("uploads"):
+            result = _uploader().upload(
+                contents,
+                folder=f"kolamba/artists/{current_user.id}/videos",
+                resource_type="video",
+                eager=[
+                    {"streaming_profile": "hd", "format": "m3u8"},
+                ],
+                eager_async=True,
+            )
 
         return UploadResponse(
             url=result["secure_url"],
@@ -187,15 +197,16 @@ async def upload_multiple_images(
             continue  # Skip files that are too large
 
         try:
-            result = cloudinary.uploader.upload(
-                contents,
-                folder=f"kolamba/artists/{current_user.id}/portfolio",
-                resource_type="image",
-                transformation=[
-                    {"width": 1200, "height": 1200, "crop": "limit"},
-                    {"quality": "auto:good"},
-                ],
-            )
+            with observe_outbound("uploads"):
+                result = _uploader().upload(
+                    contents,
+                    folder=f"kolamba/artists/{current_user.id}/portfolio",
+                    resource_type="image",
+                    transformation=[
+                        {"width": 1200, "height": 1200, "crop": "limit"},
+                        {"quality": "auto:good"},
+                    ],
+                )
             urls.append(result["secure_url"])
         except Exception:
             continue  # Skip failed uploads
@@ -230,7 +241,8 @@ async def delete_upload(
         )
 
     try:
-        result = cloudinary.uploader.destroy(public_id)
+        with observe_outbound("uploads"):
+            result = _uploader().destroy(public_id)
         return {"status": "deleted", "result": result}
     except Exception as e:
         raise HTTPException(
@@ -285,16 +297,17 @@ async def upload_image_public(
         # Upload to Cloudinary in a registration folder
         import uuid
         upload_id = str(uuid.uuid4())[:8]
-        result = cloudinary.uploader.upload(
-            contents,
-            folder=f"kolamba/registration/{upload_id}",
-            resource_type="image",
-            transformation=[
-                {"width": 1200, "height": 1200, "crop": "limit"},
-                {"quality": "auto:good"},
-                {"fetch_format": "auto"},
-            ],
-        )
+        with observe_outbound("uploads"):
+            result = _uploader().upload(
+                contents,
+                folder=f"kolamba/registration/{upload_id}",
+                resource_type="image",
+                transformation=[
+                    {"width": 1200, "height": 1200, "crop": "limit"},
+                    {"quality": "auto:good"},
+                    {"fetch_format": "auto"},
+                ],
+            )
 
         return UploadResponse(
             url=result["secure_url"],
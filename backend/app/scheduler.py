@@ -0,0 +1,166 @@
+"""In-process periodic job scheduler.
+
+Every worker runs the scheduler, so each run takes a Postgres advisory lock
+keyed on the job name first; only the worker that gets the lock runs the
+job, the others skip that tick. Under the lock the worker also checks the
+job's ``last_run_at`` in ``scheduled_jobs`` and skips if any worker started
+it less than one interval ago, so a job runs once per interval however
+many workers there are. Jobs are ``async def job(db) -> dict`` and get
+their own session.
+"""
+
+import asyncio
+import logging
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger("kolamba.scheduler")
+
+JobFunc = Callable[[AsyncSession], Awaitable[Optional[dict]]]
+
+
+@dataclass
+class Job:
+    name: str
+    func: JobFunc
+    interval: float
+    initial_delay: Optional[float] = None  # Defaults to one interval
+    last_run: Optional[float] = None
+    last_result: Optional[dict] = None
+    last_error: Optional[str] = None
+    runs: int = field(default=0)
+
+
+def advisory_lock_key(name: str) -> int:
+    """Stable 32-bit lock key for a job name."""
+    return zlib.crc32(f"kolamba:job:{name}".encode())
+
+
+class JobScheduler:
+    """Runs registered jobs on fixed intervals."""
+
+    def __init__(self, engine=None, session_factory=None):
+        self._engine = engine
+        self._session_factory = session_factory
+        self.jobs: dict[str, Job] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    def add_job(self, name: str, func: JobFunc, interval: float, initial_delay: Optional[float] = None) -> None:
+        if name in self.jobs:
+            raise ValueError(f"Job already registered: {name}")
+        self.jobs[name] = Job(name=name, func=func, interval=interval, initial_delay=initial_delay)
+
+    def _resolve(self):
+        if self._engine is None or self._session_factory is None:
+            from app.database import AsyncSessionLocal, engine
+
+            self._engine = self._engine or engine
+            self._session_factory = self._session_factory or AsyncSessionLocal
+        return self._engine, self._session_factory
+
+    async def run_job(self, name: str, force: bool = False) -> Optional[dict]:
+        """Run a job once if no other worker is running it and it is due.
+
+        Returns the job's result, or None if the lock was held elsewhere or
+        the job started less than one interval ago (ignored with ``force``).
+        """
+        job = self.jobs[name]
+        engine, session_factory = self._resolve()
+        key = advisory_lock_key(name)
+
+        # Hold the session-level lock on a dedicated connection for the run
+        async with engine.connect() as lock_conn:
+            got_lock = (await lock_conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": key}
+            )).scalar()
+            if not got_lock:
+                logger.debug("Job %s is running on another worker, skipping", name)
+                return None
+            try:
+                if not await self._claim(lock_conn, job, force):
+                    logger.debug("Job %s ran within its interval, skipping", name)
+                    return None
+                return await self._run(job, session_factory)
+            finally:
+                await lock_conn.rollback()
+                await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                await lock_conn.commit()
+
+    async def _claim(self, conn, job: Job, force: bool) -> bool:
+        """Record that ``job`` starts now, unless it started less than one interval ago."""
+        if not force:
+            # NULL when the job has never run
+            due = (await conn.execute(
+                text(
+                    "SELECT last_run_at <= now() - make_interval(secs => :interval) "
+                    "FROM scheduled_jobs WHERE name = :name"
+                ),
+                {"name": job.name, "interval": job.interval},
+            )).scalar()
+            if due is False:
+                return False
+        await conn.execute(
+            text(
+                "INSERT INTO scheduled_jobs (name, last_run_at) VALUES (:name, now()) "
+                "ON CONFLICT (name) DO UPDATE SET last_run_at = EXCLUDED.last_run_at"
+            ),
+            {"name": job.name},
+        )
+        await conn.commit()
+        return True
+
+    async def _run(self, job: Job, session_factory) -> Optional[dict]:
+        try:
+            start = time.perf_counter()
+            async with session_factory() as db:
+                result = await job.func(db)
+            job.last_result, job.last_error = result, None
+            logger.info("Job %s finished in %.2fs: %s", job.name, time.perf_counter() - start, result)
+            return result
+        except Exception as e:
+            job.last_error = str(e)
+            raise
+        finally:
+            job.runs += 1
+            job.last_run = time.time()
+
+    async def _loop(self, job: Job) -> None:
+        delay = job.interval if job.initial_delay is None else job.initial_delay
+        while True:
+            await asyncio.sleep(delay)
+            delay = job.interval
+            try:
+                await self.run_job(job.name)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Job %s failed", job.name)
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._loop(job)) for job in self.jobs.values()]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def status(self) -> dict:
+        return {
+            name: {
+                "interval_seconds": job.interval,
+                "runs": job.runs,
+                "last_run": job.last_run,
+                "last_error": job.last_error,
+            }
+            for name, job in self.jobs.items()
+        }
+
+
+scheduler = JobScheduler()
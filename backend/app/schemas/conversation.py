@@ -43,12 +43,23 @@ class MessageResponse(BaseModel):
         from_attributes = True
 
 
+class MessagePage(BaseModel):
+    """One page of messages, oldest first, with cursors for older/newer pages."""
+    messages: list[MessageResponse] = []
+    has_more: bool = False
+    before_cursor: Optional[str] = None  # Pass as ?before= to load older messages
+    after_cursor: Optional[str] = None  # Pass as ?after= to poll for newer messages
+
+
 class ConversationResponse(BaseModel):
-    """Schema for full conversation response with messages."""
+    """Schema for conversation response with its most recent messages."""
     id: int
     booking_id: int
     venue_info: Optional[dict] = None
     messages: list[MessageResponse] = []
+    has_more_messages: bool = False
+    before_cursor: Optional[str] = None
+    after_cursor: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -63,6 +74,8 @@ class ConversationListItem(BaseModel):
     artist_name: Optional[str] = None
     community_name: Optional[str] = None
     last_message: Optional[str] = None
+    last_message_at: Optional[datetime] = None
+    last_sender_id: Optional[int] = None
     message_count: int = 0
     booking_status: Optional[str] = None
     updated_at: datetime
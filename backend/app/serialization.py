@@ -0,0 +1,100 @@
+"""JSON rendering: an orjson response class and a fast path for large lists.
+
+``ORJSONResponse`` is the app's default response class. It renders the
+same JSON as Starlette's ``JSONResponse`` several times faster, and also
+accepts datetimes, dates and Decimals directly.
+
+For list endpoints that return hundreds of rows, FastAPI's usual path
+builds one Pydantic model per row in the handler, validates every one
+again against ``response_model`` and then runs the result through
+``jsonable_encoder``. ``RowSerializer`` skips all of that: it reads the
+schema's fields from each row into a plain dict and hands the list to
+orjson in one call. The schema is checked once, when the serializer is
+built, and the first row of each response is validated against it, so a
+row that drifts from the schema still fails loudly. The route keeps its
+``response_model`` for the OpenAPI docs.
+"""
+
+import datetime
+import operator
+import types
+import typing
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Union
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Aware datetimes as "...Z", like Pydantic; integer dict keys as strings, like json.dumps
+JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# Types orjson renders exactly as Pydantic's JSON mode does
+PLAIN_TYPES = (int, float, str, bool, type(None), datetime.date, datetime.datetime)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=JSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _is_plain(annotation: Any) -> bool:
+    origin = typing.get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        return all(_is_plain(arg) for arg in typing.get_args(annotation))
+    if origin is list:
+        return all(_is_plain(arg) for arg in typing.get_args(annotation))
+    return annotation in PLAIN_TYPES
+
+
+class RowSerializer:
+    """Render rows as a JSON list shaped like ``model``, without building a model per row.
+
+    Each field is read from the row attribute of the same name unless
+    ``sources`` gives a callable for it. Only schemas whose fields are plain
+    JSON types qualify (no nested models, validators, serializers, aliases
+    or computed fields); anything else raises ``TypeError`` at import time.
+    """
+
+    def __init__(self, model: type[BaseModel], **sources: Callable[[Any], Any]):
+        unknown = set(sources) - set(model.model_fields)
+        if unknown:
+            raise TypeError(f"{model.__name__} has no fields {sorted(unknown)}")
+        decorators = model.__pydantic_decorators__
+        if decorators.computed_fields or decorators.field_validators or decorators.model_validators:
+            raise TypeError(f"{model.__name__} has validators or computed fields; use the model instead")
+        if decorators.field_serializers or decorators.model_serializers:
+            raise TypeError(f"{model.__name__} has custom serializers; use the model instead")
+        for name, field in model.model_fields.items():
+            if not _is_plain(field.annotation):
+                raise TypeError(f"{model.__name__}.{name} is not a plain JSON type: {field.annotation}")
+            if field.alias not in (None, name) or field.serialization_alias not in (None, name):
+                raise TypeError(f"{model.__name__}.{name} is renamed by an alias; use the model instead")
+        self.model = model
+        self.getters = tuple(
+            (name, sources.get(name) or operator.attrgetter(name)) for name in model.model_fields
+        )
+
+    def row(self, row: Any) -> dict:
+        return {name: get(row) for name, get in self.getters}
+
+    def rows(self, rows: Iterable[Any]) -> list[dict]:
+        items = [self.row(row) for row in rows]
+        if items:
+            self.model.model_validate(items[0])
+        return items
+
+    def response(self, rows: Iterable[Any], status_code: int = 200) -> ORJSONResponse:
+        return ORJSONResponse(self.rows(rows), status_code=status_code)
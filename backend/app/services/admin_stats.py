@@ -0,0 +1,88 @@
+"""Admin dashboard statistics.
+
+All headline counts come from one statement: each table is scanned once
+with ``count(*) FILTER (WHERE ...)`` aggregates in its own single-row CTE,
+and the CTEs are joined together. The result is kept as a short-lived
+in-process snapshot so dashboard refreshes don't recount the tables.
+"""
+
+import asyncio
+import time
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.artist import Artist
+from app.models.artist_tour_date import ArtistTourDate
+from app.models.booking import Booking
+from app.models.community import Community
+from app.models.user import User
+
+
+def admin_stats_query():
+    """One SELECT returning every admin dashboard count as a single row."""
+    users = select(func.count().label("total_users")).select_from(User).cte("u")
+    artists = select(
+        func.count().label("total_artists"),
+        func.count().filter(Artist.status == "pending").label("pending_artists"),
+        func.count().filter(Artist.status == "active").label("active_artists"),
+    ).select_from(Artist).cte("a")
+    communities = select(
+        func.count().label("total_communities"),
+        func.count().filter(Community.status == "active").label("active_communities"),
+    ).select_from(Community).cte("c")
+    bookings = select(
+        func.count().label("total_bookings"),
+        func.count().filter(Booking.status == "pending").label("pending_bookings"),
+    ).select_from(Booking).cte("b")
+    tour_dates = select(
+        func.count().label("total_tour_dates"),
+        func.count().filter(ArtistTourDate.start_date >= date.today()).label("upcoming_tour_dates"),
+    ).select_from(ArtistTourDate).cte("t")
+
+    ctes = [users, artists, communities, bookings, tour_dates]
+    joined = users
+    for cte in ctes[1:]:
+        joined = joined.join(cte, true())
+    return select(*(col for cte in ctes for col in cte.c)).select_from(joined)
+
+
+async def compute_admin_stats(db: AsyncSession) -> dict:
+    row = (await db.execute(admin_stats_query())).mappings().one()
+    return {key: value or 0 for key, value in row.items()}
+
+
+class StatsSnapshot:
+    """Caches the latest admin stats for ``ttl`` seconds.
+
+    Concurrent requests for an expired snapshot wait for a single recompute.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.stats: Optional[dict] = None
+        self.generated_at: Optional[datetime] = None
+        self._computed = float("-inf")
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return self.stats is not None and time.monotonic() - self._computed < self.ttl
+
+    async def get(self, db: AsyncSession, refresh: bool = False) -> tuple[dict, datetime, bool]:
+        """Return (stats, generated_at, served_from_cache)."""
+        if not refresh and self._fresh():
+            return self.stats, self.generated_at, True
+        async with self._lock:
+            if not refresh and self._fresh():
+                return self.stats, self.generated_at, True
+            self.stats = await compute_admin_stats(db)
+            self.generated_at = datetime.now(timezone.utc)
+            self._computed = time.monotonic()
+            return self.stats, self.generated_at, False
+
+    def clear(self) -> None:
+        self.stats = None
+        self.generated_at = None
+        self._computed = float("-inf")
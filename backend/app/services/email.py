@@ -1,11 +1,11 @@
 """Email service using Resend for transactional emails."""
 
 import logging
+from functools import cache
 from typing import Optional
 
-import resend
-
 from app.config import get_settings
+from app.metrics import observe_outbound
 
 logger = logging.getLogger("kolamba.email")
 settings = get_settings()
@@ -18,20 +18,31 @@ def is_configured() -> bool:
     return bool(settings.resend_api_key)
 
 
+@cache
+def _resend():
+    """The configured ``resend`` module, imported on first send (it is slow to import)."""
+    import resend
+
+    resend.api_key = settings.resend_api_key
+    if settings.resend_api_url:
+        resend.api_url = settings.resend_api_url
+    return resend
+
+
 def _send(to: str, subject: str, html: str) -> Optional[str]:
     """Send an email via Resend. Returns email ID or None on failure."""
     if not is_configured():
         logger.warning("Email not sent (Resend not configured): to=%s subject=%s", to, subject)
         return None
 
-    resend.api_key = settings.resend_api_key
     try:
-        result = resend.Emails.send({
-            "from": FROM_EMAIL,
-            "to": [to],
-            "subject": subject,
-            "html": html,
-        })
+        with observe_outbound("email"):
+            result = _resend().Emails.send({
+                "from": FROM_EMAIL,
+                "to": [to],
+                "subject": subject,
+                "html": html,
+            })
         email_id = result.get("id") if isinstance(result, dict) else None
         logger.info("Email sent: to=%s subject=%s id=%s", to, subject, email_id)
         return email_id
@@ -1,9 +1,12 @@
 """Geocoding service - converts location text to lat/long coordinates."""
 
 import asyncio
-import httpx
 import logging
 
+from app.config import get_settings
+from app.metrics import observe_outbound
+
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
 # Rate limit: Nominatim requires max 1 request/second
@@ -24,7 +27,9 @@ async def geocode_location(location: str) -> tuple[float, float] | None:
     if not location or not location.strip():
         return None
 
-    url = "https://nominatim.openstreetmap.org/search"
+    import httpx  # Deferred: slow to import, and only needed here
+
+    url = settings.geocoding_url
     params = {
         "q": location,
         "format": "json",
@@ -46,8 +51,9 @@ async def geocode_location(location: str) -> tuple[float, float] | None:
             _last_geocode_time = time.monotonic()
 
         async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
+            with observe_outbound("geocoding"):
+                response = await client.get(url, params=params, headers=headers)
+                response.raise_for_status()
             data = response.json()
 
             if data and len(data) > 0:
@@ -0,0 +1,174 @@
+"""Google ID token verification with an in-memory JWKS cache.
+
+Google rotates its signing keys roughly daily and publishes them with a
+``Cache-Control: max-age`` header. Keys are kept in memory for that long and
+refreshed in the background shortly before they expire, so verifying a
+sign-in is a local RSA signature check rather than a network round trip.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Awaitable, Callable, Optional
+
+from jose import JWTError, jwt
+
+logger = logging.getLogger("kolamba.google_auth")
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# (jwks document, max-age seconds or None)
+JwksFetcher = Callable[[], Awaitable[tuple[dict, Optional[int]]]]
+
+
+class GoogleKeysUnavailable(Exception):
+    """Raised when Google's signing keys cannot be fetched and none are cached."""
+
+
+def parse_max_age(cache_control: Optional[str]) -> Optional[int]:
+    """Extract max-age (seconds) from a Cache-Control header value."""
+    if not cache_control:
+        return None
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else None
+
+
+async def _fetch_google_jwks() -> tuple[dict, Optional[int]]:
+    """Download Google's JWKS document."""
+    import httpx  # Deferred: slow to import, and only needed on a key refresh
+
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        response = await client.get(GOOGLE_CERTS_URL)
+        response.raise_for_status()
+        return response.json(), parse_max_age(response.headers.get("cache-control"))
+
+
+class GoogleTokenVerifier:
+    """Verifies Google ID tokens against a cached copy of Google's JWKS."""
+
+    def __init__(
+        self,
+        fetch: JwksFetcher = _fetch_google_jwks,
+        default_max_age: int = 3600,
+        refresh_margin: int = 300,
+        min_refetch_interval: float = 30.0,
+        failure_backoff: float = 60.0,
+    ):
+        self._fetch = fetch
+        self.default_max_age = default_max_age
+        # Start a background refresh this many seconds before expiry
+        self.refresh_margin = refresh_margin
+        # Minimum gap between refetches triggered by an unknown key id
+        self.min_refetch_interval = min_refetch_interval
+        # After a failed refresh, keep serving cached keys this long before retrying
+        self.failure_backoff = failure_backoff
+
+        self._keys: dict[str, dict] = {}
+        self._expires_at = 0.0
+        self._last_fetch = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def has_keys(self) -> bool:
+        return bool(self._keys)
+
+    async def refresh(self) -> None:
+        """Fetch the JWKS, coalescing concurrent callers into a single request."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        requested_at = time.monotonic()
+        async with self._lock:
+            # Another caller refreshed while we were waiting for the lock
+            if self._last_fetch >= requested_at:
+                return
+            try:
+                jwks, max_age = await self._fetch()
+            except Exception as e:
+                self._refresh_failed(f"Google JWKS refresh failed: {e}")
+                return
+
+            keys = {k["kid"]: k for k in jwks.get("keys", []) if k.get("kid")}
+            if not keys:
+                self._refresh_failed("Google JWKS response contained no keys")
+                return
+
+            now = time.monotonic()
+            self._keys = keys
+            self._last_fetch = now
+            self._expires_at = now + (max_age if max_age is not None else self.default_max_age)
+            logger.info("Google JWKS refreshed: %d keys, max-age=%s", len(keys), max_age)
+
+    def _refresh_failed(self, reason: str) -> None:
+        """Back off and keep the cached keys, or raise if there are none."""
+        now = time.monotonic()
+        self._last_fetch = now
+        if not self._keys:
+            raise GoogleKeysUnavailable(f"Could not fetch Google signing keys: {reason}")
+        # Without this every request after expiry would block on another fetch
+        self._expires_at = max(self._expires_at, now + self.failure_backoff)
+        logger.warning("%s; keeping cached keys for %.0fs", reason, self.failure_backoff)
+
+    def _schedule_refresh(self) -> None:
+        """Refresh in the background while cached keys keep serving requests."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except GoogleKeysUnavailable:
+            logger.warning("Background Google JWKS refresh failed")
+
+    async def _get_key(self, kid: str) -> Optional[dict]:
+        now = time.monotonic()
+        if not self._keys or now >= self._expires_at:
+            await self.refresh()
+        elif now >= self._expires_at - self.refresh_margin and now - self._last_fetch >= self.min_refetch_interval:
+            self._schedule_refresh()
+
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._last_fetch >= self.min_refetch_interval:
+            # Google may have rotated keys before our cached copy expired
+            await self.refresh()
+            key = self._keys.get(kid)
+        return key
+
+    async def verify(self, token: str, audience: str) -> dict:
+        """Verify a Google ID token and return its claims.
+
+        Raises ValueError for any invalid token, mirroring
+        ``google.oauth2.id_token.verify_oauth2_token``.
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError as e:
+            raise ValueError(f"Malformed token: {e}") from e
+
+        kid = header.get("kid")
+        if not kid or header.get("alg") != "RS256":
+            raise ValueError("Unsupported token header")
+
+        key = await self._get_key(kid)
+        if key is None:
+            raise ValueError("Token signed with an unknown key")
+
+        try:
+            return jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                audience=audience,
+                issuer=GOOGLE_ISSUERS,
+                options={"verify_at_hash": False},
+            )
+        except JWTError as e:
+            raise ValueError(str(e)) from e
+
+
+google_token_verifier = GoogleTokenVerifier()
@@ -0,0 +1,170 @@
+"""Daily metrics rollup for admin analytics.
+
+``rollup_daily_metrics`` aggregates each day's new rows into
+``daily_metrics`` with one INSERT ... SELECT ... ON CONFLICT statement.
+Every run recomputes the trailing lookback window (booking statuses change
+after creation) and fills any days since the last run; the first run
+backfills from the earliest user.
+
+``analytics_series`` answers any date range and granularity from the
+rollup in one query, with cumulative totals computed by window functions.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.daily_metric import DailyMetric
+
+settings = get_settings()
+
+GRANULARITIES = ("day", "week", "month")
+
+# Day buckets are UTC dates, so the scan bounds are UTC midnights too; a bare
+# CAST(:start AS date) against a timestamptz would use the session TimeZone.
+_ROLLUP_SQL = text("""
+WITH bounds AS (
+    SELECT CAST(:start AS date)::timestamp AT TIME ZONE 'UTC' AS lo,
+           (CAST(:end AS date) + 1)::timestamp AT TIME ZONE 'UTC' AS hi
+),
+days AS (
+    SELECT d::date AS day
+    FROM generate_series(CAST(:start AS date)::timestamp, CAST(:end AS date)::timestamp, interval '1 day') AS d
+),
+u AS (
+    SELECT (created_at AT TIME ZONE 'UTC')::date AS day,
+           count(*) AS users_new,
+           count(*) FILTER (WHERE role = 'artist') AS artist_signups,
+           count(*) FILTER (WHERE role = 'community') AS community_signups,
+           count(*) FILTER (WHERE role = 'agent') AS agent_signups
+    FROM users, bounds
+    WHERE created_at >= lo AND created_at < hi
+    GROUP BY 1
+),
+a AS (
+    SELECT (created_at AT TIME ZONE 'UTC')::date AS day, count(*) AS n
+    FROM artists, bounds WHERE created_at >= lo AND created_at < hi GROUP BY 1
+),
+c AS (
+    SELECT (created_at AT TIME ZONE 'UTC')::date AS day, count(*) AS n
+    FROM communities, bounds WHERE created_at >= lo AND created_at < hi GROUP BY 1
+),
+b AS (
+    SELECT day, sum(n) AS n, jsonb_object_agg(status, n) AS by_status
+    FROM (
+        SELECT (created_at AT TIME ZONE 'UTC')::date AS day, status, count(*) AS n
+        FROM bookings, bounds WHERE created_at >= lo AND created_at < hi GROUP BY 1, 2
+    ) per_status
+    GROUP BY day
+),
+t AS (
+    SELECT (created_at AT TIME ZONE 'UTC')::date AS day, count(*) AS n
+    FROM artist_tour_dates, bounds WHERE created_at >= lo AND created_at < hi GROUP BY 1
+)
+INSERT INTO daily_metrics (
+    day, users_new, artist_signups, community_signups, agent_signups,
+    artists_new, communities_new, bookings_new, bookings_by_status, tour_dates_new, computed_at
+)
+SELECT days.day,
+       COALESCE(u.users_new, 0), COALESCE(u.artist_signups, 0),
+       COALESCE(u.community_signups, 0), COALESCE(u.agent_signups, 0),
+       COALESCE(a.n, 0), COALESCE(c.n, 0),
+       COALESCE(b.n, 0), COALESCE(b.by_status, '{}'::jsonb),
+       COALESCE(t.n, 0), NOW()
+FROM days
+LEFT JOIN u USING (day)
+LEFT JOIN a USING (day)
+LEFT JOIN c USING (day)
+LEFT JOIN b USING (day)
+LEFT JOIN t USING (day)
+ON CONFLICT (day) DO UPDATE SET
+    users_new = EXCLUDED.users_new,
+    artist_signups = EXCLUDED.artist_signups,
+    community_signups = EXCLUDED.community_signups,
+    agent_signups = EXCLUDED.agent_signups,
+    artists_new = EXCLUDED.artists_new,
+    communities_new = EXCLUDED.communities_new,
+    bookings_new = EXCLUDED.bookings_new,
+    bookings_by_status = EXCLUDED.bookings_by_status,
+    tour_dates_new = EXCLUDED.tour_dates_new,
+    computed_at = EXCLUDED.computed_at
+""")
+
+
+async def rollup_daily_metrics(
+    db: AsyncSession,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> dict:
+    """Recompute daily_metrics rows from ``start`` through ``end`` (default: today).
+
+    Without ``start``, resumes from the last rolled-up day minus the
+    lookback window, or from the first user's signup on an empty table.
+    """
+    today = datetime.now(timezone.utc).date()
+    end = end or today
+    if start is None:
+        last_day = (await db.execute(select(func.max(DailyMetric.day)))).scalar()
+        if last_day is not None:
+            start = min(last_day, end) - timedelta(days=settings.metrics_rollup_lookback_days)
+        else:
+            first = (await db.execute(text(
+                "SELECT min((created_at AT TIME ZONE 'UTC')::date) FROM users"
+            ))).scalar()
+            start = first or end
+
+    result = await db.execute(_ROLLUP_SQL, {"start": start, "end": end})
+    await db.commit()
+    return {"start": start.isoformat(), "end": end.isoformat(), "days": result.rowcount}
+
+
+_SERIES_SQL = """
+WITH buckets AS (
+    SELECT date_trunc('{granularity}', day)::date AS period,
+           sum(users_new) AS users_new,
+           sum(artist_signups) AS artist_signups,
+           sum(community_signups) AS community_signups,
+           sum(agent_signups) AS agent_signups,
+           sum(artists_new) AS artists_new,
+           sum(communities_new) AS communities_new,
+           sum(bookings_new) AS bookings_new,
+           sum(tour_dates_new) AS tour_dates_new
+    FROM daily_metrics
+    WHERE day <= :end
+    GROUP BY 1
+),
+running AS (
+    SELECT *,
+           sum(users_new) OVER w AS users_total,
+           sum(artists_new) OVER w AS artists_total,
+           sum(communities_new) OVER w AS communities_total,
+           sum(bookings_new) OVER w AS bookings_total,
+           sum(tour_dates_new) OVER w AS tour_dates_total
+    FROM buckets
+    WINDOW w AS (ORDER BY period)
+)
+SELECT * FROM running
+WHERE period >= date_trunc('{granularity}', CAST(:start AS date))::date
+ORDER BY period
+"""
+
+
+async def analytics_series(db: AsyncSession, start: date, end: date, granularity: str = "month") -> list[dict]:
+    """Per-period new and cumulative counts between ``start`` and ``end``.
+
+    Periods with no rolled-up days are omitted.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity: {granularity}")
+    # granularity is whitelisted above, so formatting it into the SQL is safe
+    result = await db.execute(
+        text(_SERIES_SQL.format(granularity=granularity)), {"start": start, "end": end}
+    )
+    # Postgres sums come back as bigint/numeric; normalise to int
+    return [
+        {key: value if key == "period" else int(value or 0) for key, value in row.items()}
+        for row in result.mappings().all()
+    ]
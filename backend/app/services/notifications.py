@@ -0,0 +1,285 @@
+"""Notification bookkeeping shared by the notifications router and jobs.
+
+Unread counts live in ``notification_counters`` (one row per user) and are
+adjusted in the same transaction as the notification change, so reading
+the count is a primary-key lookup. ``reconcile_unread_counters`` runs
+periodically to correct any drift.
+
+``notify_users`` and ``notify_query`` send the same notification to many
+users with set-based INSERT ... SELECT statements instead of one ORM
+insert per recipient. They do not commit.
+
+``purge_read_notifications`` enforces the retention policy in settings.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import Boolean, DateTime, Integer, Select, String, Text, func, literal, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.notification import Notification, NotificationCounter
+from app.services.realtime import publish_after_commit
+
+settings = get_settings()
+
+logger = logging.getLogger("kolamba.notifications")
+
+
+async def adjust_unread_count(db: AsyncSession, user_id: int, delta: int) -> int:
+    """Atomically add ``delta`` to a user's unread count and return the new value."""
+    stmt = pg_insert(NotificationCounter).values(user_id=user_id, unread_count=max(delta, 0))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[NotificationCounter.user_id],
+        set_={
+            "unread_count": func.greatest(NotificationCounter.unread_count + delta, 0),
+            "updated_at": func.now(),
+        },
+    ).returning(NotificationCounter.unread_count)
+    result = await db.execute(stmt)
+    return result.scalar_one()
+
+
+async def get_unread_count(db: AsyncSession, user_id: int) -> int:
+    """Read a user's unread count (primary-key lookup)."""
+    result = await db.execute(
+        select(NotificationCounter.unread_count).where(NotificationCounter.user_id == user_id)
+    )
+    return result.scalar() or 0
+
+
+async def reconcile_unread_counters(db: AsyncSession) -> dict:
+    """Recompute unread counters from the notifications table.
+
+    Only rows that disagree are written. A notification change racing with
+    this job can leave a counter off by one until the next run.
+    """
+    upserted = await db.execute(text("""
+        INSERT INTO notification_counters (user_id, unread_count, updated_at)
+        SELECT user_id, count(*), NOW()
+        FROM notifications
+        WHERE is_read = false
+        GROUP BY user_id
+        ON CONFLICT (user_id) DO UPDATE
+        SET unread_count = EXCLUDED.unread_count, updated_at = NOW()
+        WHERE notification_counters.unread_count <> EXCLUDED.unread_count
+    """))
+    zeroed = await db.execute(text("""
+        UPDATE notification_counters c
+        SET unread_count = 0, updated_at = NOW()
+        WHERE c.unread_count <> 0
+          AND NOT EXISTS (
+              SELECT 1 FROM notifications n
+              WHERE n.user_id = c.user_id AND n.is_read = false
+          )
+    """))
+    await db.commit()
+
+    corrected = upserted.rowcount + zeroed.rowcount
+    if corrected:
+        logger.warning("Reconciled %d drifted unread notification counters", corrected)
+    return {"corrected": corrected}
+
+
+# ── Bulk fan-out ────────────────────────────────────────────
+
+BULK_CHUNK_SIZE = 1000
+# Keeps each realtime event's recipient list well under the NOTIFY payload limit
+REALTIME_BATCH_SIZE = 500
+
+_INSERT_COLUMNS = ["user_id", "type", "title", "message", "link", "is_read", "created_at"]
+
+
+def _unnest_ids(user_ids: list[int]) -> Select:
+    """SELECT user_id FROM unnest(:ids): a whole id list as one bind parameter."""
+    ids = func.unnest(literal(user_ids, ARRAY(Integer))).table_valued("user_id").render_derived()
+    return select(ids.c.user_id)
+
+
+def _notification_insert(source: Select, type: str, title: str, message: str, link: Optional[str]):
+    """INSERT INTO notifications ... SELECT <user ids from source>, <constants>."""
+    src = source.subquery()
+    rows = select(
+        src.c[0],
+        literal(type, String),
+        literal(title, String),
+        literal(message, Text),
+        literal(link, String),
+        literal(False, Boolean),
+        literal(datetime.now(timezone.utc), DateTime(timezone=True)),
+    )
+    return (
+        Notification.__table__.insert()
+        .from_select(_INSERT_COLUMNS, rows)
+        .returning(Notification.user_id)
+    )
+
+
+async def _increment_counters(db: AsyncSession, user_ids: list[int]) -> None:
+    if not user_ids:
+        return
+    src = _unnest_ids(user_ids).subquery()
+    stmt = pg_insert(NotificationCounter).from_select(
+        ["user_id", "unread_count"],
+        select(src.c.user_id, literal(1, Integer)),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[NotificationCounter.user_id],
+        set_={
+            "unread_count": NotificationCounter.unread_count + 1,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+def _publish_bulk(db: AsyncSession, user_ids: list[int], evt: dict) -> None:
+    for i in range(0, len(user_ids), REALTIME_BATCH_SIZE):
+        publish_after_commit(db, user_ids[i:i + REALTIME_BATCH_SIZE], evt)
+
+
+async def notify_users(
+    db: AsyncSession,
+    user_ids: Iterable[int],
+    type: str,
+    title: str,
+    message: str,
+    link: Optional[str] = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> dict:
+    """Send one notification to every user in ``user_ids``.
+
+    Inserts in chunks of ``chunk_size`` recipients, each chunk a single
+    statement, all in the caller's transaction. Duplicate ids are ignored.
+    """
+    ids = sorted(set(user_ids))
+    chunks = 0
+    for i in range(0, len(ids), chunk_size):
+        chunk = ids[i:i + chunk_size]
+        await db.execute(_notification_insert(_unnest_ids(chunk), type, title, message, link))
+        await _increment_counters(db, chunk)
+        chunks += 1
+
+    _publish_bulk(db, ids, {"type": "notification", "notification_type": type, "title": title, "link": link})
+    return {"recipients": len(ids), "chunks": chunks}
+
+
+async def notify_query(
+    db: AsyncSession,
+    user_query: Select,
+    type: str,
+    title: str,
+    message: str,
+    link: Optional[str] = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> dict:
+    """Send one notification to every user id selected by ``user_query``.
+
+    ``user_query`` must select a single user-id column. Notification rows
+    are inserted straight from the query without a round trip through
+    Python; counters are then bumped in chunks.
+    """
+    result = await db.execute(
+        _notification_insert(user_query.distinct(), type, title, message, link)
+    )
+    ids = sorted(result.scalars().all())
+    for i in range(0, len(ids), chunk_size):
+        await _increment_counters(db, ids[i:i + chunk_size])
+
+    _publish_bulk(db, ids, {"type": "notification", "notification_type": type, "title": title, "link": link})
+    return {"recipients": len(ids), "chunks": -(-len(ids) // chunk_size)}
+
+
+# ── Retention ───────────────────────────────────────────────
+
+# Breathing room between cleanup batches for concurrent writers and replicas
+CLEANUP_BATCH_PAUSE = 0.1
+
+_ARCHIVE_CTE = """,
+archived AS (
+    INSERT INTO notifications_archive (id, user_id, type, title, message, link, created_at, archived_at)
+    SELECT id, user_id, type, title, message, link, created_at, NOW() FROM removed
+    ON CONFLICT (id) DO NOTHING
+)"""
+
+_PURGE_BATCH_SQL = """
+WITH batch AS (
+    SELECT id FROM notifications
+    WHERE is_read = true AND created_at < :cutoff AND id > :after
+    ORDER BY id
+    LIMIT :limit
+    FOR UPDATE SKIP LOCKED
+),
+removed AS (
+    DELETE FROM notifications n
+    USING batch
+    WHERE n.id = batch.id
+    RETURNING n.id, n.user_id, n.type, n.title, n.message, n.link, n.created_at,
+              pg_column_size(n.*) AS row_bytes
+){archive}
+SELECT count(*), max(id), COALESCE(sum(row_bytes), 0) FROM removed
+"""
+
+
+async def _table_bytes(db: AsyncSession) -> int:
+    result = await db.execute(text("SELECT pg_total_relation_size('notifications')"))
+    return result.scalar()
+
+
+async def purge_read_notifications(
+    db: AsyncSession,
+    retention_days: Optional[int] = None,
+    mode: Optional[str] = None,
+    batch_size: Optional[int] = None,
+) -> dict:
+    """Delete (or archive) read notifications older than the retention period.
+
+    Walks the table in primary-key order, one short transaction per batch,
+    so no batch holds row locks for long and rows locked by users are
+    skipped until the next run. Unread notifications are never touched, so
+    unread counters are unaffected.
+
+    ``bytes_reclaimed`` is the on-disk size of the removed rows; Postgres
+    reuses that space after (auto)vacuum rather than shrinking the file.
+    """
+    retention_days = settings.notification_retention_days if retention_days is None else retention_days
+    mode = mode or settings.notification_retention_mode
+    batch_size = batch_size or settings.notification_cleanup_batch_size
+    if mode not in ("delete", "archive"):
+        raise ValueError(f"Unknown notification retention mode: {mode}")
+    if retention_days <= 0:
+        return {"removed": 0, "mode": mode, "skipped": "retention disabled"}
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    stmt = text(_PURGE_BATCH_SQL.format(archive=_ARCHIVE_CTE if mode == "archive" else ""))
+    table_bytes_before = await _table_bytes(db)
+
+    removed = batches = bytes_reclaimed = 0
+    after = 0
+    while True:
+        count, last_id, row_bytes = (await db.execute(
+            stmt, {"cutoff": cutoff, "after": after, "limit": batch_size}
+        )).one()
+        await db.commit()
+        if count:
+            batches += 1
+            removed += count
+            bytes_reclaimed += int(row_bytes)
+            after = last_id
+        if count < batch_size:
+            break
+        await asyncio.sleep(CLEANUP_BATCH_PAUSE)
+
+    return {
+        "removed": removed,
+        "mode": mode,
+        "batches": batches,
+        "cutoff": cutoff.isoformat(),
+        "bytes_reclaimed": bytes_reclaimed,
+        "table_bytes_before": table_bytes_before,
+        "table_bytes_after": await _table_bytes(db),
+    }
@@ -0,0 +1,206 @@
+"""Real-time event push to connected clients.
+
+Routers queue events on the DB session with ``publish_after_commit()``;
+they are published only once the transaction commits. The in-process
+``RealtimeBroker`` delivers events to the SSE streams connected to this
+worker. When Postgres fan-out is running, events are sent with
+``pg_notify`` instead and every worker (including this one) delivers them
+from its LISTEN connection, so a user connected to any worker receives them.
+
+Event payloads are kept small (ids, titles, previews): clients fetch the
+full data through the regular endpoints.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("kolamba.realtime")
+
+CHANNEL = "kolamba_events"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_PAYLOAD = 7900
+
+
+class Subscription:
+    """One connected client's event queue."""
+
+    def __init__(self, user_id: int, max_queue: int = 100):
+        self.user_id = user_id
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_queue)
+
+    def put(self, evt: dict) -> None:
+        if self.queue.full():
+            # Slow client: drop the oldest event rather than block publishers
+            self.queue.get_nowait()
+        self.queue.put_nowait(evt)
+
+
+class RealtimeBroker:
+    """In-process pub/sub of events keyed by user id."""
+
+    def __init__(self):
+        self._subscriptions: dict[int, set[Subscription]] = defaultdict(set)
+        self.fanout: Optional["PostgresFanout"] = None
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(subs) for subs in self._subscriptions.values())
+
+    def subscribe(self, user_id: int) -> Subscription:
+        sub = Subscription(user_id)
+        self._subscriptions[user_id].add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subscriptions.get(sub.user_id)
+        if subs is None:
+            return
+        subs.discard(sub)
+        if not subs:
+            del self._subscriptions[sub.user_id]
+
+    def deliver(self, user_ids: Iterable[int], evt: dict) -> int:
+        """Hand an event to this worker's subscribers. Returns deliveries."""
+        delivered = 0
+        for user_id in set(user_ids):
+            for sub in self._subscriptions.get(user_id, ()):
+                sub.put(evt)
+                delivered += 1
+        return delivered
+
+    async def publish(self, user_ids: Iterable[int], evt: dict) -> None:
+        """Publish to all workers if fan-out is running, else this worker only."""
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return
+        if self.fanout is not None and self.fanout.connected:
+            try:
+                await self.fanout.notify(user_ids, evt)
+                return
+            except Exception as e:
+                logger.warning("pg_notify failed, delivering locally only: %s", e)
+        self.deliver(user_ids, evt)
+
+
+realtime_broker = RealtimeBroker()
+
+
+# ── Publishing after commit ─────────────────────────────────
+
+_PENDING_KEY = "realtime_events"
+
+# The loop only holds weak references to tasks; keep publishes alive until done
+_publish_tasks: set[asyncio.Task] = set()
+
+
+def publish_after_commit(db, user_ids: Iterable[int], evt: dict) -> None:
+    """Queue an event to be published once ``db``'s transaction commits.
+
+    Accepts an AsyncSession or a sync Session. Events queued in a
+    transaction that rolls back are discarded.
+    """
+    session = getattr(db, "sync_session", db)
+    session.info.setdefault(_PENDING_KEY, []).append((list(user_ids), evt))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.debug("No running event loop; dropping %d realtime events", len(pending))
+        return
+    for user_ids, evt in pending:
+        task = loop.create_task(_publish(user_ids, evt))
+        _publish_tasks.add(task)
+        task.add_done_callback(_publish_tasks.discard)
+
+
+async def _publish(user_ids: list[int], evt: dict) -> None:
+    try:
+        await realtime_broker.publish(user_ids, evt)
+    except Exception as e:
+        logger.warning("Publishing %s event failed: %s", evt.get("type"), e)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ── Cross-worker fan-out ────────────────────────────────────
+
+
+class PostgresFanout:
+    """LISTEN/NOTIFY bridge so events reach clients on every worker."""
+
+    def __init__(self, broker: RealtimeBroker, connect_kwargs: dict, channel: str = CHANNEL):
+        self.broker = broker
+        self.connect_kwargs = connect_kwargs
+        self.channel = channel
+        self._conn = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+            self.broker.deliver(data["u"], data["e"])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring malformed realtime notification: %s", e)
+
+    async def _connect(self) -> None:
+        import asyncpg
+
+        conn = await asyncpg.connect(**self.connect_kwargs)
+        await conn.add_listener(self.channel, self._on_notify)
+        self._conn = conn
+        logger.info("Realtime fan-out listening on channel %s", self.channel)
+
+    async def _supervise(self) -> None:
+        """Keep the LISTEN connection alive, reconnecting with backoff."""
+        delay = 1.0
+        while not self._stopping:
+            if not self.connected:
+                try:
+                    await self._connect()
+                    delay = 1.0
+                except Exception as e:
+                    logger.warning("Realtime fan-out connection failed (retry in %.0fs): %s", delay, e)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 30.0)
+                    continue
+            await asyncio.sleep(5)
+
+    async def notify(self, user_ids: list[int], evt: dict) -> None:
+        payload = json.dumps({"u": user_ids, "e": evt}, default=str)
+        if len(payload.encode()) > MAX_NOTIFY_PAYLOAD:
+            raise ValueError(f"Realtime payload too large ({len(payload)} bytes)")
+        async with self._lock:
+            await self._conn.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+
+    async def start(self) -> None:
+        self.broker.fanout = self
+        self._task = asyncio.get_running_loop().create_task(self._supervise())
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self.broker.fanout = None
+        if self._task is not None:
+            self._task.cancel()
+        if self._conn is not None and not self._conn.is_closed():
+            await self._conn.close()
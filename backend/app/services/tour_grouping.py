@@ -5,7 +5,7 @@ from datetime import date, timedelta
 from typing import Optional
 from collections import defaultdict
 
-from sqlalchemy import select
+from sqlalchemy import Float, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -34,6 +34,18 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def sql_distance_km(lat_column, lng_column, lat: float, lng: float):
+    """SQL expression for the haversine distance (km) from a row's coordinates to a point."""
+    lat1 = func.radians(cast(lat_column, Float))
+    lng1 = func.radians(cast(lng_column, Float))
+    lat2, lng2 = radians(lat), radians(lng)
+    a = (
+        func.power(func.sin((lat2 - lat1) / 2), 2)
+        + func.cos(lat1) * cos(lat2) * func.power(func.sin((lng2 - lng1) / 2), 2)
+    )
+    return 2 * 6371 * func.asin(func.sqrt(a))
+
+
 def find_nearby_communities(
     communities: list[dict],
     max_distance_km: float
@@ -0,0 +1,205 @@
+"""Slow-query log with EXPLAIN capture (opt-in: SLOW_QUERY_THRESHOLD_MS > 0).
+
+Statements slower than the threshold are grouped by shape (see
+``statement_shape``) with their count, timings, the route that ran them
+and one sample of redacted parameters. The first time a shape is seen,
+its plan is fetched in the background with ``EXPLAIN (FORMAT JSON)`` on a
+separate pooled connection; without ANALYZE nothing is executed.
+
+Entries live in memory per worker and are listed, slowest in total
+first, at ``GET /api/admin/slow-queries``.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Optional
+
+from sqlalchemy import event
+
+from app.config import get_settings
+from app.metrics import route_template
+from app.query_stats import statement_shape
+
+settings = get_settings()
+logger = logging.getLogger("kolamba.slow_queries")
+
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+MAX_CONCURRENT_EXPLAINS = 2
+
+_request_scope: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("slow_query_scope", default=None)
+_in_explain: contextvars.ContextVar[bool] = contextvars.ContextVar("slow_query_in_explain", default=False)
+
+
+def redact_parameters(parameters) -> Any:
+    """Keep numbers, dates and flags; replace text and binary values with their length."""
+    if isinstance(parameters, dict):
+        return {k: redact_parameters(v) for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(v) for v in parameters]
+    if parameters is None or isinstance(parameters, (bool, int, float, Decimal)):
+        return parameters
+    if isinstance(parameters, (date, datetime)):
+        return parameters.isoformat()
+    if isinstance(parameters, (str, bytes)):
+        return f"<{type(parameters).__name__} len={len(parameters)}>"
+    return f"<{type(parameters).__name__}>"
+
+
+@dataclass
+class SlowQuery:
+    shape: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+    last_seen: Optional[datetime] = None
+    last_route: Optional[str] = None
+    parameters: Any = None
+    plan: Any = None
+    explain_error: Optional[str] = None
+    routes: set[str] = field(default_factory=set)
+
+    def to_dict(self) -> dict:
+        return {
+            "shape": self.shape,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 1),
+            "last_ms": round(self.last_ms, 1),
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "last_route": self.last_route,
+            "routes": sorted(self.routes),
+            "parameters": self.parameters,
+            "plan": self.plan,
+            "explain_error": self.explain_error,
+        }
+
+
+class SlowQueryLog:
+    """Records statements slower than ``threshold_ms`` on attached engines."""
+
+    def __init__(self, threshold_ms: float, explain: bool = True, max_entries: int = 200):
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self.max_entries = max_entries
+        self.entries: dict[str, SlowQuery] = {}
+        self._explaining: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def attach(self, target) -> None:
+        """Watch every statement run through ``target`` (an AsyncEngine)."""
+
+        def before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+        def after(conn, cursor, statement, parameters, context, executemany):
+            elapsed_ms = (time.perf_counter() - conn.info["slow_query_start"].pop()) * 1000
+            if elapsed_ms >= self.threshold_ms and not _in_explain.get():
+                self.record(statement, None if executemany else parameters, elapsed_ms, target)
+
+        event.listen(target.sync_engine, "before_cursor_execute", before)
+        event.listen(target.sync_engine, "after_cursor_execute", after)
+
+    def record(self, statement: str, parameters, elapsed_ms: float, target=None) -> SlowQuery:
+        shape = statement_shape(statement)
+        entry = self.entries.get(shape)
+        if entry is None:
+            if len(self.entries) >= self.max_entries:
+                # Forget the shape that has cost the least so far
+                del self.entries[min(self.entries.values(), key=lambda e: e.total_ms).shape]
+            entry = self.entries[shape] = SlowQuery(shape)
+
+        scope = _request_scope.get()
+        route = route_template(scope) if scope is not None else "background"
+        entry.count += 1
+        entry.total_ms += elapsed_ms
+        entry.max_ms = max(entry.max_ms, elapsed_ms)
+        entry.last_ms = elapsed_ms
+        entry.last_seen = datetime.now(timezone.utc)
+        entry.last_route = route
+        entry.routes.add(route)
+        entry.parameters = redact_parameters(parameters)
+        logger.warning("Slow query (%.0f ms) on %s: %s", elapsed_ms, route, shape[:300])
+
+        if target is not None:
+            self._maybe_explain(entry, statement, parameters, target)
+        return entry
+
+    def _maybe_explain(self, entry: SlowQuery, statement: str, parameters, target) -> None:
+        if (
+            not self.explain
+            or entry.plan is not None
+            or entry.shape in self._explaining
+            or len(self._explaining) >= MAX_CONCURRENT_EXPLAINS
+            or parameters is None
+            or target.dialect.name != "postgresql"
+            or not _EXPLAINABLE.match(statement)
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._explaining.add(entry.shape)
+        # A fresh context: the EXPLAIN is not part of the request that was slow
+        task = loop.create_task(self._explain(entry, statement, parameters, target), context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, entry: SlowQuery, statement: str, parameters, target) -> None:
+        _in_explain.set(True)
+        try:
+            async with target.connect() as conn:
+                result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE off, FORMAT JSON) {statement}", parameters)
+                plan = result.scalar()
+            entry.plan = json.loads(plan) if isinstance(plan, str) else plan
+            entry.explain_error = None
+        except Exception as e:
+            entry.explain_error = str(e)[:500]
+            logger.debug("EXPLAIN failed for slow query: %s", e)
+        finally:
+            self._explaining.discard(entry.shape)
+
+    def report(self, limit: int = 50) -> list[dict]:
+        """Slowest shapes by total time."""
+        ranked = sorted(self.entries.values(), key=lambda e: e.total_ms, reverse=True)
+        return [entry.to_dict() for entry in ranked[:limit]]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+slow_query_log = SlowQueryLog(
+    settings.slow_query_threshold_ms,
+    explain=settings.slow_query_explain,
+    max_entries=settings.slow_query_max_entries,
+)
+
+
+class SlowQueryMiddleware:
+    """Pure ASGI middleware letting slow statements be attributed to their route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
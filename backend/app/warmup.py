@@ -0,0 +1,103 @@
+"""Startup warm-up: prime the database pools and hot caches before serving.
+
+uvicorn only accepts connections once lifespan startup has finished, so
+running this there means the first requests after a deploy find open
+database connections, filled response caches and Google's signing keys
+instead of paying for them. Warm-up is best effort: failures are logged
+and startup continues, and the whole step is bounded by
+WARMUP_TIMEOUT_SECONDS.
+"""
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy import text
+
+from app.cache import CACHE_RULES
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger("kolamba.warmup")
+
+
+async def prime_pool(target, connections: int) -> int:
+    """Open ``connections`` pooled connections at once, then return them to the pool."""
+
+    async def touch():
+        async with target.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(touch() for _ in range(connections)))
+    return connections
+
+
+async def _get(app, path: str) -> int:
+    """Run an in-process GET through the whole middleware stack. Returns the status."""
+    status = 500
+    received = False
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # Never disconnects; cancelled once the response is sent
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app({
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"warmup"), (b"x-request-id", b"warmup")],
+        "client": ("127.0.0.1", 0),
+        "server": ("warmup", 80),
+        "app": app,
+    }, receive, send)
+    return status
+
+
+async def prime_response_cache(app) -> int:
+    """Render every cached public endpoint once. Returns how many answered 200."""
+    statuses = [await _get(app, path) for path in CACHE_RULES]
+    return sum(status == 200 for status in statuses)
+
+
+async def _warm_up(app) -> dict:
+    from app.database import engine, read_engine
+
+    done = {}
+    connections = min(settings.warmup_pool_connections, settings.db_pool_size)
+    done["pool"] = await prime_pool(engine, connections)
+    if read_engine is not None:
+        done["read_pool"] = await prime_pool(read_engine, connections)
+    done["cached_routes"] = await prime_response_cache(app)
+    if settings.google_client_id:
+        from app.services.google_auth import google_token_verifier
+
+        await google_token_verifier.refresh()
+        done["google_keys"] = google_token_verifier.has_keys
+    return done
+
+
+async def warm_up(app) -> None:
+    """Prime pools and caches, giving up after WARMUP_TIMEOUT_SECONDS."""
+    start = time.perf_counter()
+    try:
+        done = await asyncio.wait_for(_warm_up(app), timeout=settings.warmup_timeout_seconds)
+    except asyncio.TimeoutError:
+        logger.warning("Warm-up timed out after %.1fs; serving anyway", settings.warmup_timeout_seconds)
+    except Exception as e:
+        logger.warning("Warm-up failed, serving anyway: %s", e)
+    else:
+        logger.info("Warm-up done in %.0fms: %s", (time.perf_counter() - start) * 1000, done)
@@ -1,14 +1,19 @@
 """Shared test fixtures for Kolamba backend tests."""
 
 import uuid
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
-from app.database import Base, get_db
+from app.cache import response_cache
+from app.database import Base, get_db, get_read_db, get_read_session_factory
 from app.main import app
+from app.query_stats import QueryStats, instrument_engine, track_queries
+from app.routers.admin import stats_snapshot
 from app.config import get_settings
 from app.utils.security import get_password_hash, create_access_token
 
@@ -24,6 +29,7 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     with pytest-asyncio's runner system (v1.x uses per-test Runners).
     """
     engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    instrument_engine(engine)
 
     # Ensure tables exist (idempotent — no-op if already created)
     async with engine.begin() as conn:
@@ -43,15 +49,69 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     await engine.dispose()
 
 
+_request_queries_key = pytest.StashKey[list]()
+
+
+@pytest.fixture
+def request_queries(request) -> list[tuple[str, str, QueryStats]]:
+    """(method, path, stats) for every request made through ``client``."""
+    log: list[tuple[str, str, QueryStats]] = []
+    request.node.stash[_request_queries_key] = log
+    return log
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Enforce ``@pytest.mark.query_budget(n)``: no request may run more than n statements."""
+    outcome = yield
+    marker = item.get_closest_marker("query_budget")
+    if marker is None or outcome.excinfo is not None:
+        return
+    budget = marker.args[0]
+    over = [
+        (method, path, stats)
+        for method, path, stats in item.stash.get(_request_queries_key, [])
+        if stats.queries > budget
+    ]
+    if over:
+        lines = [f"Query budget of {budget} exceeded:"]
+        for method, path, stats in over:
+            lines.append(f"  {method} {path}: {stats.queries} queries")
+            for shape, count in stats.repeated(2):
+                lines.append(f"    {count}x {shape[:200]}")
+        pytest.fail("\n".join(lines), pytrace=False)
+
+
 @pytest_asyncio.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Provide an async HTTP test client with overridden DB dependency."""
+async def client(db_session: AsyncSession, request_queries: list) -> AsyncGenerator[AsyncClient, None]:
+    """Provide an async HTTP test client with overridden DB dependency.
+
+    Statements run by each request are recorded in ``request_queries``.
+    """
 
     async def override_get_db():
         yield db_session
 
+    @asynccontextmanager
+    async def test_session():
+        yield db_session
+
     app.dependency_overrides[get_db] = override_get_db
-    transport = ASGITransport(app=app)
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_read_session_factory] = lambda: test_session
+    # Cached responses must not leak between tests' rolled-back databases
+    await response_cache.clear()
+    stats_snapshot.clear()
+
+    async def recording_app(scope, receive, send):
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+        with track_queries(statements=True) as stats:
+            await app(scope, receive, send)
+        request_queries.append((scope["method"], scope["path"], stats))
+
+    transport = ASGITransport(app=recording_app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
     app.dependency_overrides.clear()
@@ -0,0 +1,276 @@
+"""Latency and query-count regression suite for the busiest API routes.
+
+Run with: cd backend && python -m scripts.bench_endpoints [options]
+
+    --database-url URL    a migrated database for benchmarks only;
+                          default BENCH_DATABASE_URL, then DATABASE_URL
+    --runs 20             timed requests per route, after --warmup
+    --save                store the results as the new baseline
+    --queries-only        with --save, store query counts but not latencies
+    --check               exit 1 if a route runs more queries than baseline, or
+                          got slower where the baseline has latencies
+    --tolerance 1.0       allowed p50 slowdown (1.0 = twice as slow)
+
+The app is served in-process through httpx.ASGITransport, so the numbers
+are the handler's own cost plus the middleware, without a network or
+server in between. Rate limiting and the response cache are bypassed:
+every request reaches its handler.
+
+On first use the database is filled with a fixed scripts.seed_scale
+dataset (tag "bench"); later runs reuse it, so keep the database for
+benchmarks only. Requests run in one transaction that is rolled back,
+so writes don't accumulate between runs.
+
+Baselines live in scripts/baselines/endpoints.json. Query counts are
+exact and portable, and the committed baseline holds only those (saved
+with --queries-only), so --check catches extra queries anywhere.
+Latencies are only comparable on the machine that recorded them, as with
+scripts.bench_tour_grouping: --save without --queries-only on the machine
+you check from to also catch slowdowns.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+import asyncpg
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.cache import response_cache
+from app.config import get_settings
+from app.database import get_db, get_read_db, get_read_session_factory
+from app.main import app
+from app.query_stats import instrument_engine, track_queries
+from app.rate_limit import limiter
+from app.routers.admin import stats_snapshot
+from app.utils.security import create_access_token
+from scripts import seed_scale
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "endpoints.json"
+SEED_TAG = "bench"
+SEED_ARGS = ["--artists", "300", "--communities", "800", "--bookings", "20000", "--seed", "46", "--tag", SEED_TAG]
+
+
+@dataclass
+class Endpoint:
+    label: str
+    method: str
+    path: str
+    actor: Optional[str] = None  # "host" or "artist"; anonymous when None
+    params: Optional[dict] = None
+    json: Optional[dict] = None
+
+
+def endpoints(ids: dict) -> list[Endpoint]:
+    """The routes under watch, filled in with the benchmark actors' ids."""
+    artist, community, booking, conversation = ids["artist"], ids["community"], ids["booking"], ids["conversation"]
+    future = (date.today() + timedelta(days=60)).isoformat()
+    return [
+        Endpoint("GET /api/talents", "GET", "/api/talents"),
+        Endpoint("GET /api/talents/featured", "GET", "/api/talents/featured"),
+        Endpoint("GET /api/talents/{id}", "GET", f"/api/talents/{artist}"),
+        Endpoint("GET /api/talents/{id}/schedule", "GET", f"/api/talents/{artist}/schedule"),
+        Endpoint("GET /api/search/artists", "GET", "/api/search/artists", params={"q": "Seed"}),
+        Endpoint("GET /api/categories", "GET", "/api/categories"),
+        Endpoint("GET /api/hosts/locations", "GET", "/api/hosts/locations"),
+        Endpoint("GET /api/hosts/{id}", "GET", f"/api/hosts/{community}"),
+        Endpoint("GET /api/hosts/{id}/discover-artists", "GET", f"/api/hosts/{community}/discover-artists", "host"),
+        Endpoint("GET /api/hosts/{id}/tour-opportunities", "GET", f"/api/hosts/{community}/tour-opportunities", "host"),
+        Endpoint("GET /api/hosts/{id}/nearby-touring-artists", "GET", f"/api/hosts/{community}/nearby-touring-artists", "host"),
+        Endpoint("GET /api/tours/suggestions", "GET", "/api/tours/suggestions", "artist", params={"artist_id": artist}),
+        Endpoint("GET /api/bookings", "GET", "/api/bookings", "artist"),
+        Endpoint("GET /api/bookings/my-bookings", "GET", "/api/bookings/my-bookings", "host"),
+        Endpoint("GET /api/bookings/{id}", "GET", f"/api/bookings/{booking}", "host"),
+        Endpoint("POST /api/bookings", "POST", "/api/bookings", "host", json={
+            "artist_id": artist, "requested_date": future, "budget": 2500, "notes": "Benchmark booking",
+        }),
+        Endpoint("GET /api/conversations", "GET", "/api/conversations", "host"),
+        Endpoint("GET /api/conversations/{id}/messages", "GET", f"/api/conversations/{conversation}/messages", "host"),
+        Endpoint("POST /api/conversations/{id}/messages", "POST", f"/api/conversations/{conversation}/messages", "host",
+                 json={"content": "Benchmark message"}),
+        Endpoint("GET /api/notifications/count", "GET", "/api/notifications/count", "host"),
+    ]
+
+
+async def prepare(connect_kwargs: dict) -> dict:
+    """Seed the benchmark dataset if missing and pick the actors. Returns ids and tokens."""
+    conn = await asyncpg.connect(**connect_kwargs)
+    try:
+        seeded = await conn.fetchval("SELECT 1 FROM users WHERE email = $1", f"community-1@{SEED_TAG}.seed.invalid")
+    finally:
+        await conn.close()
+    if not seeded:
+        print("Seeding the benchmark dataset (once per database)...")
+        await seed_scale.seed(seed_scale.parse_args(SEED_ARGS), connect_kwargs)
+
+    conn = await asyncpg.connect(**connect_kwargs)
+    try:
+        # The busiest seeded host and artist with a conversation between them: the worst case for dashboards
+        row = await conn.fetchrow("""
+            SELECT b.id AS booking, cv.id AS conversation, c.id AS community, c.user_id AS host_user_id,
+                   a.id AS artist, a.user_id AS artist_user_id
+            FROM bookings b
+            JOIN conversations cv ON cv.booking_id = b.id
+            JOIN communities c ON c.id = b.community_id JOIN users cu ON cu.id = c.user_id
+            JOIN artists a ON a.id = b.artist_id JOIN users au ON au.id = a.user_id
+            WHERE cu.email LIKE $1 AND a.status = 'active'
+            ORDER BY (SELECT count(*) FROM bookings WHERE artist_id = a.id) DESC,
+                     (SELECT count(*) FROM bookings WHERE community_id = c.id) DESC, b.id
+            LIMIT 1
+        """, f"%@{SEED_TAG}.seed.invalid")
+    finally:
+        await conn.close()
+    if row is None:
+        raise SystemExit("No seeded booking with a conversation found; drop the database and run again")
+
+    ids = dict(row)
+    ids["tokens"] = {
+        "host": create_access_token({"sub": row["host_user_id"], "role": "community"}),
+        "artist": create_access_token({"sub": row["artist_user_id"], "role": "artist"}),
+    }
+    return ids
+
+
+async def measure(url: str, ids: dict, runs: int, warmup: int) -> dict[str, dict]:
+    engine = create_async_engine(url)
+    instrument_engine(engine)
+    limiter.enabled = False
+    results: dict[str, dict] = {}
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+
+            async def override_get_db():
+                yield session
+
+            @asynccontextmanager
+            async def bench_session():
+                yield session
+
+            app.dependency_overrides[get_db] = override_get_db
+            app.dependency_overrides[get_read_db] = override_get_db
+            app.dependency_overrides[get_read_session_factory] = lambda: bench_session
+
+            last: dict = {}
+
+            async def recording_app(scope, receive, send):
+                if scope["type"] != "http":
+                    await app(scope, receive, send)
+                    return
+                with track_queries() as stats:
+                    await app(scope, receive, send)
+                last["queries"] = stats.queries
+
+            try:
+                async with AsyncClient(transport=ASGITransport(app=recording_app), base_url="http://bench") as client:
+                    for endpoint in endpoints(ids):
+                        headers = {"Authorization": f"Bearer {ids['tokens'][endpoint.actor]}"} if endpoint.actor else {}
+                        timings, queries = [], 0
+                        for i in range(warmup + runs):
+                            session.expunge_all()  # Each request loads its rows afresh
+                            await response_cache.clear()
+                            stats_snapshot.clear()
+                            start = time.perf_counter()
+                            response = await client.request(
+                                endpoint.method, endpoint.path, params=endpoint.params, json=endpoint.json, headers=headers,
+                            )
+                            elapsed = time.perf_counter() - start
+                            if response.status_code >= 400:
+                                raise SystemExit(f"{endpoint.label} returned {response.status_code}: {response.text[:300]}")
+                            if i >= warmup:
+                                timings.append(elapsed * 1000)
+                                queries = max(queries, last["queries"])
+                        timings.sort()
+                        results[endpoint.label] = {
+                            "p50_ms": round(statistics.median(timings), 3),
+                            "p95_ms": round(timings[min(int(len(timings) * 0.95), len(timings) - 1)], 3),
+                            "queries": queries,
+                        }
+                        row = results[endpoint.label]
+                        print(f"  {endpoint.label:<48} {row['p50_ms']:9.2f} {row['p95_ms']:9.2f} {queries:>8}")
+            finally:
+                app.dependency_overrides.clear()
+                await session.close()
+                await transaction.rollback()
+    finally:
+        limiter.enabled = True
+        await engine.dispose()
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Routes that run more queries, or whose p50 grew by more than ``tolerance`` (1.0 = 2x).
+
+    Latency is only compared for routes whose baseline records it.
+    """
+    regressions = []
+    for label, row in results.items():
+        expected = baseline.get(label)
+        if not expected:
+            continue
+        if row["queries"] > expected["queries"]:
+            regressions.append(f"{label}: {row['queries']} queries vs baseline {expected['queries']}")
+        if expected.get("p50_ms") and row["p50_ms"] > expected["p50_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{label}: p50 {row['p50_ms']:.2f} ms vs baseline {expected['p50_ms']:.2f} ms "
+                f"({row['p50_ms'] / expected['p50_ms']:.1f}x)"
+            )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    url = args.database_url or os.getenv("BENCH_DATABASE_URL") or get_settings().database_url
+    engine = create_async_engine(url)
+    _, connect_kwargs = engine.dialect.create_connect_args(engine.url)
+    await engine.dispose()
+    ids = await prepare(connect_kwargs)
+
+    print(f"{'route':<50} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8}")
+    results = await measure(url, ids, args.runs, args.warmup)
+
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    if args.save:
+        saved = {label: {"queries": row["queries"]} for label, row in results.items()} if args.queries_only else results
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps({**baseline, **saved}, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline saved to {BASELINE_PATH}")
+
+    if args.check:
+        if not baseline:
+            print("\nNo baseline to check against: run with --save first")
+            return 1
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline")
+    return 0
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--queries-only", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=1.0)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,285 @@
+"""Benchmarks for JSON rendering of the large list endpoints.
+
+Run with: cd backend && python -m scripts.bench_serialization [options]
+
+    --sizes 1000 10000    rows per case (default)
+    --save                store the results as the new baseline
+    --check               exit 1 if a fast path is slower than baseline by more than --tolerance
+
+Each case renders the same synthetic rows twice, from the handler's rows
+to response bytes. ``before`` is FastAPI's usual path: one Pydantic
+model per row in the handler, ``response_model`` validation and
+serialization (or ``jsonable_encoder`` for routes without a model), then
+``JSONResponse``. ``after`` is what the route does now, through
+app.serialization. No database is involved.
+
+Baselines live in scripts/baselines/serialization.json and hold the
+``after`` timings. As with scripts.bench_tour_grouping, they are only
+comparable on the machine that recorded them.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.routers.communities import MapLocation, community_locations
+from app.routers.conversations import inbox_serializer
+from app.schemas.conversation import ConversationListItem
+from app.schemas.discover import DiscoverArtistItem, DiscoverResponse
+from app.serialization import ORJSONResponse
+from scripts.synthetic import synthetic_communities
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "serialization.json"
+DEFAULT_SIZES = (1_000, 10_000)
+NOW = datetime(2026, 9, 1, tzinfo=timezone.utc)  # Fixed so every run renders the same bytes
+SEED = 50
+DISCOVER_PAGE = 12
+
+Case = Callable[[], Awaitable[bytes]]
+
+
+async def _best_of(run: Case, budget: float = 2.0, max_repeat: int = 5) -> float:
+    """Fastest of up to ``max_repeat`` runs, stopping once ``budget`` seconds are spent."""
+    best, spent, runs = float("inf"), 0.0, 0
+    while runs < max_repeat and (runs == 0 or spent < budget):
+        start = time.perf_counter()
+        await run()
+        elapsed = time.perf_counter() - start
+        best, spent, runs = min(best, elapsed), spent + elapsed, runs + 1
+    return best
+
+
+async def _fastapi_body(content, response_model=None) -> bytes:
+    """What FastAPI does with a handler's return value before the bytes go out."""
+    field = create_response_field(name="bench", type_=response_model) if response_model else None
+    return JSONResponse(await serialize_response(field=field, response_content=content, is_coroutine=True)).body
+
+
+def map_rows(n: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=i + 1,
+            name=c["name"],
+            latitude=Decimal(str(c["latitude"])),
+            longitude=Decimal(str(c["longitude"])),
+            location=c["location"],
+        )
+        for i, c in enumerate(synthetic_communities(n, SEED))
+    ]
+
+
+def inbox_rows(n: int) -> list[SimpleNamespace]:
+    rng = random.Random(SEED)
+    return [
+        SimpleNamespace(
+            id=i + 1,
+            booking_id=i + 1,
+            last_message_preview=f"Message {rng.randrange(10_000)} about the booking",
+            last_message_at=NOW - timedelta(minutes=rng.randrange(100_000)),
+            last_sender_id=rng.randrange(1, 500),
+            message_count=rng.randrange(1, 80),
+            updated_at=NOW - timedelta(minutes=rng.randrange(100_000)),
+            status=rng.choice(("pending", "approved", "rejected", "completed")),
+            name_en=rng.choice((None, f"Artist {i}")),
+            name_he=f"אמן {i}",
+            name=f"Community {i}",
+        )
+        for i in range(n)
+    ]
+
+
+def admin_users(n: int) -> list[dict]:
+    rng = random.Random(SEED)
+    return [
+        {
+            "id": i + 1,
+            "email": f"user{i}@example.com",
+            "name": f"User {i}",
+            "role": role,
+            "status": "active",
+            "is_active": True,
+            "is_superuser": False,
+            "created_at": (NOW - timedelta(days=rng.randrange(1000))).isoformat(),
+            "artist_id": i + 1 if role == "artist" else None,
+            "categories": ["Music", "Comedy"] if role == "artist" else None,
+            "community_type": "Synagogue" if role == "community" else None,
+            "location": "London, United Kingdom" if role != "agent" else None,
+            "community_name": f"Community {i}" if role == "community" else None,
+            "managed_count": 3 if role == "agent" else None,
+        }
+        for i in range(n)
+        for role in [rng.choice(("artist", "community", "agent"))]
+    ]
+
+
+def discover_artists(n: int) -> list[SimpleNamespace]:
+    rng = random.Random(SEED)
+    categories = [
+        {"id": i, "name_he": f"קטגוריה {i}", "name_en": f"Category {i}", "slug": f"category-{i}", "icon": None, "sort_order": i}
+        for i in range(1, 9)
+    ]
+    return [
+        SimpleNamespace(
+            id=i + 1,
+            name_he=f"אמן {i}",
+            name_en=f"Artist {i}",
+            bio_en="Performer and teacher. " * 8,
+            profile_image=f"https://res.cloudinary.com/demo/image/upload/{i}.jpg",
+            price_single=rng.randrange(500, 8000, 50),
+            city="Tel Aviv",
+            country="Israel",
+            is_featured=rng.random() < 0.05,
+            categories=rng.sample(categories, 2),
+            subcategories=["klezmer"],
+            interest_score=round(rng.random(), 2),
+        )
+        for i in range(n)
+    ]
+
+
+def _discover_item(artist: SimpleNamespace) -> DiscoverArtistItem:
+    return DiscoverArtistItem(
+        id=artist.id,
+        name_he=artist.name_he,
+        name_en=artist.name_en,
+        bio_en=artist.bio_en,
+        profile_image=artist.profile_image,
+        price_single=artist.price_single,
+        city=artist.city,
+        country=artist.country,
+        is_featured=artist.is_featured,
+        categories=artist.categories,
+        subcategories=artist.subcategories,
+        interest_score=artist.interest_score,
+    )
+
+
+def cases(n: int) -> dict[str, dict[str, Case]]:
+    locations, inbox, users, artists = map_rows(n), inbox_rows(n), admin_users(n), discover_artists(n)
+
+    async def map_before():
+        items = [
+            MapLocation(
+                id=row.id, name=row.name, latitude=float(row.latitude), longitude=float(row.longitude),
+                type="community", details=row.location,
+            )
+            for row in locations
+        ]
+        return await _fastapi_body(items, list[MapLocation])
+
+    async def map_after():
+        return ORJSONResponse(community_locations.rows(locations)).body
+
+    async def inbox_before():
+        items = [
+            ConversationListItem(
+                id=row.id, booking_id=row.booking_id, artist_name=row.name_en or row.name_he,
+                community_name=row.name, last_message=row.last_message_preview,
+                last_message_at=row.last_message_at, last_sender_id=row.last_sender_id,
+                message_count=row.message_count, booking_status=row.status, updated_at=row.updated_at,
+            )
+            for row in inbox
+        ]
+        return await _fastapi_body(items, list[ConversationListItem])
+
+    async def inbox_after():
+        return inbox_serializer.response(inbox).body
+
+    async def users_before():
+        return await _fastapi_body(users)
+
+    async def users_after():
+        return ORJSONResponse(users).body
+
+    def _relevance(x):
+        return (not x.is_featured, -x.interest_score, (x.name_en or x.name_he).lower())
+
+    async def discover_before():
+        items = sorted((_discover_item(artist) for artist in artists), key=_relevance)
+        page = DiscoverResponse(artists=items[:DISCOVER_PAGE], total=len(items))
+        return await _fastapi_body(page, DiscoverResponse)
+
+    async def discover_after():
+        ranked = sorted(artists, key=_relevance)
+        page = DiscoverResponse(artists=[_discover_item(a) for a in ranked[:DISCOVER_PAGE]], total=len(ranked))
+        return await _fastapi_body(page, DiscoverResponse)
+
+    return {
+        "map_locations": {"before": map_before, "after": map_after},
+        "list_conversations": {"before": inbox_before, "after": inbox_after},
+        "admin_list_users": {"before": users_before, "after": users_after},
+        "discover_artists": {"before": discover_before, "after": discover_after},
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Fast paths slower than their baseline by more than ``tolerance`` (0.25 = 25%)."""
+    regressions = []
+    for case, sizes in results.items():
+        for size, seconds in sizes.items():
+            expected = baseline.get(case, {}).get(size)
+            if expected is not None and seconds > expected * (1 + tolerance):
+                regressions.append(
+                    f"{case} @ {size}: {seconds * 1000:.2f} ms vs baseline {expected * 1000:.2f} ms "
+                    f"(+{(seconds / expected - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    results: dict[str, dict[str, float]] = {}
+
+    print(f"{'case':<22} {'rows':>7}  {'before':>10}  {'after':>10}  {'speedup':>7}")
+    for size in sorted(args.sizes):
+        for case, runs in cases(size).items():
+            before = await _best_of(runs["before"])
+            after = await _best_of(runs["after"])
+            if case != "discover_artists":
+                # Same bytes modulo float formatting and key order
+                assert json.loads(await runs["before"]()) == json.loads(await runs["after"]()), case
+            results.setdefault(case, {})[str(size)] = round(after, 6)
+            print(
+                f"  {case:<20} {size:>7}  {before * 1000:7.2f} ms  {after * 1000:7.2f} ms  {before / after:6.1f}x"
+            )
+
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    if args.save:
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        merged = {case: {**baseline.get(case, {}), **sizes_} for case, sizes_ in results.items()}
+        BASELINE_PATH.write_text(json.dumps({**baseline, **merged}, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline saved to {BASELINE_PATH}")
+
+    if args.check:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline")
+    return 0
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,266 @@
+"""Benchmarks for app.services.tour_grouping on synthetic geo data.
+
+Run with: cd backend && python -m scripts.bench_tour_grouping [options]
+
+    --sizes 100 1000 10000 100000   rows per case (default)
+    --db sqlite postgres            backends for suggest_tours (default: sqlite)
+    --postgres-url URL              default: BENCH_DATABASE_URL, then DATABASE_URL
+    --max-seconds 30                skip a size whose estimated time exceeds this
+    --save                          store the results as the new baseline
+    --check                         exit 1 if a case is slower than baseline by more than --tolerance
+
+Baselines live in scripts/baselines/tour_grouping.json, keyed by case and
+size. They are only comparable on the machine that recorded them: re-save
+after changing hardware, then check on every change to tour_grouping.
+
+Postgres runs insert their rows in a transaction that is rolled back.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.database import Base
+from app.models.artist import Artist
+from app.models.booking import Booking
+from app.models.community import Community
+from app.models.user import User
+from app.services.tour_grouping import (
+    calculate_total_distance,
+    calculate_tour_score,
+    filter_bookings_by_date_window,
+    find_nearby_communities,
+    suggest_tours,
+)
+from scripts.synthetic import synthetic_bookings, synthetic_communities
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "tour_grouping.json"
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+START = date(2026, 9, 1)  # Fixed so every run sees the same dates
+SEED = 42
+MAX_DISTANCE_KM = 500
+
+
+# SQLite has no ARRAY/JSONB; the benchmark never writes those columns.
+@compiles(ARRAY, "sqlite")
+@compiles(JSONB, "sqlite")
+def _sqlite_json(type_, compiler, **kw):
+    return "JSON"
+
+
+def _best_of(run: Callable[[], object], budget: float = 2.0, max_repeat: int = 5) -> float:
+    """Fastest of up to ``max_repeat`` runs, stopping once ``budget`` seconds are spent."""
+    best, spent, runs = float("inf"), 0.0, 0
+    while runs < max_repeat and (runs == 0 or spent < budget):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best, spent, runs = min(best, elapsed), spent + elapsed, runs + 1
+    return best
+
+
+async def _best_of_async(run: Callable[[], Awaitable], budget: float = 2.0, max_repeat: int = 5) -> float:
+    best, spent, runs = float("inf"), 0.0, 0
+    while runs < max_repeat and (runs == 0 or spent < budget):
+        start = time.perf_counter()
+        await run()
+        elapsed = time.perf_counter() - start
+        best, spent, runs = min(best, elapsed), spent + elapsed, runs + 1
+    return best
+
+
+def _estimate(results: dict, case: str, size: int) -> Optional[float]:
+    """Quadratic extrapolation from the largest smaller size measured."""
+    measured = [(n, t) for n, t in results.get(case, {}).items() if int(n) < size and t is not None]
+    if not measured:
+        return None
+    n, t = max(measured, key=lambda item: int(item[0]))
+    return t * (size / int(n)) ** 2
+
+
+def pure_cases(communities: list[dict], bookings: list[dict]) -> dict[str, Callable[[int], Callable[[], object]]]:
+    """Case name -> function building the timed callable for a size."""
+    booking_objects = [SimpleNamespace(**b) for b in bookings]
+
+    def score(n: int):
+        subset = communities[:n]
+        distance = calculate_total_distance(subset[:200])
+        return lambda: calculate_tour_score(subset, bookings[:n], distance)
+
+    return {
+        "find_nearby_communities": lambda n: lambda: find_nearby_communities(communities[:n], MAX_DISTANCE_KM),
+        "calculate_total_distance": lambda n: lambda: calculate_total_distance(communities[:n]),
+        "filter_bookings_by_date_window": lambda n: lambda: filter_bookings_by_date_window(booking_objects[:n], 30),
+        "calculate_tour_score": score,
+    }
+
+
+async def _load(session: AsyncSession, communities: list[dict], bookings: list[dict]) -> int:
+    """Insert one artist and the synthetic communities and bookings. Returns the artist id."""
+    dialect = session.bind.dialect.name
+    users = [{"email": f"bench-{i}@bench.invalid", "name": "Bench", "role": "community"} for i in range(len(communities))]
+    user_ids = (await session.scalars(
+        insert(User).returning(User.id, sort_by_parameter_order=True), users
+    )).all()
+
+    if dialect == "sqlite":
+        artist_id = 1  # Foreign keys are not enforced; the artists table isn't created
+    else:
+        artist_user_id = await session.scalar(
+            insert(User).values(email="bench-artist@bench.invalid", name="Bench Artist", role="artist").returning(User.id)
+        )
+        artist_id = await session.scalar(
+            insert(Artist).values(user_id=artist_user_id, name_he="אמן", name_en="Bench Artist", status="active").returning(Artist.id)
+        )
+
+    rows = [
+        {
+            "user_id": user_id,
+            "name": c["name"],
+            "location": c["location"],
+            "latitude": c["latitude"],
+            "longitude": c["longitude"],
+            "status": "active",
+        }
+        for user_id, c in zip(user_ids, communities)
+    ]
+    community_ids = (await session.scalars(
+        insert(Community).returning(Community.id, sort_by_parameter_order=True), rows
+    )).all()
+    await session.execute(insert(Booking), [
+        {
+            "artist_id": artist_id,
+            "community_id": community_ids[b["community_index"]],
+            "requested_date": b["requested_date"],
+            "budget": b["budget"],
+            "status": b["status"],
+        }
+        for b in bookings
+    ])
+    await session.flush()
+    return artist_id
+
+
+async def bench_suggest_tours(url: str, sizes: list[int], results: dict, max_seconds: float, label: str) -> None:
+    engine = create_async_engine(url)
+    case = f"suggest_tours[{label}]"
+    try:
+        async with engine.connect() as conn:
+            if label == "sqlite":
+                await conn.run_sync(
+                    Base.metadata.create_all,
+                    tables=[User.__table__, Community.__table__, Booking.__table__],
+                )
+                await conn.commit()
+            for size in sizes:
+                estimate = _estimate(results, case, size)
+                if estimate is not None and estimate > max_seconds:
+                    print(f"  {case:<40} {size:>7}  skipped (estimated {estimate:.0f}s)")
+                    continue
+                communities = synthetic_communities(size, SEED)
+                bookings = synthetic_bookings(size, size, SEED, start=START)
+                transaction = await conn.begin()
+                try:
+                    session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+                    artist_id = await _load(session, communities, bookings)
+
+                    async def run():
+                        session.expunge_all()  # Each run loads its bookings afresh
+                        await suggest_tours(session, artist_id, max_distance_km=MAX_DISTANCE_KM)
+
+                    seconds = await _best_of_async(run, max_repeat=3)
+                    await session.close()
+                finally:
+                    await transaction.rollback()
+                results.setdefault(case, {})[str(size)] = round(seconds, 6)
+                print(f"  {case:<40} {size:>7}  {seconds * 1000:10.2f} ms")
+    finally:
+        await engine.dispose()
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Cases slower than their baseline by more than ``tolerance`` (0.25 = 25%)."""
+    regressions = []
+    for case, sizes in results.items():
+        for size, seconds in sizes.items():
+            expected = baseline.get(case, {}).get(size)
+            if expected and seconds > expected * (1 + tolerance):
+                regressions.append(
+                    f"{case} @ {size}: {seconds * 1000:.2f} ms vs baseline {expected * 1000:.2f} ms "
+                    f"(+{(seconds / expected - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    sizes = sorted(args.sizes)
+    communities = synthetic_communities(max(sizes), SEED)
+    bookings = synthetic_bookings(max(sizes), max(sizes), SEED, start=START)
+    results: dict[str, dict[str, float]] = {}
+
+    print(f"{'case':<42} {'rows':>7}  {'best':>13}")
+    for case, build in pure_cases(communities, bookings).items():
+        for size in sizes:
+            estimate = _estimate(results, case, size)
+            if estimate is not None and estimate > args.max_seconds:
+                print(f"  {case:<40} {size:>7}  skipped (estimated {estimate:.0f}s)")
+                continue
+            seconds = _best_of(build(size))
+            results.setdefault(case, {})[str(size)] = round(seconds, 6)
+            print(f"  {case:<40} {size:>7}  {seconds * 1000:10.2f} ms")
+
+    for backend in args.db:
+        if backend == "sqlite":
+            url = "sqlite+aiosqlite:///:memory:"
+        else:
+            url = args.postgres_url or os.getenv("BENCH_DATABASE_URL") or os.getenv("DATABASE_URL")
+            if not url:
+                from app.config import get_settings
+
+                url = get_settings().database_url
+        await bench_suggest_tours(url, sizes, results, args.max_seconds, backend)
+
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    if args.save:
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        merged = {case: {**baseline.get(case, {}), **sizes_} for case, sizes_ in results.items()}
+        BASELINE_PATH.write_text(json.dumps({**baseline, **merged}, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline saved to {BASELINE_PATH}")
+
+    if args.check:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline")
+    return 0
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--db", nargs="*", choices=("sqlite", "postgres"), default=["sqlite"])
+    parser.add_argument("--postgres-url")
+    parser.add_argument("--max-seconds", type=float, default=30.0)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
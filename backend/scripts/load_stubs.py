@@ -0,0 +1,91 @@
+"""Local stand-ins for Resend, Cloudinary and Nominatim during load tests.
+
+Run with: cd backend && python -m scripts.load_stubs [--port 9100] [--latency-ms 50]
+
+Point the API under test at it so a load test neither sends real email,
+uploads media nor hits Nominatim's 1 request/second policy:
+
+    RESEND_API_URL=http://localhost:9100
+    CLOUDINARY_UPLOAD_PREFIX=http://localhost:9100
+    GEOCODING_URL=http://localhost:9100/search
+
+--latency-ms adds a fixed delay to every response, to approximate the
+real services' round trip.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import uuid
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+_ids = itertools.count(1)
+
+
+def create_app(latency_ms: float = 0.0) -> FastAPI:
+    app = FastAPI(title="Kolamba load-test stubs")
+    app.state.calls = {"emails": 0, "search": 0, "upload": 0, "destroy": 0}
+
+    @app.middleware("http")
+    async def delay(request: Request, call_next):
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return await call_next(request)
+
+    @app.post("/emails")
+    async def send_email():
+        """Resend: accept and drop the message."""
+        app.state.calls["emails"] += 1
+        return {"id": str(uuid.uuid4())}
+
+    @app.get("/search")
+    async def search(q: str = ""):
+        """Nominatim: a stable point per query, somewhere in the US."""
+        app.state.calls["search"] += 1
+        digest = hashlib.sha1(q.lower().encode()).digest()
+        lat = 25 + digest[0] / 255 * 23
+        lon = -124 + digest[1] / 255 * 57
+        return [{"lat": f"{lat:.6f}", "lon": f"{lon:.6f}", "display_name": q}]
+
+    @app.post("/v1_1/{cloud_name}/{resource_type}/upload")
+    async def upload(cloud_name: str, resource_type: str):
+        """Cloudinary: pretend the upload stored a file."""
+        app.state.calls["upload"] += 1
+        public_id = f"kolamba/loadtest/{next(_ids)}"
+        return {
+            "public_id": public_id,
+            "resource_type": resource_type,
+            "secure_url": f"https://res.cloudinary.com/{cloud_name}/{resource_type}/upload/{public_id}",
+            "width": 800,
+            "height": 600,
+            "bytes": 1024,
+            "format": "jpg",
+        }
+
+    @app.post("/v1_1/{cloud_name}/{resource_type}/destroy")
+    async def destroy():
+        app.state.calls["destroy"] += 1
+        return {"result": "ok"}
+
+    @app.get("/calls")
+    async def calls():
+        """How often each stub was hit, to confirm the API is pointed here."""
+        return app.state.calls
+
+    return app
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    uvicorn.run(create_app(args.latency_ms), host=args.host, port=args.port, log_level="warning")
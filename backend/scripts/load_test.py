@@ -0,0 +1,368 @@
+"""Drive a realistic traffic mix against a running API and report latency per endpoint.
+
+Run with: cd backend && python -m scripts.load_test --base-url http://localhost:8000 [options]
+
+    --users 50                      concurrent virtual users (closed loop)
+    --duration 60                   seconds to run, after --warmup
+    --mix browse=50 host=20 booking=10 messaging=20
+                                    relative weight of each scenario
+    --think-ms 0                    pause between a user's iterations
+    --pool 200                      hosts and artists to mint tokens for
+    --database-url URL              where to find actors; default DATABASE_URL
+    --json PATH                     also write the report as JSON
+
+Scenarios:
+
+    browse     anonymous: talents list, artist search, map locations
+    host       a host's dashboard: discover-artists, tour-opportunities
+    booking    a host requests a booking, the artist quotes, the host
+               approves, declines or asks for changes
+    messaging  a participant opens the inbox, reads a thread and replies
+
+Actors come from the target's database (seed it with scripts.seed_scale)
+and are signed in with JWTs minted here, so SECRET_KEY must match the
+target's. The booking and messaging scenarios write data: never point
+this at production.
+
+Start the target with rate limiting off and the outbound services
+pointed at scripts.load_stubs, otherwise the run measures 429s, Resend,
+Cloudinary and Nominatim instead of the API:
+
+    RATE_LIMIT_ENABLED=false RESEND_API_URL=http://localhost:9100 \\
+    CLOUDINARY_UPLOAD_PREFIX=http://localhost:9100 GEOCODING_URL=http://localhost:9100/search \\
+    uvicorn app.main:app --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Awaitable, Callable, Optional
+
+import asyncpg
+import httpx
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import get_settings
+from app.utils.security import create_access_token
+
+SEARCH_TERMS = (None, "music", "comedy", "jazz", "klezmer", "israel", "dance", "cantor", "magic", "story")
+CATEGORIES = (None, "music", "comedy", "lectures", "workshops")
+RESPOND_ACTIONS = (("approve", 60), ("decline", 20), ("request_changes", 20))
+DEFAULT_MIX = {"browse": 50, "host": 20, "booking": 10, "messaging": 20}
+
+
+@dataclass
+class Actor:
+    user_id: int
+    token: str
+    entity_id: int  # Community id for hosts, artist id for artists
+
+    @property
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+@dataclass
+class Pool:
+    hosts: list[Actor]
+    artists: list[Actor]
+    # (conversation id, host actor, artist actor)
+    conversations: list[tuple[int, Actor, Actor]]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class Stats:
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    throttled: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    recording: bool = False
+
+    async def request(self, client: httpx.AsyncClient, label: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        """Send one request, timing it under ``label``. Returns None on transport errors."""
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            response = None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if self.recording:
+            self.latencies[label].append(elapsed_ms)
+            if response is None or response.status_code >= 400:
+                self.errors[label] += 1
+            if response is not None and response.status_code == 429:
+                self.throttled[label] += 1
+        return response
+
+    def report(self, seconds: float) -> dict[str, dict]:
+        rows = {}
+        for label in sorted(self.latencies):
+            values = sorted(self.latencies[label])
+            rows[label] = {
+                "count": len(values),
+                "errors": self.errors[label],
+                "throttled": self.throttled[label],
+                "rps": round(len(values) / seconds, 2) if seconds else 0.0,
+                "p50_ms": round(percentile(values, 50), 2),
+                "p95_ms": round(percentile(values, 95), 2),
+                "p99_ms": round(percentile(values, 99), 2),
+                "max_ms": round(values[-1], 2),
+            }
+        return rows
+
+
+def _ok(response: Optional[httpx.Response]) -> bool:
+    return response is not None and response.status_code < 400
+
+
+async def browse(client: httpx.AsyncClient, stats: Stats, pool: Pool, rng: random.Random) -> None:
+    params = {"limit": 20, "offset": rng.choice((0, 0, 0, 20, 40))}
+    if category := rng.choice(CATEGORIES):
+        params["category"] = category
+    await stats.request(client, "GET /api/talents", "GET", "/api/talents", params=params)
+
+    params = {"limit": 20}
+    if term := rng.choice(SEARCH_TERMS):
+        params["q"] = term
+    await stats.request(client, "GET /api/search/artists", "GET", "/api/search/artists", params=params)
+
+    if rng.random() < 0.3:
+        await stats.request(client, "GET /api/hosts/locations", "GET", "/api/hosts/locations")
+
+
+async def host_dashboard(client: httpx.AsyncClient, stats: Stats, pool: Pool, rng: random.Random) -> None:
+    host = rng.choice(pool.hosts)
+    await stats.request(
+        client, "GET /api/hosts/{id}/discover-artists", "GET", f"/api/hosts/{host.entity_id}/discover-artists",
+        params={"touring_only": rng.random() < 0.3}, headers=host.headers,
+    )
+    await stats.request(
+        client, "GET /api/hosts/{id}/tour-opportunities", "GET", f"/api/hosts/{host.entity_id}/tour-opportunities",
+        headers=host.headers,
+    )
+
+
+async def booking_flow(client: httpx.AsyncClient, stats: Stats, pool: Pool, rng: random.Random) -> None:
+    host, artist = rng.choice(pool.hosts), rng.choice(pool.artists)
+    response = await stats.request(client, "POST /api/bookings", "POST", "/api/bookings", headers=host.headers, json={
+        "artist_id": artist.entity_id,
+        "requested_date": (date.today() + timedelta(days=rng.randint(14, 300))).isoformat(),
+        "budget": rng.choice((500, 1000, 2500, 5000)),
+        "notes": "Load test booking",
+        "audience_size": rng.choice((50, 120, 300)),
+    })
+    if not _ok(response):
+        return
+    booking_id = response.json()["id"]
+
+    response = await stats.request(
+        client, "POST /api/bookings/{id}/quote", "POST", f"/api/bookings/{booking_id}/quote", headers=artist.headers,
+        json={"quote_amount": rng.choice((800, 1500, 3000)), "quote_notes": "Two sets, travel included"},
+    )
+    if not _ok(response):
+        return
+
+    actions, weights = zip(*RESPOND_ACTIONS)
+    action = rng.choices(actions, weights=weights)[0]
+    body = {"action": action}
+    if action != "approve":
+        body["decline_reason"] = "Outside our budget this season"
+    await stats.request(
+        client, "POST /api/bookings/{id}/respond", "POST", f"/api/bookings/{booking_id}/respond",
+        headers=host.headers, json=body,
+    )
+
+
+async def messaging(client: httpx.AsyncClient, stats: Stats, pool: Pool, rng: random.Random) -> None:
+    conversation_id, host, artist = rng.choice(pool.conversations)
+    actor = rng.choice((host, artist))
+    await stats.request(client, "GET /api/conversations", "GET", "/api/conversations", headers=actor.headers)
+    await stats.request(
+        client, "GET /api/conversations/{id}/messages", "GET", f"/api/conversations/{conversation_id}/messages",
+        headers=actor.headers,
+    )
+    await stats.request(
+        client, "POST /api/conversations/{id}/messages", "POST", f"/api/conversations/{conversation_id}/messages",
+        headers=actor.headers, json={"content": f"Load test message {rng.randrange(10**6)}"},
+    )
+
+
+SCENARIOS: dict[str, Callable[[httpx.AsyncClient, Stats, Pool, random.Random], Awaitable[None]]] = {
+    "browse": browse,
+    "host": host_dashboard,
+    "booking": booking_flow,
+    "messaging": messaging,
+}
+
+
+def parse_mix(items: list[str]) -> dict[str, float]:
+    """``["browse=50", "booking=10"]`` -> weights; scenarios left out get 0."""
+    mix = {name: 0.0 for name in SCENARIOS}
+    for item in items:
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS or not weight:
+            raise ValueError(f"Bad mix entry '{item}': expected one of {', '.join(SCENARIOS)} as name=weight")
+        mix[name] = float(weight)
+    if not any(mix.values()):
+        raise ValueError("The mix needs at least one scenario with a positive weight")
+    return mix
+
+
+async def load_pool(connect_kwargs: dict, size: int, seed: int) -> Pool:
+    """Pick active hosts, artists and conversations from the database and mint their tokens."""
+    conn = await asyncpg.connect(**connect_kwargs)
+    try:
+        await conn.execute("SELECT setseed($1)", (seed % 1000) / 1000)
+        hosts = await conn.fetch("""
+            SELECT c.id, u.id AS user_id, u.email, u.role FROM communities c JOIN users u ON u.id = c.user_id
+            WHERE c.status = 'active' AND u.is_active ORDER BY random() LIMIT $1
+        """, size)
+        artists = await conn.fetch("""
+            SELECT a.id, u.id AS user_id, u.email, u.role FROM artists a JOIN users u ON u.id = a.user_id
+            WHERE a.status = 'active' AND u.is_active ORDER BY random() LIMIT $1
+        """, size)
+        conversations = await conn.fetch("""
+            SELECT cv.id, c.id AS community_id, cu.id AS host_user_id, cu.email AS host_email, cu.role AS host_role,
+                   a.id AS artist_id, au.id AS artist_user_id, au.email AS artist_email, au.role AS artist_role
+            FROM conversations cv
+            JOIN bookings b ON b.id = cv.booking_id
+            JOIN communities c ON c.id = b.community_id JOIN users cu ON cu.id = c.user_id
+            JOIN artists a ON a.id = b.artist_id JOIN users au ON au.id = a.user_id
+            WHERE cu.is_active AND au.is_active ORDER BY random() LIMIT $1
+        """, size * 5)
+    finally:
+        await conn.close()
+
+    tokens: dict[int, str] = {}
+
+    def actor(user_id: int, email: str, role: str, entity_id: int) -> Actor:
+        if user_id not in tokens:
+            tokens[user_id] = create_access_token(
+                {"sub": user_id, "email": email, "role": role}, expires_delta=timedelta(hours=12)
+            )
+        return Actor(user_id, tokens[user_id], entity_id)
+
+    return Pool(
+        hosts=[actor(r["user_id"], r["email"], r["role"], r["id"]) for r in hosts],
+        artists=[actor(r["user_id"], r["email"], r["role"], r["id"]) for r in artists],
+        conversations=[
+            (
+                r["id"],
+                actor(r["host_user_id"], r["host_email"], r["host_role"], r["community_id"]),
+                actor(r["artist_user_id"], r["artist_email"], r["artist_role"], r["artist_id"]),
+            )
+            for r in conversations
+        ],
+    )
+
+
+async def virtual_user(
+    client: httpx.AsyncClient, stats: Stats, pool: Pool, mix: dict[str, float],
+    rng: random.Random, deadline: float, think_ms: float,
+) -> None:
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        await SCENARIOS[rng.choices(names, weights=weights)[0]](client, stats, pool, rng)
+        if think_ms:
+            await asyncio.sleep(rng.expovariate(1000 / think_ms))
+
+
+def print_report(rows: dict[str, dict], seconds: float) -> None:
+    print(f"\n{'endpoint':<44} {'count':>7} {'err':>5} {'429':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for label, row in rows.items():
+        print(
+            f"{label:<44} {row['count']:>7} {row['errors']:>5} {row['throttled']:>5} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}"
+        )
+    total = sum(row["count"] for row in rows.values())
+    print(f"\n{total} requests in {seconds:.1f}s ({total / seconds:.1f}/s); latencies in ms")
+    if any(row["throttled"] for row in rows.values()):
+        print("Some requests were rate limited: restart the target with RATE_LIMIT_ENABLED=false")
+
+
+async def run(args: argparse.Namespace, connect_kwargs: dict) -> int:
+    pool = await load_pool(connect_kwargs, args.pool, args.seed)
+    needed = {"host": pool.hosts, "booking": pool.hosts and pool.artists, "messaging": pool.conversations}
+    for name, available in needed.items():
+        if args.mix[name] and not available:
+            print(f"No actors for the '{name}' scenario in the database; dropping it from the mix")
+            args.mix[name] = 0.0
+    if not any(args.mix.values()):
+        print("Nothing left to run: seed the database with python -m scripts.seed_scale")
+        return 1
+    print(
+        f"{len(pool.hosts)} hosts, {len(pool.artists)} artists, {len(pool.conversations)} conversations; "
+        f"{args.users} users for {args.warmup:.0f}s warm-up + {args.duration:.0f}s"
+    )
+
+    stats = Stats()
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        start = time.perf_counter()
+        deadline = start + args.warmup + args.duration
+        users = [
+            asyncio.create_task(virtual_user(
+                client, stats, pool, args.mix, random.Random(args.seed * 10_000 + i), deadline, args.think_ms,
+            ))
+            for i in range(args.users)
+        ]
+        await asyncio.sleep(args.warmup)
+        stats.recording = True
+        measured_from = time.perf_counter()
+        await asyncio.gather(*users)
+        seconds = time.perf_counter() - measured_from
+
+    rows = stats.report(seconds)
+    print_report(rows, seconds)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"seconds": round(seconds, 2), "users": args.users, "mix": args.mix, "endpoints": rows}, f, indent=2)
+        print(f"Report written to {args.json}")
+    return 0
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--mix", nargs="+", default=[f"{k}={v}" for k, v in DEFAULT_MIX.items()])
+    parser.add_argument("--think-ms", type=float, default=0.0)
+    parser.add_argument("--pool", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--database-url", help="default: DATABASE_URL")
+    parser.add_argument("--json")
+    args = parser.parse_args(argv)
+    try:
+        args.mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    settings = get_settings()
+    engine = create_async_engine(args.database_url or settings.database_url)
+    _, connect_kwargs = engine.dialect.create_connect_args(engine.url)
+    return asyncio.run(run(args, connect_kwargs))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
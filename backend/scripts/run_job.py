@@ -0,0 +1,30 @@
+"""Run a scheduled background job once, even if it is not due yet.
+
+Run with: cd backend && python -m scripts.run_job <job_name>
+"""
+
+import asyncio
+import json
+import sys
+
+import app.jobs  # noqa: F401  (registers jobs)
+from app.scheduler import scheduler
+
+
+async def main(name: str) -> int:
+    if name not in scheduler.jobs:
+        print(f"Unknown job '{name}'. Available: {', '.join(sorted(scheduler.jobs))}")
+        return 1
+    result = await scheduler.run_job(name, force=True)
+    if result is None:
+        print(f"Job '{name}' is already running elsewhere")
+        return 1
+    print(json.dumps(result, indent=2, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m scripts.run_job <job_name>")
+        sys.exit(2)
+    sys.exit(asyncio.run(main(sys.argv[1])))
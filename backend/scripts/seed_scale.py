@@ -0,0 +1,407 @@
+"""Bulk-load a large, consistent synthetic dataset with COPY.
+
+Run with: cd backend && python -m scripts.seed_scale --artists 20000 --communities 50000 --bookings 1000000
+
+Seeds users, artists (with categories and some agents), communities with
+coordinates, bookings, tours with stops, conversations with messages, and
+notifications with matching unread counters. Rows are generated lazily
+and streamed to Postgres with asyncpg's COPY, in one transaction. Tour
+stops, conversations and messages hang off bookings; the booking pass is
+deterministic, so it is replayed once for each of those tables rather
+than collecting their rows while the bookings stream out.
+
+Rows are added next to existing data: ids are allocated above each
+table's current maximum and the sequences are moved past them at the
+end. Run it against a migrated database (categories come from the
+migrations). It refuses to run with ENV=production.
+
+Every seeded user's password is SeedPass123. Emails look like
+community-17@<tag>.seed.invalid, where <tag> is --tag (default: the seed).
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from decimal import Decimal
+from typing import Iterable, Iterator, Optional
+
+import asyncpg
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import get_settings
+from app.utils.security import get_password_hash
+from scripts.synthetic import iter_synthetic_bookings, synthetic_communities
+
+SEED_PASSWORD = "SeedPass123"
+ARTIST_CITIES = ("Tel Aviv", "Jerusalem", "Haifa", "Be'er Sheva", "Ramat Gan", "Netanya", "Eilat")
+LANGUAGES = (["Hebrew", "English"], ["Hebrew"], ["English"], ["Hebrew", "English", "Russian"], ["Hebrew", "French"])
+NOTIFICATION_TYPES = (
+    ("booking_new", "New booking request", "/dashboard/talent/bookings"),
+    ("quote_received", "You received a quote", "/dashboard/host/bookings"),
+    ("quote_approved", "Your quote was approved", "/dashboard/talent/bookings"),
+    ("quote_declined", "Your quote was declined", "/dashboard/talent/bookings"),
+    ("tour_opportunity", "A talent is touring near you", "/talents"),
+)
+EVENT_TYPES = (None, "concert", "lecture", "workshop", "holiday_event", "shabbat")
+MESSAGES = (
+    "Hi! We'd love to have you for our community event.",
+    "Thanks for reaching out, the date works for me.",
+    "Could you share your technical requirements?",
+    "We expect around 150 people. Is that a good fit?",
+    "Looking forward to it!",
+)
+SEQUENCE_TABLES = (
+    "users", "artists", "communities", "tours", "bookings", "tour_stops",
+    "conversations", "messages", "notifications",
+)
+
+
+def _ts(rng: random.Random, days_back: int) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(seconds=rng.randrange(max(days_back, 1) * 86400))
+
+
+def _dec(value: float) -> Decimal:
+    return Decimal(str(round(value, 6)))
+
+
+class Seeder:
+    """Generates the rows for every table, keeping their references consistent."""
+
+    def __init__(self, args: argparse.Namespace, bases: dict[str, int], category_ids: list[int]):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.bases = bases
+        self.category_ids = category_ids
+        self.tag = args.tag or f"s{args.seed}"
+        self.password_hash = get_password_hash(SEED_PASSWORD)
+        self.today = date.today()
+
+        b = bases["users"]
+        self.community_user_ids = range(b + 1, b + args.communities + 1)
+        b += args.communities
+        self.artist_user_ids = range(b + 1, b + args.artists + 1)
+        b += args.artists
+        self.agent_user_ids = range(b + 1, b + args.agents + 1)
+
+        self.artist_ids = range(bases["artists"] + 1, bases["artists"] + args.artists + 1)
+        self.community_ids = range(bases["communities"] + 1, bases["communities"] + args.communities + 1)
+        self.communities = synthetic_communities(args.communities, args.seed)
+
+        # Popular artists get most of the bookings
+        self.artist_weights = list(_cumulative(1 / (i + 1) ** 0.8 for i in range(args.artists)))
+
+        # Tours belong to random artists; bookings of those artists may join them
+        tour_rng = random.Random(args.seed + 2)
+        self.tours_by_artist: dict[int, list[int]] = defaultdict(list)
+        self.tour_artist: list[int] = []
+        for i in range(args.tours):
+            artist_index = tour_rng.randrange(args.artists)
+            self.tours_by_artist[artist_index].append(bases["tours"] + i + 1)
+            self.tour_artist.append(artist_index)
+
+        # Filled while notifications stream out
+        self.unread: dict[int, int] = defaultdict(int)
+
+    # ── users, artists, communities ─────────────────────────
+
+    def users(self) -> Iterator[tuple]:
+        for role, ids in (
+            ("community", self.community_user_ids),
+            ("artist", self.artist_user_ids),
+            ("agent", self.agent_user_ids),
+        ):
+            for n, user_id in enumerate(ids, 1):
+                created = _ts(self.rng, 730)
+                yield (
+                    user_id, f"{role}-{n}@{self.tag}.seed.invalid", self.password_hash, f"Seed {role.title()} {n}",
+                    role, "active", True, False, created, created,
+                )
+
+    def artists(self) -> Iterator[tuple]:
+        for i, (artist_id, user_id) in enumerate(zip(self.artist_ids, self.artist_user_ids)):
+            agent = self.agent_user_ids[i % len(self.agent_user_ids)] if self.agent_user_ids and i % 5 == 0 else None
+            created = _ts(self.rng, 730)
+            status = "active" if self.rng.random() < 0.9 else "pending"
+            yield (
+                artist_id, user_id, agent, f"אמן {i + 1}", f"Seed Artist {i + 1}",
+                "Synthetic artist profile for performance testing.",
+                self.rng.choice((800, 1500, 2500, 4000, 7000)), self.rng.choice((None, 10000, 20000)),
+                self.rng.choice(LANGUAGES), "{}",  # asyncpg sends jsonb as text
+                self.rng.choice(ARTIST_CITIES), "Israel",
+                [], [], [], [], [], [], status, self.rng.random() < 0.01, created, created,
+            )
+
+    def artist_categories(self) -> Iterator[tuple]:
+        for artist_id in self.artist_ids:
+            for category_id in self.rng.sample(self.category_ids, k=min(len(self.category_ids), self.rng.randint(1, 2))):
+                yield artist_id, category_id
+
+    def community_rows(self) -> Iterator[tuple]:
+        for community_id, user_id, c in zip(self.community_ids, self.community_user_ids, self.communities):
+            created = _ts(self.rng, 730)
+            members = c["member_count"]
+            yield (
+                community_id, user_id, c["name"], c["community_type"], c["location"],
+                _dec(c["latitude"]), _dec(c["longitude"]), members // 2, members * 2,
+                str(c["audience_size"]), "English", self.rng.random() < 0.9, "active", created, created,
+            )
+
+    def tours(self) -> Iterator[tuple]:
+        for i, artist_index in enumerate(self.tour_artist):
+            created = _ts(self.rng, 365)
+            yield (
+                self.bases["tours"] + i + 1, self.artist_ids[artist_index], f"Seed Tour {i + 1}",
+                self.rng.choice(("North America", "Europe", "Australia", "South America")),
+                self.rng.choice(("pending", "approved")), created, created,
+            )
+
+    # ── bookings and everything hanging off them ────────────
+
+    def _booking_plan(self) -> Iterator[tuple[tuple, Optional[tuple], Optional[tuple], list[tuple]]]:
+        """(booking, tour stop, conversation, messages) per booking; None or [] where there is none.
+
+        Uses only its own seeded generators, so every pass yields the same rows.
+        """
+        args = self.args
+        rng = random.Random(args.seed + 3)
+        artist_rng = random.Random(args.seed + 5)
+        artist_range = range(args.artists)
+        conversation_ratio = args.conversations / args.bookings if args.bookings else 0
+        conversation_id = self.bases["conversations"]
+        message_id = self.bases["messages"]
+        stop_id = self.bases["tour_stops"]
+        stop_order: dict[int, int] = defaultdict(int)
+        start = self.today - timedelta(days=180)
+        synthetic = iter_synthetic_bookings(args.bookings, args.communities, args.seed, start=start, spread_days=540)
+
+        for i, b in enumerate(synthetic):
+            booking_id = self.bases["bookings"] + i + 1
+            artist_index = artist_rng.choices(artist_range, cum_weights=self.artist_weights)[0]
+            community_index = b["community_index"]
+            status = b["status"]
+            requested = b["requested_date"]
+            created = datetime.combine(
+                (requested or self.today) - timedelta(days=rng.randint(14, 120)), dtime(12), tzinfo=timezone.utc,
+            )
+            quoted = status in ("quote_sent", "approved", "declined")
+            quote = float(b["budget"] or rng.choice((1000, 2000, 3500))) if quoted else None
+
+            tour_id = stop = None
+            tours = self.tours_by_artist.get(artist_index)
+            if tours and status == "approved" and requested and rng.random() < 0.5:
+                tour_id = rng.choice(tours)
+                stop_id += 1
+                stop_order[tour_id] += 1
+                c = self.communities[community_index]
+                stop = (
+                    stop_id, tour_id, booking_id, requested, c["location"].split(",")[0],
+                    _dec(c["latitude"]), _dec(c["longitude"]), stop_order[tour_id], "confirmed", created, created,
+                )
+
+            booking = (
+                booking_id, self.artist_ids[artist_index], self.community_ids[community_index], tour_id,
+                requested, b["location"], b["budget"], "Seeded booking", rng.choice(EVENT_TYPES), quote,
+                created + timedelta(days=2) if quoted else None,
+                "Dates don't work" if status == "declined" else None,
+                status, created, created,
+            )
+
+            conversation, messages = None, []
+            if rng.random() < conversation_ratio:
+                conversation_id += 1
+                participants = (self.community_user_ids[community_index], self.artist_user_ids[artist_index])
+                sent_at = created
+                for m in range(args.messages_per_conversation):
+                    message_id += 1
+                    sent_at += timedelta(hours=rng.randint(1, 48))
+                    content = MESSAGES[m % len(MESSAGES)]
+                    messages.append((message_id, conversation_id, participants[m % 2], content, sent_at))
+                count = args.messages_per_conversation
+                last_sender = participants[(count - 1) % 2] if count else None
+                conversation = (
+                    conversation_id, booking_id, MESSAGES[(count - 1) % len(MESSAGES)][:100] if count else None,
+                    sent_at if count else None, last_sender, count, created, sent_at,
+                )
+
+            yield booking, stop, conversation, messages
+
+    def bookings(self) -> Iterator[tuple]:
+        for booking, _, _, _ in self._booking_plan():
+            yield booking
+
+    def tour_stops(self) -> Iterator[tuple]:
+        for _, stop, _, _ in self._booking_plan():
+            if stop is not None:
+                yield stop
+
+    def conversations(self) -> Iterator[tuple]:
+        for _, _, conversation, _ in self._booking_plan():
+            if conversation is not None:
+                yield conversation
+
+    def messages(self) -> Iterator[tuple]:
+        for _, _, _, messages in self._booking_plan():
+            yield from messages
+
+    def notifications(self) -> Iterator[tuple]:
+        rng = random.Random(self.args.seed + 4)
+        user_ids = [*self.community_user_ids, *self.artist_user_ids]
+        for i in range(self.args.notifications):
+            user_id = rng.choice(user_ids)
+            type_, title, link = rng.choice(NOTIFICATION_TYPES)
+            is_read = rng.random() < 0.7
+            if not is_read:
+                self.unread[user_id] += 1
+            yield (
+                self.bases["notifications"] + i + 1, user_id, type_, title,
+                f"{title}. (seeded notification {i + 1})", link, is_read, _ts(rng, 120),
+            )
+
+    def notification_counters(self) -> Iterator[tuple]:
+        now = datetime.now(timezone.utc)
+        for user_id, count in self.unread.items():
+            yield user_id, count, now
+
+
+def _cumulative(weights: Iterable[float]) -> Iterator[float]:
+    total = 0.0
+    for w in weights:
+        total += w
+        yield total
+
+
+TABLES = {
+    "users": ("id", "email", "password_hash", "name", "role", "status", "is_active", "is_superuser", "created_at", "updated_at"),
+    "artists": (
+        "id", "user_id", "agent_user_id", "name_he", "name_en", "bio_en", "price_single", "price_tour",
+        "languages", "availability", "city", "country", "video_urls", "portfolio_images", "spotify_links",
+        "media_links", "performance_types", "subcategories", "status", "is_featured", "created_at", "updated_at",
+    ),
+    "artist_categories": ("artist_id", "category_id"),
+    "communities": (
+        "id", "user_id", "name", "community_type", "location", "latitude", "longitude", "member_count_min",
+        "member_count_max", "audience_size", "language", "receive_artist_offers", "status", "created_at", "updated_at",
+    ),
+    "tours": ("id", "artist_id", "name", "region", "status", "created_at", "updated_at"),
+    "bookings": (
+        "id", "artist_id", "community_id", "tour_id", "requested_date", "location", "budget", "notes",
+        "event_type", "quote_amount", "quoted_at", "decline_reason", "status", "created_at", "updated_at",
+    ),
+    "tour_stops": (
+        "id", "tour_id", "booking_id", "date", "city", "latitude", "longitude", "sequence_order", "status",
+        "created_at", "updated_at",
+    ),
+    "conversations": (
+        "id", "booking_id", "last_message_preview", "last_message_at", "last_sender_id", "message_count",
+        "created_at", "updated_at",
+    ),
+    "messages": ("id", "conversation_id", "sender_id", "content", "created_at"),
+    "notifications": ("id", "user_id", "type", "title", "message", "link", "is_read", "created_at"),
+    "notification_counters": ("user_id", "unread_count", "updated_at"),
+}
+
+
+async def _copy(conn: asyncpg.Connection, table: str, records: Iterable[tuple]) -> None:
+    start = time.perf_counter()
+    counted = _Counted(records)
+    await conn.copy_records_to_table(table, records=counted, columns=TABLES[table])
+    print(f"  {table:<22} {counted.n:>10,} rows  {time.perf_counter() - start:7.1f}s")
+
+
+class _Counted:
+    def __init__(self, records: Iterable[tuple]):
+        self._records = records
+        self.n = 0
+
+    def __iter__(self):
+        for record in self._records:
+            self.n += 1
+            yield record
+
+
+async def seed(args: argparse.Namespace, connect_kwargs: dict) -> None:
+    conn = await asyncpg.connect(**connect_kwargs)
+    try:
+        category_ids = [r["id"] for r in await conn.fetch("SELECT id FROM categories ORDER BY id")]
+        if not category_ids:
+            raise SystemExit("No categories found: run `alembic upgrade head` first")
+        bases = {
+            table: await conn.fetchval(f"SELECT COALESCE(MAX(id), 0) FROM {table}") for table in SEQUENCE_TABLES
+        }
+        seeder = Seeder(args, bases, category_ids)
+
+        started = time.perf_counter()
+        async with conn.transaction():
+            await _copy(conn, "users", seeder.users())
+            await _copy(conn, "artists", seeder.artists())
+            await _copy(conn, "artist_categories", seeder.artist_categories())
+            await _copy(conn, "communities", seeder.community_rows())
+            await _copy(conn, "tours", seeder.tours())
+            await _copy(conn, "bookings", seeder.bookings())
+            await _copy(conn, "tour_stops", seeder.tour_stops())
+            await _copy(conn, "conversations", seeder.conversations())
+            await _copy(conn, "messages", seeder.messages())
+            await _copy(conn, "notifications", seeder.notifications())
+            await _copy(conn, "notification_counters", seeder.notification_counters())
+
+            await conn.execute("""
+                UPDATE tours SET start_date = s.first, end_date = s.last
+                FROM (SELECT tour_id, min(date) AS first, max(date) AS last FROM tour_stops GROUP BY tour_id) s
+                WHERE tours.id = s.tour_id AND tours.start_date IS NULL
+            """)
+            for table in SEQUENCE_TABLES:
+                await conn.execute(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT MAX(id) FROM {table}))"
+                )
+
+        print(f"Loaded in {time.perf_counter() - started:.1f}s; analyzing...")
+        for table in TABLES:
+            await conn.execute(f"ANALYZE {table}")
+        print(json.dumps({"tag": seeder.tag, "password": SEED_PASSWORD}))
+        print("Refresh admin analytics with: python -m scripts.run_job rollup_daily_metrics")
+    finally:
+        await conn.close()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--artists", type=int, default=2000)
+    parser.add_argument("--communities", type=int, default=5000)
+    parser.add_argument("--bookings", type=int, default=100000)
+    parser.add_argument("--agents", type=int, help="default: artists / 50")
+    parser.add_argument("--tours", type=int, help="default: artists / 4")
+    parser.add_argument("--conversations", type=int, help="default: bookings / 5")
+    parser.add_argument("--messages-per-conversation", type=int, default=3)
+    parser.add_argument("--notifications", type=int, help="default: bookings / 2")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--tag", help="email domain label; default s<seed>, must be new for each run")
+    parser.add_argument("--database-url", help="default: DATABASE_URL")
+    args = parser.parse_args(argv)
+    if args.artists < 1 or args.communities < 1:
+        parser.error("--artists and --communities must be at least 1")
+    args.agents = args.artists // 50 if args.agents is None else args.agents
+    args.tours = args.artists // 4 if args.tours is None else args.tours
+    args.conversations = args.bookings // 5 if args.conversations is None else min(args.conversations, args.bookings)
+    args.notifications = args.bookings // 2 if args.notifications is None else args.notifications
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    settings = get_settings()
+    if settings.env == "production":
+        print("Refusing to seed synthetic data with ENV=production")
+        return 1
+    engine = create_async_engine(args.database_url or settings.database_url)
+    _, connect_kwargs = engine.dialect.create_connect_args(engine.url)
+    asyncio.run(seed(args, connect_kwargs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
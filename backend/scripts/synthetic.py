@@ -0,0 +1,138 @@
+"""Synthetic, deterministic data for benchmarks, load tests and scale seeding.
+
+Communities are scattered around real Jewish population centres (the
+seed_communities list plus the largest communities outside North
+America), weighted by population. Booking dates cluster around the
+holiday seasons hosts book for, with some spread through the year and
+some left undated, as in production.
+
+Everything is driven by ``random.Random(seed)``, so a given seed, size and
+start date always produce the same rows.
+"""
+
+import itertools
+import math
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterator, Optional
+
+from scripts.seed_communities import COMMUNITIES
+
+
+@dataclass(frozen=True)
+class Centre:
+    city: str
+    location: str
+    latitude: float
+    longitude: float
+    population: int
+
+
+CENTRES = [
+    Centre(c["location"].split(",")[0], c["location"], c["lat"], c["lng"], c["pop"]) for c in COMMUNITIES
+] + [
+    Centre("London", "London, United Kingdom", 51.5074, -0.1278, 160000),
+    Centre("Manchester", "Manchester, United Kingdom", 53.4808, -2.2426, 30000),
+    Centre("Paris", "Paris, France", 48.8566, 2.3522, 280000),
+    Centre("Antwerp", "Antwerp, Belgium", 51.2194, 4.4025, 18000),
+    Centre("Berlin", "Berlin, Germany", 52.5200, 13.4050, 30000),
+    Centre("Buenos Aires", "Buenos Aires, Argentina", -34.6037, -58.3816, 165000),
+    Centre("Sao Paulo", "Sao Paulo, Brazil", -23.5505, -46.6333, 60000),
+    Centre("Mexico City", "Mexico City, Mexico", 19.4326, -99.1332, 40000),
+    Centre("Melbourne", "Melbourne, Australia", -37.8136, 144.9631, 60000),
+    Centre("Sydney", "Sydney, Australia", -33.8688, 151.2093, 45000),
+    Centre("Johannesburg", "Johannesburg, South Africa", -26.2041, 28.0473, 50000),
+]
+
+COMMUNITY_KINDS = ("Congregation", "Jewish Community Center", "Chabad House", "Hillel", "Temple", "Federation")
+AUDIENCE_SIZES = ("small", "medium", "large", "very_large", 80, 120, 250)
+COMMUNITY_TYPES = ("synagogue", "jcc", "federation", "school", "campus")
+BOOKING_STATUSES = (("pending", 50), ("quote_sent", 15), ("approved", 20), ("declined", 10), ("cancelled", 5))
+BUDGETS = (None, 500, 1000, 1500, 2500, 4000, 6000, 10000)
+
+# (month, day) of the seasons hosts book events around
+HOLIDAY_PEAKS = ((9, 20), (12, 15), (3, 10), (4, 15), (5, 10))
+
+# Communities sit within roughly this distance of their centre (1 sigma)
+SPREAD_KM = 25.0
+
+
+def _jitter(rng: random.Random, centre: Centre) -> tuple[float, float]:
+    lat = centre.latitude + rng.gauss(0, SPREAD_KM / 111.0)
+    lng = centre.longitude + rng.gauss(0, SPREAD_KM / (111.0 * max(math.cos(math.radians(centre.latitude)), 0.2)))
+    return round(max(min(lat, 89.9), -89.9), 6), round((lng + 180) % 360 - 180, 6)
+
+
+def synthetic_communities(n: int, seed: int = 0) -> list[dict]:
+    """``n`` communities with name, location, coordinates and audience size."""
+    rng = random.Random(seed)
+    centres = rng.choices(CENTRES, weights=[c.population for c in CENTRES], k=n)
+    communities = []
+    for i, centre in enumerate(centres):
+        latitude, longitude = _jitter(rng, centre)
+        communities.append({
+            "name": f"{rng.choice(COMMUNITY_KINDS)} of {centre.city} #{i + 1}",
+            "location": centre.location,
+            "latitude": latitude,
+            "longitude": longitude,
+            "audience_size": rng.choice(AUDIENCE_SIZES),
+            "community_type": rng.choice(COMMUNITY_TYPES),
+            "member_count": int(rng.lognormvariate(5.5, 0.8)),
+        })
+    return communities
+
+
+def _holiday_dates(start: date, end: date) -> list[date]:
+    peaks = []
+    for year in range(start.year, end.year + 1):
+        for month, day in HOLIDAY_PEAKS:
+            peak = date(year, month, day)
+            if start <= peak < end:
+                peaks.append(peak)
+    return peaks or [start + (end - start) / 2]
+
+
+def synthetic_booking_date(rng: random.Random, start: date, spread_days: int, peaks: list[date]) -> Optional[date]:
+    """Mostly near a holiday peak, some anywhere in the window, a few undated."""
+    roll = rng.random()
+    if roll < 0.1:
+        return None
+    if roll < 0.3:
+        return start + timedelta(days=rng.randrange(spread_days))
+    offset = int(rng.gauss(0, 7))
+    return min(max(rng.choice(peaks) + timedelta(days=offset), start), start + timedelta(days=spread_days - 1))
+
+
+def iter_synthetic_bookings(
+    n: int,
+    n_communities: int,
+    seed: int = 0,
+    start: Optional[date] = None,
+    spread_days: int = 365,
+) -> Iterator[dict]:
+    """``n`` bookings referencing community indexes ``0..n_communities-1``, generated lazily."""
+    rng = random.Random(seed + 1)
+    start = start or date.today() + timedelta(days=14)
+    peaks = _holiday_dates(start, start + timedelta(days=spread_days))
+    statuses, weights = zip(*BOOKING_STATUSES)
+    cum_weights = list(itertools.accumulate(weights))
+    for _ in range(n):
+        yield {
+            "community_index": rng.randrange(n_communities),
+            "requested_date": synthetic_booking_date(rng, start, spread_days, peaks),
+            "budget": rng.choice(BUDGETS),
+            "status": rng.choices(statuses, cum_weights=cum_weights)[0],
+            "location": None,
+        }
+
+
+def synthetic_bookings(
+    n: int,
+    n_communities: int,
+    seed: int = 0,
+    start: Optional[date] = None,
+    spread_days: int = 365,
+) -> list[dict]:
+    """``n`` bookings referencing community indexes ``0..n_communities-1``."""
+    return list(iter_synthetic_bookings(n, n_communities, seed, start, spread_days))
@@ -0,0 +1,94 @@
+"""Tests for the structured, sampled access log."""
+
+import io
+import json
+import logging
+
+import pytest
+
+from app import access_log
+from app.query_stats import QueryStats
+
+
+@pytest.fixture
+def records(monkeypatch):
+    captured: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = captured.append
+    access_log.logger.addHandler(handler)
+    monkeypatch.setattr(access_log, "sample_rates", {"/api/health": 0.0, "/api/talents": 0.5})
+    yield captured
+    access_log.logger.removeHandler(handler)
+
+
+def _scope(path: str, user_id=None) -> dict:
+    return {"type": "http", "method": "GET", "path": path, "state": {"user_id": user_id} if user_id else {}}
+
+
+class TestSampleRates:
+    def test_parse(self):
+        assert access_log.parse_sample_rates("/api/health=0.01, /api/metrics=0 ,/api/x=2") == {
+            "/api/health": 0.01, "/api/metrics": 0.0, "/api/x": 1.0,
+        }
+        assert access_log.parse_sample_rates("") == {}
+        assert access_log.parse_sample_rates("/api/health=often") == {}
+
+    def test_sampled_routes_still_log_server_errors(self, records):
+        access_log.log_request(_scope("/api/health"), "/api/health", 200, 0.001, "a", None)
+        access_log.log_request(_scope("/api/health"), "/api/health", 503, 0.001, "b", None)
+        assert [r.access["request_id"] for r in records] == ["b"]
+
+    def test_partial_rate(self, records, monkeypatch):
+        rolls = iter([0.2, 0.7])
+        monkeypatch.setattr(access_log.random, "random", lambda: next(rolls))
+        for request_id in ("kept", "dropped"):
+            access_log.log_request(_scope("/api/talents"), "/api/talents", 200, 0.001, request_id, None)
+        assert [r.access["request_id"] for r in records] == ["kept"]
+        assert records[0].access["sample_rate"] == 0.5
+
+
+class TestFields:
+    def test_request_fields(self, records):
+        stats = QueryStats()
+        stats.record("SELECT 1", 0.004)
+        stats.record("SELECT 2", 0.002)
+        access_log.log_request(_scope("/api/bookings/7", user_id=12), "/api/bookings/{booking_id}", 404, 0.0123, "r1", stats)
+
+        [record] = records
+        assert record.getMessage() == "GET /api/bookings/7 404 12ms"
+        assert record.access == {
+            "request_id": "r1",
+            "method": "GET",
+            "path": "/api/bookings/7",
+            "route": "/api/bookings/{booking_id}",
+            "status": 404,
+            "duration_ms": 12.3,
+            "user_id": 12,
+            "db_queries": 2,
+            "db_ms": 6.0,
+            "sample_rate": 1.0,
+        }
+
+    def test_json_lines_are_written_by_the_listener(self):
+        stream = io.StringIO()
+        access_log.configure("json", stream=stream)
+        try:
+            access_log.log_request(_scope("/api/categories"), "/api/categories", 200, 0.002, "r2", None)
+        finally:
+            access_log.flush()
+            access_log.configure()
+
+        entry = json.loads(stream.getvalue())
+        assert entry["logger"] == "kolamba.access"
+        assert entry["message"] == "GET /api/categories 200 2ms"
+        assert entry["request_id"] == "r2"
+        assert entry["route"] == "/api/categories"
+
+
+class TestUserId:
+    async def test_authenticated_requests_carry_the_user_id(self, client, test_user, records):
+        response = await client.get("/api/auth/me", headers={"Authorization": f"Bearer {test_user['token']}"})
+        assert response.status_code == 200
+        [record] = [r for r in records if r.access["path"] == "/api/auth/me"]
+        assert record.access["user_id"] == test_user["user"].id
+        assert record.access["db_queries"] >= 1
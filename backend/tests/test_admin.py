@@ -0,0 +1,240 @@
+"""Tests for admin dashboard statistics."""
+
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.artist import Artist
+from app.models.daily_metric import DailyMetric
+from app.models.user import User
+from app.routers.admin import StatsResponse, _months_back
+from app.services import admin_stats
+from app.services.admin_stats import StatsSnapshot
+from app.services.exports import encode_csv, encode_ndjson
+from app.services.metrics_rollup import rollup_daily_metrics
+
+
+def _auth(user: dict) -> dict:
+    return {"Authorization": f"Bearer {user['token']}"}
+
+
+class TestAdminStats:
+    """GET /api/admin/stats."""
+
+    async def test_snapshot_is_reused(self, client: AsyncClient, test_admin):
+        first = await client.get("/api/admin/stats", headers=_auth(test_admin))
+        assert first.status_code == 200
+        assert first.json()["cached"] is False
+
+        second = await client.get("/api/admin/stats", headers=_auth(test_admin))
+        assert second.json()["cached"] is True
+        assert second.json()["generated_at"] == first.json()["generated_at"]
+
+    async def test_refresh_recounts(
+        self, client: AsyncClient, db_session: AsyncSession, test_admin, test_artist_user
+    ):
+        before = (await client.get("/api/admin/stats", headers=_auth(test_admin))).json()
+
+        db_session.add(Artist(user_id=test_artist_user["user"].id, name_en="Stats", name_he="אמן", status="pending"))
+        await db_session.commit()
+
+        after = (await client.get("/api/admin/stats?refresh=true", headers=_auth(test_admin))).json()
+        assert after["cached"] is False
+        assert after["total_artists"] == before["total_artists"] + 1
+        assert after["pending_artists"] == before["pending_artists"] + 1
+        assert after["total_users"] == before["total_users"]
+
+
+class TestListUsers:
+    """GET /api/admin/users."""
+
+    @pytest.mark.query_budget(8)
+    async def test_query_count_does_not_grow_with_page(
+        self, client: AsyncClient, db_session: AsyncSession, test_admin, request_queries
+    ):
+        from app.models.user import User
+
+        for i in range(5):
+            user = User(email=f"budget_{i}_{datetime.now().timestamp()}@test.com", name=f"Budget {i}", role="artist")
+            db_session.add(user)
+            await db_session.flush()
+            db_session.add(Artist(user_id=user.id, name_en=f"Budget {i}", name_he="אמן", status="active"))
+        await db_session.commit()
+        # Open the test session's next SAVEPOINT now, so it isn't counted against the first request
+        await db_session.execute(select(1))
+
+        small = await client.get("/api/admin/users?role=artist&limit=1", headers=_auth(test_admin))
+        large = await client.get("/api/admin/users?role=artist&limit=5", headers=_auth(test_admin))
+        assert small.status_code == large.status_code == 200
+        assert len(large.json()) == 5
+        assert request_queries[0][2].queries == request_queries[1][2].queries
+
+
+class TestStatsSnapshot:
+    """Snapshot expiry without a database."""
+
+    async def test_expires_after_ttl(self, monkeypatch):
+        calls = []
+
+        async def fake_compute(db):
+            calls.append(db)
+            return {"total_users": len(calls)}
+
+        monkeypatch.setattr(admin_stats, "compute_admin_stats", fake_compute)
+        snapshot = StatsSnapshot(ttl=60)
+
+        stats, _, cached = await snapshot.get(None)
+        assert (stats, cached) == ({"total_users": 1}, False)
+        stats, _, cached = await snapshot.get(None)
+        assert (stats, cached) == ({"total_users": 1}, True)
+
+        snapshot.ttl = 0
+        stats, _, cached = await snapshot.get(None)
+        assert (stats, cached) == ({"total_users": 2}, False)
+
+    def test_query_covers_every_count(self):
+        columns = {c.name for c in admin_stats.admin_stats_query().selected_columns}
+        counts = {name for name, f in StatsResponse.model_fields.items() if f.annotation is int}
+        assert columns == counts
+
+
+class TestAnalyticsRollup:
+    """daily_metrics rollup and GET /api/admin/analytics."""
+
+    async def test_rollup_counts_today(self, db_session: AsyncSession, test_admin, test_artist_user):
+        today = date.today()
+        result = await rollup_daily_metrics(db_session, start=today - timedelta(days=2), end=today)
+        assert result["days"] == 3
+
+        row = (await db_session.execute(select(DailyMetric).where(DailyMetric.day == today))).scalar_one()
+        assert row.users_new >= 2
+        assert row.artist_signups >= 1
+
+    async def test_rollup_is_idempotent(self, db_session: AsyncSession, test_admin):
+        today = date.today()
+        await rollup_daily_metrics(db_session, start=today, end=today)
+        first = (await db_session.execute(select(DailyMetric.users_new).where(DailyMetric.day == today))).scalar()
+        await rollup_daily_metrics(db_session, start=today, end=today)
+        second = (await db_session.execute(select(DailyMetric.users_new).where(DailyMetric.day == today))).scalar()
+        assert first == second
+
+    async def test_rollup_buckets_by_utc_day_in_any_session_time_zone(self, db_session: AsyncSession):
+        # 02:00 and 23:00 UTC; in New York the first is still the previous evening
+        for hour in (2, 23):
+            db_session.add(User(
+                email=f"tz{hour}@example.com", password_hash="x", name="TZ", role="community",
+                created_at=datetime(2001, 3, 10, hour, tzinfo=timezone.utc),
+            ))
+        await db_session.commit()
+        await db_session.execute(text("SET TIME ZONE 'America/New_York'"))
+
+        await rollup_daily_metrics(db_session, start=date(2001, 3, 10), end=date(2001, 3, 10))
+
+        rows = await db_session.execute(
+            select(DailyMetric.day, DailyMetric.users_new)
+            .where(DailyMetric.day.between(date(2001, 3, 9), date(2001, 3, 11)))
+        )
+        assert dict(rows.all()) == {date(2001, 3, 10): 2}
+
+    async def test_analytics_daily_series(self, client: AsyncClient, db_session: AsyncSession, test_admin):
+        today = date.today()
+        await rollup_daily_metrics(db_session, start=today - timedelta(days=3), end=today)
+
+        response = await client.get(
+            f"/api/admin/analytics?granularity=day&start={(today - timedelta(days=3)).isoformat()}",
+            headers=_auth(test_admin),
+        )
+        assert response.status_code == 200
+        points = response.json()["monthly_growth"]
+        assert points[-1]["period"] == today.isoformat()
+        assert points[-1]["new_users"] >= 1
+        # Cumulative totals never decrease
+        totals = [p["users"] for p in points]
+        assert totals == sorted(totals)
+
+    async def test_analytics_rejects_bad_granularity(self, client: AsyncClient, test_admin):
+        response = await client.get("/api/admin/analytics?granularity=year", headers=_auth(test_admin))
+        assert response.status_code == 400
+
+
+class TestMonthsBack:
+    """Calendar month arithmetic for the default analytics range."""
+
+    def test_within_year(self):
+        assert _months_back(date(2026, 10, 19), 5) == date(2026, 5, 1)
+
+    def test_across_year(self):
+        assert _months_back(date(2026, 2, 28), 5) == date(2025, 9, 1)
+        assert _months_back(date(2026, 1, 31), 0) == date(2026, 1, 1)
+
+
+class TestExports:
+    """GET /api/admin/export/*."""
+
+    async def test_users_csv(self, client: AsyncClient, test_admin, test_user):
+        response = await client.get("/api/admin/export/users", headers=_auth(test_admin))
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert test_user["user"].email in {r["email"] for r in rows}
+
+    async def test_users_ndjson_filtered(self, client: AsyncClient, test_admin, test_user):
+        response = await client.get(
+            "/api/admin/export/users?format=ndjson&role=admin", headers=_auth(test_admin)
+        )
+        assert response.status_code == 200
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert records and all(r["role"] == "admin" for r in records)
+
+    async def test_bookings_csv_has_header_when_empty(self, client: AsyncClient, test_admin):
+        response = await client.get(
+            "/api/admin/export/bookings?status=no-such-status", headers=_auth(test_admin)
+        )
+        assert response.status_code == 200
+        assert response.text.splitlines()[0].startswith("id,status,artist_id,artist_name")
+
+    async def test_bad_format(self, client: AsyncClient, test_admin):
+        response = await client.get("/api/admin/export/artists?format=xlsx", headers=_auth(test_admin))
+        assert response.status_code == 400
+
+    async def test_requires_superuser(self, client: AsyncClient, test_user):
+        response = await client.get("/api/admin/export/bookings", headers=_auth(test_user))
+        assert response.status_code == 403
+
+
+class TestExportEncoding:
+    """Row encoders (no database needed)."""
+
+    def test_csv_quotes_and_formats(self):
+        when = datetime(2026, 1, 2, 3, 4, tzinfo=timezone.utc)
+        text = encode_csv(["id", "name", "at"], [(1, 'Cohen, "Avi"', when)], header=True)
+        assert list(csv.reader(io.StringIO(text))) == [
+            ["id", "name", "at"],
+            ["1", 'Cohen, "Avi"', "2026-01-02T03:04:00+00:00"],
+        ]
+
+    def test_csv_neutralises_formulas(self):
+        values = ["=HYPERLINK(\"http://x\")", "+972 50", "-1+1", "@SUM(A1)", "\tTab", "\rCR", "Avi = Cohen"]
+        text = encode_csv(["value"], [(v,) for v in values] + [(-5,)], header=False)
+        assert [row[0] for row in csv.reader(io.StringIO(text))] == [
+            "'=HYPERLINK(\"http://x\")", "'+972 50", "'-1+1", "'@SUM(A1)", "'\tTab", "'\rCR", "Avi = Cohen", "-5",
+        ]
+
+    def test_ndjson_keeps_values_as_entered(self):
+        assert json.loads(encode_ndjson(["name"], [("=1+1",)])) == {"name": "=1+1"}
+
+    def test_ndjson_lines(self):
+        text = encode_ndjson(["id", "price", "day"], [(1, Decimal("9.5"), date(2026, 1, 2)), (2, None, None)])
+        assert [json.loads(line) for line in text.splitlines()] == [
+            {"id": 1, "price": 9.5, "day": "2026-01-02"},
+            {"id": 2, "price": None, "day": None},
+        ]
@@ -0,0 +1,125 @@
+"""Tests for the agent dashboard endpoints."""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.artist import Artist
+from app.models.artist_tour_date import ArtistTourDate
+from app.models.booking import Booking
+from app.models.community import Community
+from app.models.user import User
+from app.utils.security import create_access_token, get_password_hash
+
+
+def _auth(user: dict) -> dict:
+    return {"Authorization": f"Bearer {user['token']}"}
+
+
+async def _user(db: AsyncSession, role: str) -> User:
+    user = User(
+        email=f"{role}_{uuid.uuid4().hex[:8]}@test.com",
+        password_hash=get_password_hash("AgentPass123"),
+        name=f"Test {role}",
+        role=role,
+        status="active",
+        is_active=True,
+    )
+    db.add(user)
+    await db.flush()
+    return user
+
+
+@pytest.fixture
+async def agency(db_session: AsyncSession, test_user) -> dict:
+    """An agent managing two artists with bookings and tour dates."""
+    agent = await _user(db_session, "agent")
+    community = Community(user_id=test_user["user"].id, name="Agency Host", location="Boston, USA")
+    db_session.add(community)
+
+    artists = []
+    for i, artist_status in enumerate(["active", "pending"]):
+        artist_user = await _user(db_session, "artist")
+        artist = Artist(
+            user_id=artist_user.id,
+            agent_user_id=agent.id,
+            name_en=f"Agency Artist {i}",
+            name_he="אמן",
+            status=artist_status,
+        )
+        db_session.add(artist)
+        artists.append(artist)
+    await db_session.flush()
+
+    today = date.today()
+    db_session.add_all([
+        Booking(artist_id=artists[0].id, community_id=community.id, status="pending",
+                requested_date=today + timedelta(days=10)),
+        Booking(artist_id=artists[0].id, community_id=community.id, status="approved",
+                requested_date=today + timedelta(days=40)),
+        Booking(artist_id=artists[1].id, community_id=community.id, status="pending",
+                requested_date=today + timedelta(days=70)),
+        ArtistTourDate(artist_id=artists[0].id, location="Boston", start_date=today + timedelta(days=5)),
+        ArtistTourDate(artist_id=artists[0].id, location="Boston", start_date=today - timedelta(days=5)),
+    ])
+    await db_session.commit()
+
+    token = create_access_token(data={"sub": agent.id, "email": agent.email, "role": agent.role})
+    return {"agent": {"user": agent, "token": token}, "artists": artists}
+
+
+class TestAgentStats:
+    """GET /api/agents/me/stats and /me/artists."""
+
+    async def test_stats(self, client: AsyncClient, agency):
+        response = await client.get("/api/agents/me/stats", headers=_auth(agency["agent"]))
+        assert response.status_code == 200
+        assert response.json() == {
+            "total_artists": 2,
+            "active_artists": 1,
+            "pending_bookings": 2,
+            "upcoming_tour_dates": 1,
+        }
+
+    async def test_stats_without_artists(self, client: AsyncClient, db_session: AsyncSession):
+        agent = await _user(db_session, "agent")
+        await db_session.commit()
+        token = create_access_token(data={"sub": agent.id, "email": agent.email, "role": agent.role})
+        response = await client.get("/api/agents/me/stats", headers=_auth({"token": token}))
+        assert response.json()["total_artists"] == 0
+        assert response.json()["pending_bookings"] == 0
+
+    async def test_artist_counts(self, client: AsyncClient, agency):
+        response = await client.get("/api/agents/me/artists", headers=_auth(agency["agent"]))
+        counts = {a["id"]: (a["pending_bookings"], a["tour_dates_count"]) for a in response.json()}
+        assert counts == {agency["artists"][0].id: (1, 1), agency["artists"][1].id: (1, 0)}
+
+
+class TestAgentBookings:
+    """GET /api/agents/me/bookings pagination and filters."""
+
+    async def test_paginates(self, client: AsyncClient, agency):
+        first = (await client.get("/api/agents/me/bookings?limit=2", headers=_auth(agency["agent"]))).json()
+        second = (await client.get("/api/agents/me/bookings?limit=2&offset=2", headers=_auth(agency["agent"]))).json()
+        assert len(first["bookings"]) == 2
+        assert len(second["bookings"]) == 1
+        assert first["total"] == second["total"] == 3
+        assert first["has_more"] and not second["has_more"]
+        assert not {b["id"] for b in first["bookings"]} & {b["id"] for b in second["bookings"]}
+
+    async def test_filters(self, client: AsyncClient, agency):
+        response = await client.get("/api/agents/me/bookings?status=pending", headers=_auth(agency["agent"]))
+        assert {b["status"] for b in response.json()["bookings"]} == {"pending"}
+        assert response.json()["total"] == 2
+
+        cutoff = (date.today() + timedelta(days=50)).isoformat()
+        response = await client.get(f"/api/agents/me/bookings?date_to={cutoff}", headers=_auth(agency["agent"]))
+        assert len(response.json()["bookings"]) == 2
+        assert response.json()["total"] == 2
+
+    async def test_requires_agent(self, client: AsyncClient, test_user):
+        response = await client.get("/api/agents/me/bookings", headers=_auth(test_user))
+        assert response.status_code == 403
@@ -80,3 +80,51 @@ class TestListBookings:
         })
         assert response.status_code == 200
         assert isinstance(response.json(), list)
+
+
+class TestGetBooking:
+    """Tests for GET /api/bookings/{id}."""
+
+    @pytest.fixture
+    async def booking(self, db_session: AsyncSession, booking_fixtures):
+        from app.models.booking import Booking
+
+        booking = Booking(
+            artist_id=booking_fixtures["artist"].id,
+            community_id=booking_fixtures["community"].id,
+            location="New York",
+        )
+        db_session.add(booking)
+        await db_session.commit()
+        return booking
+
+    @pytest.mark.query_budget(4)
+    async def test_owner_can_view(self, client: AsyncClient, test_user, test_artist_user, booking):
+        for owner in (test_user, test_artist_user):
+            response = await client.get(f"/api/bookings/{booking.id}", headers={
+                "Authorization": f"Bearer {owner['token']}",
+            })
+            assert response.status_code == 200
+            assert response.json()["id"] == booking.id
+
+    async def test_other_user_forbidden(self, client: AsyncClient, test_admin, db_session: AsyncSession, booking):
+        from app.models.user import User
+        from app.utils.security import create_access_token
+
+        stranger = User(email=f"stranger_{uuid.uuid4().hex[:8]}@test.com", name="Stranger", role="community")
+        db_session.add(stranger)
+        await db_session.flush()
+        token = create_access_token(data={"sub": stranger.id, "email": stranger.email, "role": stranger.role})
+
+        response = await client.get(f"/api/bookings/{booking.id}", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 403
+        response = await client.get(f"/api/bookings/{booking.id}", headers={
+            "Authorization": f"Bearer {test_admin['token']}",
+        })
+        assert response.status_code == 200
+
+    async def test_missing_booking(self, client: AsyncClient, test_user):
+        response = await client.get("/api/bookings/999999", headers={
+            "Authorization": f"Bearer {test_user['token']}",
+        })
+        assert response.status_code == 404
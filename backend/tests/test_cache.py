@@ -0,0 +1,189 @@
+"""Tests for the server-side response cache middleware."""
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.cache import (
+    CacheEntry,
+    CacheRule,
+    MemoryCacheBackend,
+    ResponseCache,
+    ResponseCacheMiddleware,
+    etag_matches,
+    make_etag,
+)
+
+RULES = {
+    "/items": CacheRule("/items", ttl=60, stale_ttl=300, tags=frozenset({"items"})),
+    "/broken": CacheRule("/broken", ttl=60, stale_ttl=300, tags=frozenset({"items"})),
+    "/static": CacheRule("/static", ttl=60, stale_ttl=300, tags=frozenset({"static"})),
+}
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+
+def _make_client(cache: ResponseCache, counter: Counter) -> AsyncClient:
+    async def items(request):
+        counter.calls += 1
+        return JSONResponse({"calls": counter.calls, "q": request.query_params.get("q")})
+
+    async def broken(request):
+        counter.calls += 1
+        return JSONResponse({"detail": "boom"}, status_code=500)
+
+    async def uncached(request):
+        counter.calls += 1
+        return JSONResponse({"calls": counter.calls})
+
+    async def static(request):
+        counter.calls += 1
+        return JSONResponse({"hello": "world"})
+
+    app = Starlette(routes=[
+        Route("/items", items),
+        Route("/static", static),
+        Route("/broken", broken),
+        Route("/uncached", uncached),
+    ])
+    wrapped = ResponseCacheMiddleware(app, cache=cache, rules=RULES)
+    return AsyncClient(transport=ASGITransport(app=wrapped), base_url="http://test")
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(MemoryCacheBackend(max_entries=8))
+
+
+class TestEtags:
+    def test_strong_etag_is_stable(self):
+        assert make_etag(b"abc") == make_etag(b"abc")
+        assert make_etag(b"abc") != make_etag(b"abd")
+
+    def test_if_none_match_parsing(self):
+        etag = make_etag(b"abc")
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches(f"W/{etag}", etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestResponseCacheMiddleware:
+    async def test_second_request_is_served_from_cache(self, cache):
+        counter = Counter()
+        async with _make_client(cache, counter) as client:
+            first = await client.get("/items")
+            second = await client.get("/items")
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.json() == first.json()
+        assert second.headers["etag"] == first.headers["etag"]
+        assert counter.calls == 1
+
+    async def test_query_string_is_part_of_key(self, cache):
+        counter = Counter()
+        async with _make_client(cache, counter) as client:
+            await client.get("/items?q=a")
+            await client.get("/items?q=b")
+            hit = await client.get("/items?q=a")
+        assert counter.calls == 2
+        assert hit.json()["q"] == "a"
+
+    async def test_if_none_match_returns_304(self, cache):
+        counter = Counter()
+        async with _make_client(cache, counter) as client:
+            first = await client.get("/items")
+            revalidated = await client.get("/items", headers={"If-None-Match": first.headers["etag"]})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == first.headers["etag"]
+
+    async def test_if_none_match_on_miss_returns_304(self, cache):
+        counter = Counter()
+        async with _make_client(cache, counter) as client:
+            first = await client.get("/static")
+            await cache.clear()
+            revalidated = await client.get("/static", headers={"If-None-Match": first.headers["etag"]})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["x-cache"] == "MISS"
+
+    async def test_invalidation_by_tag(self, cache):
+        counter = Counter()
+        async with _make_client(cache, counter) as client:
+            await client.get("/items")
+            await cache.invalidate("items")
+            after = await client.get("/items")
+        assert after.headers["x-cache"] == "MISS"
+        assert after.json()["calls"] == 2
+
+    async def test_errors_are_not_cached(self, cache):
+        counter = Counter()
+        async with _make_client(cache, counter) as client:
+            await client.get("/broken")
+            response = await client.get("/broken")
+        assert response.status_code == 500
+        assert "x-cache" not in response.headers
+        assert counter.calls == 2
+
+    async def test_unlisted_paths_bypass_cache(self, cache):
+        counter = Counter()
+        async with _make_client(cache, counter) as client:
+            await client.get("/uncached")
+            response = await client.get("/uncached")
+        assert "x-cache" not in response.headers
+        assert counter.calls == 2
+
+    async def test_stale_entry_served_while_refreshing(self, cache):
+        counter = Counter()
+        async with _make_client(cache, counter) as client:
+            await client.get("/items")
+            key = "/items?"
+            entry: CacheEntry = await cache.get(key)
+            entry.fresh_until = 0  # expired, still inside the stale window
+
+            stale = await client.get("/items")
+            assert stale.headers["x-cache"] == "STALE"
+            assert stale.json()["calls"] == 1
+
+            # Let the background refresh finish
+            for _ in range(10):
+                await asyncio.sleep(0)
+            fresh = await client.get("/items")
+        assert fresh.headers["x-cache"] == "HIT"
+        assert fresh.json()["calls"] == 2
+
+    async def test_concurrent_misses_render_once(self, cache):
+        counter = Counter()
+        async with _make_client(cache, counter) as client:
+            responses = await asyncio.gather(*(client.get("/items") for _ in range(5)))
+        assert all(r.json()["calls"] == 1 for r in responses)
+        assert counter.calls == 1
+
+    async def test_refresh_started_before_invalidation_is_discarded(self, cache):
+        generation = cache.generation
+        await cache.invalidate("items")
+        entry = CacheEntry(200, [], b"{}", make_etag(b"{}"), 0, 10**10, frozenset({"items"}))
+        await cache.set("/items?", entry, generation)
+        assert await cache.get("/items?") is None
+
+
+class TestMemoryCacheBackend:
+    async def test_lru_eviction(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        entry = CacheEntry(200, [], b"", '""', 0, 10**10)
+        await backend.set("a", entry)
+        await backend.set("b", entry)
+        await backend.get("a")  # "b" is now least recently used
+        await backend.set("c", entry)
+        assert await backend.get("b") is None
+        assert await backend.get("a") is not None
+        assert await backend.get("c") is not None
@@ -0,0 +1,185 @@
+"""Tests for conversation (inbox) endpoints."""
+
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.artist import Artist
+from app.models.booking import Booking
+from app.models.community import Community
+from app.models.conversation import Conversation
+
+
+@pytest.fixture
+async def conversation_fixtures(db_session: AsyncSession, test_user, test_artist_user):
+    """Create artist, community, booking and its conversation."""
+    artist = Artist(
+        user_id=test_artist_user["user"].id,
+        name_en=f"Inbox Artist {uuid.uuid4().hex[:6]}",
+        name_he="אמן",
+        status="active",
+    )
+    community = Community(
+        user_id=test_user["user"].id,
+        name="Inbox Community",
+        location="Boston, USA",
+        status="active",
+    )
+    db_session.add_all([artist, community])
+    await db_session.flush()
+
+    booking = Booking(artist_id=artist.id, community_id=community.id, status="pending")
+    db_session.add(booking)
+    await db_session.flush()
+
+    conversation = Conversation(booking_id=booking.id)
+    db_session.add(conversation)
+    await db_session.commit()
+    await db_session.refresh(conversation)
+    return {"artist": artist, "community": community, "booking": booking, "conversation": conversation}
+
+
+def _auth(user: dict) -> dict:
+    return {"Authorization": f"Bearer {user['token']}"}
+
+
+class TestInboxSummary:
+    """Tests for GET /api/conversations summary fields."""
+
+    async def test_empty_conversation(self, client: AsyncClient, test_user, conversation_fixtures):
+        response = await client.get("/api/conversations", headers=_auth(test_user))
+        assert response.status_code == 200
+        item = next(c for c in response.json() if c["id"] == conversation_fixtures["conversation"].id)
+        assert item["message_count"] == 0
+        assert item["last_message"] is None
+        assert item["artist_name"] == conversation_fixtures["artist"].name_en
+        assert item["community_name"] == "Inbox Community"
+
+    async def test_send_message_updates_summary(
+        self, client: AsyncClient, test_user, test_artist_user, conversation_fixtures
+    ):
+        conv_id = conversation_fixtures["conversation"].id
+        await client.post(f"/api/conversations/{conv_id}/messages", json={"content": "Hello!"}, headers=_auth(test_user))
+        long_reply = "x" * 150
+        await client.post(
+            f"/api/conversations/{conv_id}/messages", json={"content": long_reply}, headers=_auth(test_artist_user)
+        )
+
+        response = await client.get("/api/conversations", headers=_auth(test_user))
+        item = next(c for c in response.json() if c["id"] == conv_id)
+        assert item["message_count"] == 2
+        assert item["last_message"] == "x" * 100 + "..."
+        assert item["last_sender_id"] == test_artist_user["user"].id
+        assert item["last_message_at"] is not None
+
+    async def test_inbox_ordered_by_latest_activity(
+        self, client: AsyncClient, db_session: AsyncSession, test_user, conversation_fixtures
+    ):
+        older = conversation_fixtures["conversation"]
+        booking = Booking(
+            artist_id=conversation_fixtures["artist"].id,
+            community_id=conversation_fixtures["community"].id,
+            status="pending",
+        )
+        db_session.add(booking)
+        await db_session.flush()
+        newer = Conversation(booking_id=booking.id)
+        db_session.add(newer)
+        await db_session.commit()
+
+        await client.post(f"/api/conversations/{older.id}/messages", json={"content": "bump"}, headers=_auth(test_user))
+
+        response = await client.get("/api/conversations", headers=_auth(test_user))
+        ids = [c["id"] for c in response.json()]
+        assert ids.index(older.id) < ids.index(newer.id)
+
+
+class TestMessageCursors:
+    """Cursor encoding round-trip (no database needed)."""
+
+    def test_round_trip(self):
+        from datetime import datetime, timezone
+
+        from app.routers.conversations import decode_cursor, encode_cursor
+
+        created_at = datetime(2026, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    def test_invalid_cursor(self):
+        from fastapi import HTTPException
+
+        from app.routers.conversations import decode_cursor
+
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor("not-a-cursor")
+        assert exc.value.status_code == 400
+
+
+class TestMessageHistory:
+    """Tests for cursor-paginated GET /api/conversations/{id}/messages."""
+
+    async def _send(self, client, user, conv_id, count):
+        for i in range(count):
+            await client.post(
+                f"/api/conversations/{conv_id}/messages", json={"content": f"msg {i}"}, headers=_auth(user)
+            )
+
+    async def test_conversation_returns_newest_page(self, client: AsyncClient, test_user, conversation_fixtures):
+        conv_id = conversation_fixtures["conversation"].id
+        await self._send(client, test_user, conv_id, 5)
+
+        response = await client.get(f"/api/conversations/{conv_id}?message_limit=3", headers=_auth(test_user))
+        assert response.status_code == 200
+        data = response.json()
+        assert [m["content"] for m in data["messages"]] == ["msg 2", "msg 3", "msg 4"]
+        assert data["has_more_messages"] is True
+        assert data["messages"][0]["sender_name"] == "Test User"
+
+    async def test_before_pages_back_through_history(self, client: AsyncClient, test_user, conversation_fixtures):
+        conv_id = conversation_fixtures["conversation"].id
+        await self._send(client, test_user, conv_id, 5)
+
+        first = (await client.get(f"/api/conversations/{conv_id}/messages?limit=3", headers=_auth(test_user))).json()
+        older = (await client.get(
+            f"/api/conversations/{conv_id}/messages",
+            params={"limit": 3, "before": first["before_cursor"]},
+            headers=_auth(test_user),
+        )).json()
+        assert [m["content"] for m in older["messages"]] == ["msg 0", "msg 1"]
+        assert older["has_more"] is False
+
+    async def test_after_returns_only_new_messages(self, client: AsyncClient, test_user, conversation_fixtures):
+        conv_id = conversation_fixtures["conversation"].id
+        await self._send(client, test_user, conv_id, 2)
+        page = (await client.get(f"/api/conversations/{conv_id}/messages", headers=_auth(test_user))).json()
+
+        empty = (await client.get(
+            f"/api/conversations/{conv_id}/messages",
+            params={"after": page["after_cursor"]},
+            headers=_auth(test_user),
+        )).json()
+        assert empty["messages"] == []
+        assert empty["after_cursor"] == page["after_cursor"]
+
+        await client.post(f"/api/conversations/{conv_id}/messages", json={"content": "new"}, headers=_auth(test_user))
+        newer = (await client.get(
+            f"/api/conversations/{conv_id}/messages",
+            params={"after": page["after_cursor"]},
+            headers=_auth(test_user),
+        )).json()
+        assert [m["content"] for m in newer["messages"]] == ["new"]
+
+    async def test_history_requires_access(self, client: AsyncClient, test_admin, conversation_fixtures):
+        from app.utils.security import create_access_token
+
+        conv_id = conversation_fixtures["conversation"].id
+        response = await client.get(f"/api/conversations/{conv_id}/messages", headers=_auth(test_admin))
+        assert response.status_code == 200
+
+        stranger = create_access_token(data={"sub": 999999})
+        response = await client.get(
+            f"/api/conversations/{conv_id}/messages", headers={"Authorization": f"Bearer {stranger}"}
+        )
+        assert response.status_code == 401
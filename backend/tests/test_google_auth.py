@@ -0,0 +1,167 @@
+"""Tests for local Google ID token verification with a cached JWKS."""
+
+import base64
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from app.services.google_auth import (
+    GoogleKeysUnavailable,
+    GoogleTokenVerifier,
+    parse_max_age,
+)
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+
+
+def _b64(n: int) -> str:
+    raw = n.to_bytes((n.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _make_key(kid: str):
+    private = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = private.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    numbers = private.public_key().public_numbers()
+    jwk = {"kty": "RSA", "alg": "RS256", "use": "sig", "kid": kid, "n": _b64(numbers.n), "e": _b64(numbers.e)}
+    return pem, jwk
+
+
+KEY_A = _make_key("key-a")
+KEY_B = _make_key("key-b")
+
+
+def _token(key, **overrides) -> str:
+    pem, jwk = key
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "1234567890",
+        "email": "user@example.com",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, pem, algorithm="RS256", headers={"kid": jwk["kid"]})
+
+
+class FakeFetcher:
+    def __init__(self, *jwks, max_age=3600):
+        self.keys = [k[1] for k in jwks]
+        self.max_age = max_age
+        self.calls = 0
+        self.fail = False
+
+    async def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("network down")
+        return {"keys": list(self.keys)}, self.max_age
+
+
+class TestParseMaxAge:
+    def test_google_header(self):
+        assert parse_max_age("public, max-age=19302, must-revalidate, no-transform") == 19302
+
+    def test_missing(self):
+        assert parse_max_age(None) is None
+        assert parse_max_age("no-cache") is None
+
+
+class TestGoogleTokenVerifier:
+    async def test_valid_token(self):
+        verifier = GoogleTokenVerifier(fetch=FakeFetcher(KEY_A))
+        claims = await verifier.verify(_token(KEY_A), CLIENT_ID)
+        assert claims["email"] == "user@example.com"
+
+    async def test_keys_are_cached(self):
+        fetcher = FakeFetcher(KEY_A)
+        verifier = GoogleTokenVerifier(fetch=fetcher)
+        for _ in range(5):
+            await verifier.verify(_token(KEY_A), CLIENT_ID)
+        assert fetcher.calls == 1
+
+    async def test_wrong_audience_rejected(self):
+        verifier = GoogleTokenVerifier(fetch=FakeFetcher(KEY_A))
+        with pytest.raises(ValueError):
+            await verifier.verify(_token(KEY_A, aud="someone-else"), CLIENT_ID)
+
+    async def test_wrong_issuer_rejected(self):
+        verifier = GoogleTokenVerifier(fetch=FakeFetcher(KEY_A))
+        with pytest.raises(ValueError):
+            await verifier.verify(_token(KEY_A, iss="https://evil.example.com"), CLIENT_ID)
+
+    async def test_expired_token_rejected(self):
+        verifier = GoogleTokenVerifier(fetch=FakeFetcher(KEY_A))
+        with pytest.raises(ValueError):
+            await verifier.verify(_token(KEY_A, exp=int(time.time()) - 60), CLIENT_ID)
+
+    async def test_malformed_token_rejected(self):
+        verifier = GoogleTokenVerifier(fetch=FakeFetcher(KEY_A))
+        with pytest.raises(ValueError):
+            await verifier.verify("not-a-jwt", CLIENT_ID)
+
+    async def test_unknown_kid_triggers_refetch(self):
+        fetcher = FakeFetcher(KEY_A)
+        verifier = GoogleTokenVerifier(fetch=fetcher, min_refetch_interval=0)
+        await verifier.verify(_token(KEY_A), CLIENT_ID)
+
+        # Google rotates in a new key before the cached copy expires
+        fetcher.keys.append(KEY_B[1])
+        claims = await verifier.verify(_token(KEY_B), CLIENT_ID)
+        assert claims["sub"] == "1234567890"
+        assert fetcher.calls == 2
+
+    async def test_unknown_kid_refetch_is_rate_limited(self):
+        fetcher = FakeFetcher(KEY_A)
+        verifier = GoogleTokenVerifier(fetch=fetcher, min_refetch_interval=60)
+        await verifier.verify(_token(KEY_A), CLIENT_ID)
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await verifier.verify(_token(KEY_B), CLIENT_ID)
+        assert fetcher.calls == 1
+
+    async def test_fetch_failure_without_cache(self):
+        fetcher = FakeFetcher(KEY_A)
+        fetcher.fail = True
+        verifier = GoogleTokenVerifier(fetch=fetcher)
+        with pytest.raises(GoogleKeysUnavailable):
+            await verifier.verify(_token(KEY_A), CLIENT_ID)
+
+    async def test_fetch_failure_keeps_stale_keys(self):
+        fetcher = FakeFetcher(KEY_A, max_age=0)
+        verifier = GoogleTokenVerifier(fetch=fetcher)
+        await verifier.verify(_token(KEY_A), CLIENT_ID)
+        fetcher.fail = True
+        claims = await verifier.verify(_token(KEY_A), CLIENT_ID)
+        assert claims["email"] == "user@example.com"
+
+    async def test_fetch_failure_backs_off_instead_of_refetching(self):
+        fetcher = FakeFetcher(KEY_A, max_age=0)
+        verifier = GoogleTokenVerifier(fetch=fetcher, failure_backoff=60)
+        await verifier.verify(_token(KEY_A), CLIENT_ID)
+        fetcher.fail = True
+        for _ in range(3):
+            await verifier.verify(_token(KEY_A), CLIENT_ID)
+        assert fetcher.calls == 2
+
+    async def test_empty_jwks_without_cache(self):
+        verifier = GoogleTokenVerifier(fetch=FakeFetcher())
+        with pytest.raises(GoogleKeysUnavailable):
+            await verifier.verify(_token(KEY_A), CLIENT_ID)
+
+    async def test_empty_jwks_keeps_cached_keys(self):
+        fetcher = FakeFetcher(KEY_A, max_age=0)
+        verifier = GoogleTokenVerifier(fetch=fetcher)
+        await verifier.verify(_token(KEY_A), CLIENT_ID)
+        fetcher.keys = []
+        claims = await verifier.verify(_token(KEY_A), CLIENT_ID)
+        assert claims["email"] == "user@example.com"
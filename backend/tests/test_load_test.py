@@ -0,0 +1,101 @@
+"""Tests for the load-test harness, the endpoint benchmark helpers and the service stubs."""
+
+import json
+import re
+
+import httpx
+import pytest
+from fastapi.routing import APIRoute
+
+from app.main import app
+from scripts.bench_endpoints import BASELINE_PATH, compare, endpoints
+from scripts.load_stubs import create_app
+from scripts.load_test import Stats, parse_mix, percentile
+
+
+class TestLoadTestSupport:
+    def test_percentile_is_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([7.0], 95) == 7
+        assert percentile([], 50) == 0
+
+    def test_parse_mix(self):
+        assert parse_mix(["browse=3", "booking=1"]) == {"browse": 3, "host": 0, "booking": 1, "messaging": 0}
+        with pytest.raises(ValueError):
+            parse_mix(["checkout=1"])
+        with pytest.raises(ValueError):
+            parse_mix(["browse=0"])
+
+    async def test_stats_count_errors_and_throttling(self):
+        statuses = iter([200, 500, 429, 200])
+        transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses)))
+        stats = Stats()
+        async with httpx.AsyncClient(transport=transport, base_url="http://api") as client:
+            await stats.request(client, "warm-up", "GET", "/")
+            stats.recording = True
+            for _ in range(3):
+                await stats.request(client, "GET /x", "GET", "/x")
+
+        row = stats.report(seconds=1.0)["GET /x"]
+        assert row["count"] == 3
+        assert row["errors"] == 2
+        assert row["throttled"] == 1
+        assert "warm-up" not in stats.report(seconds=1.0)
+
+
+class TestLoadStubs:
+    async def test_stubs_answer_like_the_real_services(self):
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://stubs") as client:
+            assert "id" in (await client.post("/emails", json={"to": "a@example.com"})).json()
+
+            first = (await client.get("/search", params={"q": "Boston, MA"})).json()
+            again = (await client.get("/search", params={"q": "boston, ma"})).json()
+            assert first[0]["lat"] == again[0]["lat"]
+            float(first[0]["lon"])
+
+            upload = (await client.post("/v1_1/demo/image/upload")).json()
+            assert upload["secure_url"].endswith(upload["public_id"])
+            assert (await client.post("/v1_1/demo/image/destroy")).json() == {"result": "ok"}
+
+            assert (await client.get("/calls")).json() == {"emails": 1, "search": 2, "upload": 1, "destroy": 1}
+
+
+class TestEndpointBenchmark:
+    def test_compare_flags_slowdowns_and_extra_queries(self):
+        baseline = {
+            "GET /api/conversations": {"p50_ms": 10.0, "p95_ms": 12.0, "queries": 3},
+            "GET /api/hosts/{id}/discover-artists": {"p50_ms": 20.0, "p95_ms": 30.0, "queries": 4},
+        }
+        results = {
+            "GET /api/conversations": {"p50_ms": 19.0, "p95_ms": 40.0, "queries": 4},
+            "GET /api/hosts/{id}/discover-artists": {"p50_ms": 41.0, "p95_ms": 45.0, "queries": 4},
+            "GET /api/categories": {"p50_ms": 1.0, "p95_ms": 1.0, "queries": 1},
+        }
+        assert compare(results, baseline, tolerance=1.0) == [
+            "GET /api/conversations: 4 queries vs baseline 3",
+            "GET /api/hosts/{id}/discover-artists: p50 41.00 ms vs baseline 20.00 ms (2.0x)",
+        ]
+
+    def test_query_only_baseline_checks_queries(self):
+        baseline = {"GET /api/conversations": {"queries": 3}}
+        results = {"GET /api/conversations": {"p50_ms": 500.0, "p95_ms": 900.0, "queries": 4}}
+        assert compare(results, baseline, tolerance=1.0) == ["GET /api/conversations: 4 queries vs baseline 3"]
+
+    def test_committed_baseline_covers_every_route(self):
+        baseline = json.loads(BASELINE_PATH.read_text())
+        labels = {e.label for e in endpoints({"artist": 1, "community": 2, "booking": 3, "conversation": 4})}
+        assert set(baseline) == labels
+        assert all(isinstance(row["queries"], int) for row in baseline.values())
+
+    def test_watched_routes_exist(self):
+        routes = {
+            f"{method} {re.sub(r'{[a-z_]+}', '{id}', route.path)}"
+            for route in app.routes if isinstance(route, APIRoute) for method in route.methods
+        }
+        labels = [e.label for e in endpoints({"artist": 1, "community": 2, "booking": 3, "conversation": 4})]
+        assert len(set(labels)) == 20
+        assert set(labels) <= routes
@@ -0,0 +1,128 @@
+"""Tests for the in-process metrics registry and /api/metrics."""
+
+import json
+import os
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.config import get_settings
+from app.main import app
+from app.metrics import (
+    Registry,
+    SnapshotExporter,
+    merge_snapshots,
+    observe_outbound,
+    outbound_latency,
+    render,
+    route_template,
+)
+
+
+@pytest.fixture
+async def plain_client():
+    """Client without DB overrides, for endpoints that don't touch the database."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+class TestRendering:
+    """Text exposition format."""
+
+    def test_counter_and_histogram(self):
+        registry = Registry()
+        requests = registry.counter("reqs_total", "Requests.", ("route",))
+        latency = registry.histogram("lat_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+        requests.inc("/a")
+        requests.inc("/a", amount=2)
+        latency.observe(0.05, "/a")
+        latency.observe(0.5, "/a")
+        latency.observe(5.0, "/a")
+
+        text = render(merge_snapshots([registry.snapshot()]))
+        assert "# TYPE reqs_total counter" in text
+        assert 'reqs_total{route="/a"} 3' in text
+        assert 'lat_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'lat_seconds_bucket{route="/a",le="1"} 2' in text
+        assert 'lat_seconds_bucket{route="/a",le="+Inf"} 3' in text
+        assert 'lat_seconds_count{route="/a"} 3' in text
+        assert 'lat_seconds_sum{route="/a"} 5.55' in text
+
+    def test_label_escaping(self):
+        registry = Registry()
+        registry.counter("c_total", "C.", ("path",)).inc('a"b\\c')
+        assert 'c_total{path="a\\"b\\\\c"} 1' in render(merge_snapshots([registry.snapshot()]))
+
+    def test_merge_sums_workers(self):
+        snapshots = []
+        for observed in (0.05, 0.5):
+            registry = Registry()
+            registry.counter("reqs_total", "Requests.", ("route",)).inc("/a")
+            registry.histogram("lat_seconds", "Latency.", ("route",), buckets=(0.1,)).observe(observed, "/a")
+            snapshots.append(registry.snapshot())
+
+        merged = merge_snapshots(snapshots)
+        assert merged["reqs_total"]["values"][("/a",)] == 2
+        assert merged["lat_seconds"]["values"][("/a",)] == ([1, 1], 0.55)
+
+
+class TestOutbound:
+    """observe_outbound records latency by outcome."""
+
+    def test_outcomes(self):
+        with observe_outbound("test-service"):
+            pass
+        with pytest.raises(RuntimeError):
+            with observe_outbound("test-service"):
+                raise RuntimeError("boom")
+
+        assert sum(outbound_latency.counts[("test-service", "ok")]) >= 1
+        assert sum(outbound_latency.counts[("test-service", "error")]) >= 1
+
+
+class TestSnapshotExporter:
+    """Multi-worker aggregation through snapshot files."""
+
+    def test_collect_merges_other_workers(self, tmp_path):
+        other = Registry()
+        other.counter("kolamba_http_requests_total", "Requests.", ("method", "route", "status")).inc(
+            "GET", "/other-worker", "200", amount=7
+        )
+        (tmp_path / "worker-1.json").write_text(json.dumps(other.snapshot()))
+
+        exporter = SnapshotExporter(str(tmp_path), interval=15, stale_after=60)
+        merged = exporter.collect()
+        assert merged["kolamba_http_requests_total"]["values"][("GET", "/other-worker", "200")] == 7
+        assert (tmp_path / f"worker-{os.getpid()}.json").exists()
+
+
+class TestMetricsEndpoint:
+    """GET /api/metrics and route templating."""
+
+    async def test_reports_templated_routes(self, plain_client: AsyncClient):
+        await plain_client.get("/")
+        await plain_client.get("/definitely/not/a/route")
+
+        response = await plain_client.get("/api/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'kolamba_http_requests_total{method="GET",route="/",status="200"}' in response.text
+        assert 'route="unmatched",status="404"' in response.text
+        assert "kolamba_db_pool_size" in response.text
+
+    async def test_token_required_when_configured(self, plain_client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(get_settings(), "metrics_token", "s3cret")
+        assert (await plain_client.get("/api/metrics")).status_code == 401
+        response = await plain_client.get("/api/metrics", headers={"Authorization": "Bearer s3cret"})
+        assert response.status_code == 200
+
+    async def test_not_served_without_token_outside_development(self, plain_client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(get_settings(), "env", "production")
+        assert (await plain_client.get("/api/metrics")).status_code == 404
+        monkeypatch.setattr(get_settings(), "metrics_token", "s3cret")
+        response = await plain_client.get("/api/metrics", headers={"Authorization": "Bearer s3cret"})
+        assert response.status_code == 200
+
+    def test_route_template_without_routing(self):
+        scope = {"type": "http", "method": "GET", "path": "/api/talents/42", "root_path": "", "app": app}
+        assert route_template(scope) == "/api/talents/{artist_id}"
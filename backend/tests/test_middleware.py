@@ -0,0 +1,97 @@
+"""Tests for the request middleware: access log, Cache-Control policy, metrics."""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.metrics import http_requests
+from app.middleware import RequestMiddleware, compile_cache_policies
+
+SHORT = b"public, max-age=60, stale-while-revalidate=300"
+LONG = b"public, max-age=300, stale-while-revalidate=600"
+
+
+@pytest.fixture
+def access_records():
+    """Records sent to the access logger (it doesn't propagate, so caplog can't see them)."""
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger("kolamba.access")
+    logger.addHandler(handler)
+    yield records
+    logger.removeHandler(handler)
+
+
+def _demo_app(metrics: bool = False) -> FastAPI:
+    demo = FastAPI()
+
+    @demo.get("/api/talents/{artist_id}")
+    async def talent(artist_id: int):
+        return {"id": artist_id}
+
+    @demo.post("/api/talents/{artist_id}")
+    async def update_talent(artist_id: int):
+        return {"id": artist_id}
+
+    @demo.get("/api/bookings")
+    async def bookings():
+        return []
+
+    @demo.get("/api/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk {i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    demo.add_middleware(RequestMiddleware, routes=demo.routes, metrics=metrics)
+    return demo
+
+
+class TestCachePolicies:
+    def test_table_covers_the_public_read_routes(self):
+        table = compile_cache_policies(app.routes)
+        assert table["/api/categories"] == LONG
+        assert table["/api/health"] == LONG
+        assert table["/api/talents/{artist_id}"] == SHORT
+        assert table["/api/search/artists"] == SHORT
+        assert "/api/bookings" not in table
+        assert "/api/conversations" not in table
+
+
+class TestRequestMiddleware:
+    async def test_cache_control_only_on_successful_gets(self):
+        async with AsyncClient(transport=ASGITransport(app=_demo_app()), base_url="http://test") as ac:
+            assert (await ac.get("/api/talents/1")).headers["cache-control"] == SHORT.decode()
+            assert "cache-control" not in (await ac.post("/api/talents/1")).headers
+            assert "cache-control" not in (await ac.get("/api/talents/abc")).headers
+            assert "cache-control" not in (await ac.get("/api/bookings")).headers
+
+    async def test_access_log_and_streaming(self, access_records):
+        async with AsyncClient(transport=ASGITransport(app=_demo_app()), base_url="http://test") as ac:
+            response = await ac.get("/api/stream")
+        assert response.text == "chunk 0\nchunk 1\nchunk 2\n"
+        [record] = access_records
+        assert record.getMessage().startswith("GET /api/stream 200 ")
+        assert record.access["route"] == "/api/stream"
+        assert record.access["request_id"] == response.headers["x-request-id"]
+
+    async def test_request_id_is_taken_from_the_caller_when_sane(self):
+        async with AsyncClient(transport=ASGITransport(app=_demo_app()), base_url="http://test") as ac:
+            given = await ac.get("/api/bookings", headers={"X-Request-ID": "edge-42.abc"})
+            bogus = await ac.get("/api/bookings", headers={"X-Request-ID": "no spaces <allowed>"})
+        assert given.headers["x-request-id"] == "edge-42.abc"
+        assert len(bogus.headers["x-request-id"]) == 32
+
+    async def test_metrics_by_route_template(self):
+        labels = ("GET", "/api/talents/{artist_id}", "200")
+        before = http_requests.values.get(labels, 0)
+        async with AsyncClient(transport=ASGITransport(app=_demo_app(metrics=True)), base_url="http://test") as ac:
+            await ac.get("/api/talents/7")
+            await ac.get("/api/talents/8")
+        assert http_requests.values[labels] == before + 2
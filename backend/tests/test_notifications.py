@@ -0,0 +1,358 @@
+"""Tests for notification endpoints and unread counters."""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import get_settings
+from app.models.artist import Artist
+from app.models.artist_tour_date import ArtistTourDate
+from app.models.community import Community
+from app.models.notification import Notification, NotificationArchive, NotificationCounter
+from app.models.scheduled_job import ScheduledJob
+from app.models.user import User
+from app.routers.notifications import create_notification
+from app.scheduler import JobScheduler, advisory_lock_key
+from app.services.notifications import (
+    get_unread_count,
+    notify_query,
+    notify_users,
+    purge_read_notifications,
+    reconcile_unread_counters,
+)
+
+
+def _auth(user: dict) -> dict:
+    return {"Authorization": f"Bearer {user['token']}"}
+
+
+async def _notify(db: AsyncSession, user_id: int, n: int = 1) -> list[Notification]:
+    created = [
+        await create_notification(db, user_id, "system", f"Notice {i}", "Body")
+        for i in range(n)
+    ]
+    await db.commit()
+    return created
+
+
+async def _count(client: AsyncClient, user: dict) -> int:
+    response = await client.get("/api/notifications/count", headers=_auth(user))
+    assert response.status_code == 200
+    return response.json()["unread_count"]
+
+
+class TestUnreadCounter:
+    """The unread counter follows create/read/delete."""
+
+    async def test_create_increments(self, client: AsyncClient, db_session: AsyncSession, test_user):
+        assert await _count(client, test_user) == 0
+        await _notify(db_session, test_user["user"].id, 3)
+        assert await _count(client, test_user) == 3
+
+    async def test_mark_read_decrements_once(self, client: AsyncClient, db_session: AsyncSession, test_user):
+        first, _ = await _notify(db_session, test_user["user"].id, 2)
+        for _ in range(2):
+            response = await client.put(f"/api/notifications/{first.id}/read", headers=_auth(test_user))
+            assert response.status_code == 200
+        assert await _count(client, test_user) == 1
+
+    async def test_mark_read_missing_is_404(self, client: AsyncClient, test_user):
+        response = await client.put("/api/notifications/999999999/read", headers=_auth(test_user))
+        assert response.status_code == 404
+
+    async def test_mark_all_read(self, client: AsyncClient, db_session: AsyncSession, test_user):
+        await _notify(db_session, test_user["user"].id, 4)
+        response = await client.put("/api/notifications/read-all", headers=_auth(test_user))
+        assert response.status_code == 200
+        assert await _count(client, test_user) == 0
+
+    async def test_delete_unread_decrements(self, client: AsyncClient, db_session: AsyncSession, test_user):
+        first, second = await _notify(db_session, test_user["user"].id, 2)
+        await client.put(f"/api/notifications/{first.id}/read", headers=_auth(test_user))
+
+        response = await client.delete(f"/api/notifications/{first.id}", headers=_auth(test_user))
+        assert response.status_code == 200
+        assert await _count(client, test_user) == 1
+
+        response = await client.delete(f"/api/notifications/{second.id}", headers=_auth(test_user))
+        assert response.status_code == 200
+        assert await _count(client, test_user) == 0
+
+    async def test_other_users_notification(
+        self, client: AsyncClient, db_session: AsyncSession, test_user, test_artist_user
+    ):
+        (notification,) = await _notify(db_session, test_artist_user["user"].id)
+        response = await client.put(f"/api/notifications/{notification.id}/read", headers=_auth(test_user))
+        assert response.status_code == 404
+        response = await client.delete(f"/api/notifications/{notification.id}", headers=_auth(test_user))
+        assert response.status_code == 404
+        assert await get_unread_count(db_session, test_artist_user["user"].id) == 1
+
+
+class TestReconcile:
+    """reconcile_unread_counters repairs drifted counters."""
+
+    async def test_repairs_drift(self, db_session: AsyncSession, test_user):
+        user_id = test_user["user"].id
+        await _notify(db_session, user_id, 2)
+        await db_session.execute(
+            update(NotificationCounter).where(NotificationCounter.user_id == user_id).values(unread_count=7)
+        )
+        await db_session.commit()
+
+        result = await reconcile_unread_counters(db_session)
+        assert result["corrected"] >= 1
+        assert await get_unread_count(db_session, user_id) == 2
+
+    async def test_zeroes_counter_without_unread(self, db_session: AsyncSession, test_user):
+        user_id = test_user["user"].id
+        db_session.add(NotificationCounter(user_id=user_id, unread_count=5))
+        await db_session.commit()
+
+        await reconcile_unread_counters(db_session)
+        assert await get_unread_count(db_session, user_id) == 0
+
+
+async def _notification_count(db: AsyncSession, user_id: int, type: str) -> int:
+    result = await db.execute(
+        select(func.count(Notification.id)).where(Notification.user_id == user_id, Notification.type == type)
+    )
+    return result.scalar()
+
+
+class TestBulkNotifications:
+    """notify_users / notify_query fan-out."""
+
+    async def test_notify_users_chunks_and_dedupes(
+        self, db_session: AsyncSession, test_user, test_artist_user, test_admin
+    ):
+        ids = [test_user["user"].id, test_artist_user["user"].id, test_admin["user"].id]
+        result = await notify_users(db_session, ids + ids[:1], "announcement", "Hello", "Body", chunk_size=2)
+        await db_session.commit()
+
+        assert result == {"recipients": 3, "chunks": 2}
+        for user_id in ids:
+            assert await _notification_count(db_session, user_id, "announcement") == 1
+            assert await get_unread_count(db_session, user_id) == 1
+
+    async def test_notify_query_bumps_existing_counters(self, db_session: AsyncSession, test_user):
+        user_id = test_user["user"].id
+        await _notify(db_session, user_id)
+
+        result = await notify_query(
+            db_session, select(User.id).where(User.id == user_id), "announcement", "Hello", "Body"
+        )
+        await db_session.commit()
+
+        assert result["recipients"] == 1
+        assert await get_unread_count(db_session, user_id) == 2
+
+    async def test_admin_broadcast(self, client: AsyncClient, db_session: AsyncSession, test_admin, test_user):
+        response = await client.post(
+            "/api/admin/notifications/broadcast",
+            json={"title": "Maintenance", "message": "Back soon", "role": "community"},
+            headers=_auth(test_admin),
+        )
+        assert response.status_code == 200
+        assert response.json()["recipients"] >= 1
+        assert await _notification_count(db_session, test_user["user"].id, "announcement") == 1
+        assert await _notification_count(db_session, test_admin["user"].id, "announcement") == 0
+
+    async def test_admin_broadcast_rejects_unknown_role(self, client: AsyncClient, test_admin):
+        response = await client.post(
+            "/api/admin/notifications/broadcast",
+            json={"title": "x", "message": "y", "role": "robots"},
+            headers=_auth(test_admin),
+        )
+        assert response.status_code == 400
+
+    async def test_admin_broadcast_requires_superuser(self, client: AsyncClient, test_user):
+        response = await client.post(
+            "/api/admin/notifications/broadcast",
+            json={"title": "x", "message": "y"},
+            headers=_auth(test_user),
+        )
+        assert response.status_code == 403
+
+    async def test_tour_date_notifies_nearby_communities(
+        self, client: AsyncClient, db_session: AsyncSession, test_user, test_artist_user, test_admin
+    ):
+        artist = Artist(user_id=test_artist_user["user"].id, name_en="Touring Talent", name_he="אמן", status="active")
+        near = Community(
+            user_id=test_user["user"].id, name="Near", location="Newark, USA",
+            latitude=40.7357, longitude=-74.1724, receive_artist_offers=True, status="active",
+        )
+        far = Community(
+            user_id=test_admin["user"].id, name="Far", location="Los Angeles, USA",
+            latitude=34.0522, longitude=-118.2437, receive_artist_offers=True, status="active",
+        )
+        db_session.add_all([artist, near, far])
+        await db_session.commit()
+
+        response = await client.post(
+            f"/api/talents/{artist.id}/tour-dates",
+            json={
+                "location": "New York, USA",
+                "latitude": 40.7128,
+                "longitude": -74.0060,
+                "start_date": (date.today() + timedelta(days=30)).isoformat(),
+            },
+            headers=_auth(test_artist_user),
+        )
+        assert response.status_code == 200
+        assert await _notification_count(db_session, test_user["user"].id, "tour_opportunity") == 1
+        assert await _notification_count(db_session, test_admin["user"].id, "tour_opportunity") == 0
+
+    async def test_tour_date_for_someone_elses_talent_is_forbidden(
+        self, client: AsyncClient, db_session: AsyncSession, test_user, test_artist_user
+    ):
+        artist = Artist(user_id=test_artist_user["user"].id, name_en="Touring Talent", name_he="אמן", status="active")
+        near = Community(
+            user_id=test_user["user"].id, name="Near", location="Newark, USA",
+            latitude=40.7357, longitude=-74.1724, receive_artist_offers=True, status="active",
+        )
+        db_session.add_all([artist, near])
+        await db_session.commit()
+
+        response = await client.post(
+            f"/api/talents/{artist.id}/tour-dates",
+            json={
+                "location": "New York, USA",
+                "latitude": 40.7128,
+                "longitude": -74.0060,
+                "start_date": (date.today() + timedelta(days=30)).isoformat(),
+            },
+            headers=_auth(test_user),
+        )
+        assert response.status_code == 403
+        assert await _notification_count(db_session, test_user["user"].id, "tour_opportunity") == 0
+        tour_dates = await db_session.scalar(
+            select(func.count()).select_from(ArtistTourDate).where(ArtistTourDate.artist_id == artist.id)
+        )
+        assert tour_dates == 0
+
+
+class TestRetention:
+    """purge_read_notifications removes old read notifications only."""
+
+    @pytest.fixture
+    async def aged(self, db_session: AsyncSession, test_user) -> dict:
+        user_id = test_user["user"].id
+        old = datetime.now(timezone.utc) - timedelta(days=200)
+        rows = {
+            "old_read": [Notification(user_id=user_id, type="system", title="old", message="m",
+                                      is_read=True, created_at=old) for _ in range(5)],
+            "old_unread": [Notification(user_id=user_id, type="system", title="old", message="m",
+                                        is_read=False, created_at=old)],
+            "new_read": [Notification(user_id=user_id, type="system", title="new", message="m", is_read=True)],
+        }
+        for group in rows.values():
+            db_session.add_all(group)
+        await db_session.commit()
+        return {k: [n.id for n in v] for k, v in rows.items()}
+
+    async def _remaining(self, db: AsyncSession, ids: list[int]) -> int:
+        result = await db.execute(select(func.count(Notification.id)).where(Notification.id.in_(ids)))
+        return result.scalar()
+
+    async def test_delete_in_batches(self, db_session: AsyncSession, aged):
+        result = await purge_read_notifications(db_session, retention_days=90, mode="delete", batch_size=2)
+
+        assert result["removed"] >= 5
+        assert result["batches"] >= 3
+        assert result["bytes_reclaimed"] > 0
+        assert await self._remaining(db_session, aged["old_read"]) == 0
+        assert await self._remaining(db_session, aged["old_unread"]) == 1
+        assert await self._remaining(db_session, aged["new_read"]) == 1
+
+    async def test_archive_mode(self, db_session: AsyncSession, aged):
+        await purge_read_notifications(db_session, retention_days=90, mode="archive", batch_size=100)
+
+        assert await self._remaining(db_session, aged["old_read"]) == 0
+        archived = await db_session.execute(
+            select(func.count(NotificationArchive.id)).where(NotificationArchive.id.in_(aged["old_read"]))
+        )
+        assert archived.scalar() == 5
+
+    async def test_disabled(self, db_session: AsyncSession, aged):
+        result = await purge_read_notifications(db_session, retention_days=0)
+        assert result["removed"] == 0
+        assert await self._remaining(db_session, aged["old_read"]) == 5
+
+    async def test_unknown_mode(self, db_session: AsyncSession):
+        with pytest.raises(ValueError):
+            await purge_read_notifications(db_session, retention_days=90, mode="shred")
+
+
+class TestScheduler:
+    """Job registration (no database needed)."""
+
+    def test_duplicate_job_rejected(self):
+        scheduler = JobScheduler()
+
+        async def job(db):
+            return {}
+
+        scheduler.add_job("noop", job, interval=60)
+        with pytest.raises(ValueError):
+            scheduler.add_job("noop", job, interval=60)
+        assert scheduler.status()["noop"]["runs"] == 0
+
+    def test_lock_key_is_stable(self):
+        assert advisory_lock_key("a") == advisory_lock_key("a")
+        assert advisory_lock_key("a") != advisory_lock_key("b")
+        assert 0 <= advisory_lock_key("a") < 2**32
+
+
+class TestSchedulerAcrossWorkers:
+    """Two schedulers sharing a database run a job once per interval."""
+
+    @pytest.fixture
+    async def engine(self, db_session: AsyncSession):
+        # The scheduler commits on its own connections, outside the test transaction
+        engine = create_async_engine(get_settings().database_url)
+        yield engine
+        async with engine.begin() as conn:
+            await conn.execute(delete(ScheduledJob).where(ScheduledJob.name.like("test-%")))
+        await engine.dispose()
+
+    def _workers(self, engine, name: str, calls: list) -> list[JobScheduler]:
+        async def job(db):
+            calls.append(name)
+            return {"ok": True}
+
+        workers = [JobScheduler(engine, async_sessionmaker(engine)) for _ in range(2)]
+        for worker in workers:
+            worker.add_job(name, job, interval=60)
+        return workers
+
+    async def test_one_run_per_interval(self, engine):
+        name, calls = f"test-{uuid.uuid4().hex}", []
+        first, second = self._workers(engine, name, calls)
+
+        assert await first.run_job(name) == {"ok": True}
+        assert await second.run_job(name) is None
+        assert await first.run_job(name) is None
+        assert calls == [name]
+
+        # One interval later, whichever worker ticks first runs it
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(ScheduledJob).where(ScheduledJob.name == name)
+                .values(last_run_at=ScheduledJob.last_run_at - timedelta(seconds=61))
+            )
+        assert await second.run_job(name) == {"ok": True}
+        assert await first.run_job(name) is None
+        assert calls == [name, name]
+
+    async def test_force_runs_even_if_not_due(self, engine):
+        name, calls = f"test-{uuid.uuid4().hex}", []
+        first, second = self._workers(engine, name, calls)
+
+        await first.run_job(name)
+        assert await second.run_job(name, force=True) == {"ok": True}
+        assert len(calls) == 2
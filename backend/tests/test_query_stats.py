@@ -0,0 +1,90 @@
+"""Tests for per-request query counting and N+1 detection."""
+
+import logging
+
+from httpx import ASGITransport, AsyncClient
+
+from app.query_stats import (
+    QueryInspectorMiddleware,
+    _after_cursor_execute,
+    _before_cursor_execute,
+    statement_shape,
+    track_queries,
+    unattributed,
+)
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.info = {}
+
+
+def _run(statement: str, conn=None) -> None:
+    """Fire the cursor events as SQLAlchemy would around one statement."""
+    conn = conn or _FakeConnection()
+    _before_cursor_execute(conn, None, statement, None, None, False)
+    _after_cursor_execute(conn, None, statement, None, None, False)
+
+
+class TestStatementShape:
+    def test_whitespace_is_collapsed(self):
+        assert statement_shape("SELECT a\n  FROM t\n WHERE id = $1") == "SELECT a FROM t WHERE id = $1"
+
+    def test_placeholder_lists_match(self):
+        two = statement_shape("SELECT a FROM t WHERE id IN ($1, $2)")
+        three = statement_shape("SELECT a FROM t WHERE id IN ($1, $2, $3)")
+        assert two == three
+
+
+class TestTrackQueries:
+    def test_counts_statements_and_shapes(self):
+        with track_queries(statements=True) as stats:
+            for _ in range(3):
+                _run("SELECT artists.id FROM artists WHERE artists.user_id = $1")
+            _run("SELECT users.id FROM users WHERE users.id = $1")
+        assert stats.queries == 4
+        assert stats.seconds >= 0
+        assert stats.repeated(3) == [("SELECT artists.id FROM artists WHERE artists.user_id = $1", 3)]
+        assert stats.repeated(4) == []
+
+    def test_nested_recorders_both_see_statements(self):
+        with track_queries() as outer:
+            _run("SELECT 1")
+            with track_queries() as inner:
+                _run("SELECT 2")
+        assert outer.queries == 2
+        assert inner.queries == 1
+        assert inner.statements is None
+
+    def test_untracked_statements_are_unattributed(self):
+        before = unattributed.queries
+        _run("SELECT 1")
+        assert unattributed.queries == before + 1
+
+
+class TestQueryInspectorMiddleware:
+    @staticmethod
+    def _app(statements: list[str]):
+        async def app(scope, receive, send):
+            for statement in statements:
+                _run(statement)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+        return app
+
+    async def test_headers(self):
+        app = QueryInspectorMiddleware(self._app(["SELECT 1", "SELECT 2"]), threshold=2)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.get("/x")
+        assert response.headers["x-db-queries"] == "2"
+        assert float(response.headers["x-db-time-ms"]) >= 0
+        assert response.headers["x-db-repeated"] == "0"
+
+    async def test_repeated_statement_is_flagged(self, caplog):
+        lookup = "SELECT communities.id FROM communities WHERE communities.user_id = $1"
+        app = QueryInspectorMiddleware(self._app([lookup] * 3), threshold=3)
+        with caplog.at_level(logging.WARNING, logger="kolamba.queries"):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+                response = await ac.get("/bookings/1")
+        assert response.headers["x-db-repeated"] == "1"
+        assert "Probable N+1 on GET /bookings/1: statement ran 3 times" in caplog.text
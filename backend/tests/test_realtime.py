@@ -0,0 +1,109 @@
+"""Tests for the real-time event broker and SSE endpoint."""
+
+import asyncio
+import json
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.routers.events import _format_event
+from app.services import realtime
+from app.services.realtime import PostgresFanout, RealtimeBroker, publish_after_commit, realtime_broker
+
+
+class TestRealtimeBroker:
+    def test_deliver_to_subscribers_of_user(self):
+        broker = RealtimeBroker()
+        alice = broker.subscribe(1)
+        alice_other_tab = broker.subscribe(1)
+        bob = broker.subscribe(2)
+
+        delivered = broker.deliver([1], {"type": "notification", "id": 7})
+
+        assert delivered == 2
+        assert alice.queue.get_nowait()["id"] == 7
+        assert alice_other_tab.queue.get_nowait()["id"] == 7
+        assert bob.queue.empty()
+
+    def test_unsubscribe(self):
+        broker = RealtimeBroker()
+        sub = broker.subscribe(1)
+        broker.unsubscribe(sub)
+        assert broker.deliver([1], {"type": "x"}) == 0
+        assert broker.connection_count == 0
+
+    def test_slow_client_drops_oldest(self):
+        broker = RealtimeBroker()
+        sub = broker.subscribe(1)
+        for i in range(sub.queue.maxsize + 5):
+            broker.deliver([1], {"type": "x", "n": i})
+        assert sub.queue.qsize() == sub.queue.maxsize
+        assert sub.queue.get_nowait()["n"] == 5
+
+    async def test_publish_without_fanout_is_local(self):
+        broker = RealtimeBroker()
+        sub = broker.subscribe(3)
+        await broker.publish([3, 3], {"type": "message"})
+        assert sub.queue.qsize() == 1
+
+    def test_fanout_notification_delivers_locally(self):
+        broker = RealtimeBroker()
+        fanout = PostgresFanout(broker, connect_kwargs={})
+        sub = broker.subscribe(4)
+        fanout._on_notify(None, 0, "kolamba_events", json.dumps({"u": [4], "e": {"type": "message"}}))
+        fanout._on_notify(None, 0, "kolamba_events", "not json")
+        assert sub.queue.qsize() == 1
+
+
+class TestPublishAfterCommit:
+    async def test_published_on_commit(self):
+        sub = realtime_broker.subscribe(101)
+        try:
+            session = Session()
+            publish_after_commit(session, [101], {"type": "notification", "id": 1})
+            assert sub.queue.empty()
+            session.commit()
+            await asyncio.sleep(0)
+            assert sub.queue.get_nowait()["id"] == 1
+        finally:
+            realtime_broker.unsubscribe(sub)
+
+    async def test_discarded_on_rollback(self):
+        sub = realtime_broker.subscribe(102)
+        try:
+            session = Session()
+            session.begin()
+            publish_after_commit(session, [102], {"type": "notification", "id": 2})
+            session.rollback()
+            session.commit()
+            await asyncio.sleep(0)
+            assert sub.queue.empty()
+        finally:
+            realtime_broker.unsubscribe(sub)
+
+    async def test_failed_publish_is_logged(self, monkeypatch, caplog):
+        async def broken(user_ids, evt):
+            raise ConnectionResetError("fan-out gone")
+
+        monkeypatch.setattr(realtime_broker, "publish", broken)
+        session = Session()
+        publish_after_commit(session, [103], {"type": "notification", "id": 3})
+        session.commit()
+        assert len(realtime._publish_tasks) == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)  # Done callbacks run on the next loop iteration
+        assert not realtime._publish_tasks
+        assert "Publishing notification event failed: fan-out gone" in caplog.text
+
+
+class TestEventStream:
+    def test_event_format(self):
+        assert _format_event({"type": "message", "id": 1}) == 'event: message\ndata: {"type": "message", "id": 1}\n\n'
+
+    async def test_stream_requires_token(self):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/api/events/stream")
+            assert response.status_code == 401
+            response = await client.get("/api/events/stream", params={"token": "garbage"})
+            assert response.status_code == 401
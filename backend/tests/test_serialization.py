@@ -0,0 +1,128 @@
+"""Tests for the orjson response class and the row serializer fast path."""
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field, ValidationError, field_serializer, model_serializer
+
+from app.main import app
+from app.routers.communities import MapLocation, community_locations, tour_date_locations
+from app.routers.conversations import inbox_serializer
+from app.schemas.conversation import ConversationListItem
+from app.schemas.discover import DiscoverArtistItem
+from app.serialization import ORJSONResponse, RowSerializer
+
+UPDATED = datetime(2026, 9, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+
+
+def _inbox_row(**overrides) -> SimpleNamespace:
+    row = {
+        "id": 1,
+        "booking_id": 7,
+        "last_message_preview": "שלום, see you at 8",
+        "last_message_at": UPDATED,
+        "last_sender_id": 3,
+        "message_count": 4,
+        "updated_at": UPDATED,
+        "status": "approved",
+        "name_en": None,
+        "name_he": "אמן",
+        "name": "Leeds Hebrew Congregation",
+    }
+    return SimpleNamespace(**{**row, **overrides})
+
+
+class TestORJSONResponse:
+    def test_matches_json_response(self):
+        content = {"name": "קהילה", "ratio": 0.5, "ids": [1, 2], "nothing": None, 3: "int key"}
+        assert json.loads(ORJSONResponse(content).body) == json.loads(json.dumps(content))
+
+    def test_renders_dates_and_decimals(self):
+        body = ORJSONResponse({"at": UPDATED, "on": date(2026, 9, 1), "lat": Decimal("51.5")}).body
+        assert json.loads(body) == {"at": "2026-09-01T12:30:15.250000Z", "on": "2026-09-01", "lat": 51.5}
+
+    def test_is_the_app_default(self):
+        assert app.router.default_response_class is ORJSONResponse
+
+
+class TestRowSerializer:
+    def test_inbox_matches_the_model_path(self):
+        rows = [_inbox_row(), _inbox_row(id=2, name_en="Artist", last_message_at=None, status=None)]
+        expected = jsonable_encoder([
+            ConversationListItem(
+                id=row.id, booking_id=row.booking_id, artist_name=row.name_en or row.name_he,
+                community_name=row.name, last_message=row.last_message_preview,
+                last_message_at=row.last_message_at, last_sender_id=row.last_sender_id,
+                message_count=row.message_count, booking_status=row.status, updated_at=row.updated_at,
+            )
+            for row in rows
+        ])
+        response = inbox_serializer.response(rows)
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == expected
+
+    def test_map_locations_match_the_model_path(self):
+        community = SimpleNamespace(id=1, name="Paris", latitude=Decimal("48.85"), longitude=Decimal("2.35"), location="Paris, France")
+        tour_date = SimpleNamespace(
+            id=2, name_en=None, latitude=Decimal("51.5"), longitude=Decimal("-0.12"),
+            location="London", start_date=date(2026, 10, 4),
+        )
+        assert community_locations.rows([community]) == [MapLocation(
+            id=1, name="Paris", latitude=48.85, longitude=2.35, type="community", details="Paris, France",
+        ).model_dump()]
+        assert tour_date_locations.rows([tour_date]) == [MapLocation(
+            id=2, name="Artist Tour", latitude=51.5, longitude=-0.12, type="tour_date", details="London - 2026-10-04",
+        ).model_dump()]
+
+    def test_empty(self):
+        assert inbox_serializer.response([]).body == b"[]"
+
+    def test_first_row_is_validated(self):
+        with pytest.raises(ValidationError):
+            inbox_serializer.rows([_inbox_row(updated_at=None)])
+
+    def test_rejects_schemas_it_cannot_render_faithfully(self):
+        class Nested(BaseModel):
+            location: Optional[MapLocation] = None
+
+        with pytest.raises(TypeError, match="computed fields"):
+            RowSerializer(DiscoverArtistItem)
+        with pytest.raises(TypeError, match="not a plain JSON type"):
+            RowSerializer(Nested)
+        with pytest.raises(TypeError, match="no fields"):
+            RowSerializer(MapLocation, nickname=lambda row: row.name)
+
+    def test_rejects_schemas_that_serialize_differently_from_their_fields(self):
+        class Rounded(BaseModel):
+            distance_km: float
+
+            @field_serializer("distance_km")
+            def round_distance(self, value: float) -> float:
+                return round(value, 1)
+
+        class Wrapped(BaseModel):
+            id: int
+
+            @model_serializer
+            def wrap(self) -> dict:
+                return {"data": {"id": self.id}}
+
+        class Aliased(BaseModel):
+            id: int
+            name: str = Field(alias="displayName")
+
+        class SerializedAs(BaseModel):
+            id: int
+            name: str = Field(serialization_alias="displayName")
+
+        for model in (Rounded, Wrapped):
+            with pytest.raises(TypeError, match="custom serializers"):
+                RowSerializer(model)
+        for model in (Aliased, SerializedAs):
+            with pytest.raises(TypeError, match="renamed by an alias"):
+                RowSerializer(model)
@@ -0,0 +1,88 @@
+"""Tests for the slow-query log."""
+
+from datetime import date
+
+from httpx import AsyncClient
+
+from app.slow_queries import SlowQueryLog, _request_scope, redact_parameters, slow_query_log
+
+
+def _auth(user: dict) -> dict:
+    return {"Authorization": f"Bearer {user['token']}"}
+
+
+class TestRedaction:
+    def test_text_is_replaced_by_length(self):
+        assert redact_parameters(("someone@example.com", 42, None, True, date(2026, 1, 2))) == [
+            "<str len=19>", 42, None, True, "2026-01-02",
+        ]
+
+    def test_nested_and_unknown_values(self):
+        assert redact_parameters({"ids": [1, 2], "blob": b"\x00\x01", "obj": object()}) == {
+            "ids": [1, 2], "blob": "<bytes len=2>", "obj": "<object>",
+        }
+
+
+class TestSlowQueryLog:
+    def test_groups_by_shape(self):
+        log = SlowQueryLog(threshold_ms=100)
+        log.record("SELECT * FROM users WHERE id IN ($1, $2)", (1, 2), 150)
+        log.record("SELECT * FROM users\n WHERE id IN ($1, $2, $3)", (1, 2, 3), 250)
+
+        [entry] = log.report()
+        assert entry["count"] == 2
+        assert entry["total_ms"] == 400
+        assert entry["max_ms"] == 250
+        assert entry["avg_ms"] == 200
+        assert entry["last_route"] == "background"
+        assert entry["parameters"] == [1, 2, 3]
+        assert entry["plan"] is None
+
+    def test_report_is_slowest_in_total_first(self):
+        log = SlowQueryLog(threshold_ms=100)
+        log.record("SELECT 1", (), 500)
+        for _ in range(3):
+            log.record("SELECT 2", (), 200)
+        assert [e["shape"] for e in log.report()] == ["SELECT 2", "SELECT 1"]
+        assert [e["shape"] for e in log.report(limit=1)] == ["SELECT 2"]
+
+    def test_cheapest_shape_is_evicted(self):
+        log = SlowQueryLog(threshold_ms=100, max_entries=2)
+        log.record("SELECT 1", (), 300)
+        log.record("SELECT 2", (), 150)
+        log.record("SELECT 3", (), 200)
+        assert set(log.entries) == {"SELECT 1", "SELECT 3"}
+
+    def test_route_comes_from_request_scope(self):
+        class Route:
+            path = "/api/talents/{artist_id}"
+
+        log = SlowQueryLog(threshold_ms=100)
+        token = _request_scope.set({"type": "http", "route": Route()})
+        try:
+            entry = log.record("SELECT 1", (), 120)
+        finally:
+            _request_scope.reset(token)
+        assert entry.last_route == "/api/talents/{artist_id}"
+
+    def test_disabled_by_default(self):
+        assert SlowQueryLog(threshold_ms=0).enabled is False
+
+
+class TestSlowQueryEndpoint:
+    async def test_superuser_only(self, client: AsyncClient, test_user):
+        response = await client.get("/api/admin/slow-queries", headers=_auth(test_user))
+        assert response.status_code == 403
+
+    async def test_list_and_clear(self, client: AsyncClient, test_admin):
+        slow_query_log.record("SELECT pg_sleep($1)", (1,), 1000)
+        try:
+            data = (await client.get("/api/admin/slow-queries", headers=_auth(test_admin))).json()
+            assert "SELECT pg_sleep($1)" in [q["shape"] for q in data["queries"]]
+
+            response = await client.delete("/api/admin/slow-queries", headers=_auth(test_admin))
+            assert response.status_code == 200
+            data = (await client.get("/api/admin/slow-queries", headers=_auth(test_admin))).json()
+            assert data["queries"] == []
+        finally:
+            slow_query_log.clear()
@@ -0,0 +1,91 @@
+"""Tests for cold-start cost: import-time budget, lazy integrations and warm-up."""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import warmup
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+# Generous so slow CI machines pass; it catches a heavy import sneaking back in
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "3500"))
+LAZY_MODULES = ("cloudinary", "resend", "httpx", "redis", "google")
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=120, check=True,
+    )
+
+
+class TestImportTime:
+    def test_heavy_integrations_load_on_first_use(self):
+        result = _python("-c", (
+            "import json, sys, app.main; "
+            f"print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] in {LAZY_MODULES!r})))"
+        ))
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+    def test_app_import_within_budget(self):
+        result = _python("-X", "importtime", "-c", "import app.main")
+        # "import time: self [us] | cumulative | imported package"
+        cumulative = {
+            line.split("|")[2].strip(): int(line.split("|")[1])
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+        }
+        slowest = sorted(
+            ((us, name) for name, us in cumulative.items() if name.count(".") <= 1), reverse=True,
+        )[:10]
+        report = ", ".join(f"{name} {us / 1000:.0f}ms" for us, name in slowest)
+        assert cumulative["app.main"] / 1000 < IMPORT_TIME_BUDGET_MS, f"import app.main is over budget: {report}"
+
+
+class TestWarmup:
+    async def test_prime_pool(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        try:
+            assert await warmup.prime_pool(engine, 2) == 2
+        finally:
+            await engine.dispose()
+
+    async def test_in_process_get_runs_the_app(self):
+        demo = FastAPI()
+
+        @demo.get("/api/categories")
+        async def categories():
+            return []
+
+        @demo.get("/api/stream")
+        async def stream():
+            async def chunks():
+                yield "ok"
+            return StreamingResponse(chunks())
+
+        assert await warmup._get(demo, "/api/categories") == 200
+        assert await asyncio.wait_for(warmup._get(demo, "/api/stream"), timeout=5) == 200
+        assert await warmup._get(demo, "/api/missing") == 404
+
+    async def test_timeout_does_not_block_startup(self, monkeypatch, caplog):
+        async def slow(app):
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(warmup, "_warm_up", slow)
+        monkeypatch.setattr(warmup.settings, "warmup_timeout_seconds", 0.01)
+        await warmup.warm_up(FastAPI())
+        assert "Warm-up timed out" in caplog.text
+
+    async def test_failure_does_not_block_startup(self, monkeypatch, caplog):
+        async def broken(app):
+            raise ConnectionRefusedError("database is down")
+
+        monkeypatch.setattr(warmup, "_warm_up", broken)
+        await warmup.warm_up(FastAPI())
+        assert "database is down" in caplog.text
@@ -329,3 +329,30 @@ class TestFilterBookingsByDateWindow:
         groups = filter_bookings_by_date_window(bookings, date_range_days=30)
         assert len(groups) == 1
         assert len(groups[0]) == 2
+
+
+# ── benchmark data and baselines ─────────────────────────────
+
+class TestBenchmarkSupport:
+    def test_synthetic_data_is_deterministic(self):
+        from scripts.synthetic import synthetic_bookings, synthetic_communities
+
+        start = date(2026, 9, 1)
+        assert synthetic_communities(50, seed=7) == synthetic_communities(50, seed=7)
+        assert synthetic_bookings(50, 50, seed=7, start=start) == synthetic_bookings(50, 50, seed=7, start=start)
+
+    def test_synthetic_communities_cluster_around_centres(self):
+        from scripts.synthetic import CENTRES, synthetic_communities
+
+        for c in synthetic_communities(200, seed=1):
+            nearest = min(haversine_distance(c["latitude"], c["longitude"], k.latitude, k.longitude) for k in CENTRES)
+            assert nearest < 250
+
+    def test_compare_flags_regressions_beyond_tolerance(self):
+        from scripts.bench_tour_grouping import compare
+
+        baseline = {"case": {"100": 0.010, "1000": 1.0}}
+        results = {"case": {"100": 0.012, "1000": 1.5}, "new_case": {"100": 5.0}}
+        regressions = compare(results, baseline, tolerance=0.25)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("case @ 1000")
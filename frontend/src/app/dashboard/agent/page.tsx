@@ -42,13 +42,19 @@ interface AgentBooking {
   id: number;
   artist_id: number;
   artist_name: string;
-  location: string;
-  requested_date: string;
-  budget: number;
+  location: string | null;
+  requested_date: string | null;
+  budget: number | null;
   status: string;
   created_at: string;
 }
 
+interface AgentBookingsPage {
+  bookings: AgentBooking[];
+  total: number;
+  has_more: boolean;
+}
+
 interface ArtistProfileData {
   id: number;
   name_he: string;
@@ -423,6 +429,9 @@ export default function AgentDashboardPage() {
   const [artists, setArtists] = useState<AgentArtist[]>([]);
   const [stats, setStats] = useState<AgentStats | null>(null);
   const [bookings, setBookings] = useState<AgentBooking[]>([]);
+  const [bookingsTotal, setBookingsTotal] = useState(0);
+  const [hasMoreBookings, setHasMoreBookings] = useState(false);
+  const [isLoadingMoreBookings, setIsLoadingMoreBookings] = useState(false);
   const [activeTab, setActiveTab] = useState<"artists" | "bookings">("artists");
   const [editingArtistId, setEditingArtistId] = useState<number | null>(null);
 
@@ -465,8 +474,10 @@ export default function AgentDashboardPage() {
       }
 
       if (bookingsRes.ok) {
-        const bookingsData = await bookingsRes.json();
-        setBookings(bookingsData);
+        const page: AgentBookingsPage = await bookingsRes.json();
+        setBookings(page.bookings);
+        setBookingsTotal(page.total);
+        setHasMoreBookings(page.has_more);
       }
     } catch (error) {
       console.error("Failed to fetch dashboard data:", error);
@@ -475,6 +486,32 @@ export default function AgentDashboardPage() {
     }
   };
 
+  const loadMoreBookings = async () => {
+    setIsLoadingMoreBookings(true);
+    try {
+      const token = localStorage.getItem("access_token");
+      const params = new URLSearchParams({ offset: String(bookings.length) });
+      const res = await fetch(`${API_URL}/agents/me/bookings?${params}`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
+
+      if (res.ok) {
+        const page: AgentBookingsPage = await res.json();
+        // A booking created since the first page shifts the offsets by one
+        setBookings((prev) => {
+          const seen = new Set(prev.map((b) => b.id));
+          return [...prev, ...page.bookings.filter((b) => !seen.has(b.id))];
+        });
+        setBookingsTotal(page.total);
+        setHasMoreBookings(page.has_more);
+      }
+    } catch (error) {
+      console.error("Failed to load more bookings:", error);
+    } finally {
+      setIsLoadingMoreBookings(false);
+    }
+  };
+
   useEffect(() => {
     fetchDashboardData();
   }, []);
@@ -589,7 +626,7 @@ export default function AgentDashboardPage() {
                 : "bg-white text-slate-600 hover:bg-slate-100"
             }`}
           >
-            All Bookings ({bookings.length})
+            All Bookings ({bookingsTotal})
           </button>
         </div>
 
@@ -646,6 +683,16 @@ export default function AgentDashboardPage() {
                 ))}
               </div>
             )}
+            {hasMoreBookings && (
+              <button
+                onClick={loadMoreBookings}
+                disabled={isLoadingMoreBookings}
+                className="w-full flex items-center justify-center gap-2 py-3 text-sm font-medium text-primary-600 hover:text-primary-700 disabled:opacity-50"
+              >
+                {isLoadingMoreBookings && <Loader2 size={16} className="animate-spin" />}
+                Load more bookings
+              </button>
+            )}
           </div>
         )}
       </div>
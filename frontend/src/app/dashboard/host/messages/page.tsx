@@ -48,10 +48,18 @@ interface ConversationDetail {
   booking_id: number;
   venue_info: Record<string, unknown> | null;
   messages: MessageItem[];
+  has_more_messages: boolean;
+  before_cursor: string | null;
   created_at: string;
   updated_at: string;
 }
 
+interface MessagePage {
+  messages: MessageItem[];
+  has_more: boolean;
+  before_cursor: string | null;
+}
+
 interface BookingDetail {
   id: number;
   artist_id: number;
@@ -234,6 +242,7 @@ function HostMessagesContent() {
   const [bookingDetail, setBookingDetail] = useState<BookingDetail | null>(null);
   const [newNote, setNewNote] = useState("");
   const [isSending, setIsSending] = useState(false);
+  const [isLoadingOlder, setIsLoadingOlder] = useState(false);
   const [showVenueForm, setShowVenueForm] = useState(false);
   const [venueInfo, setVenueInfo] = useState<VenueInfo>({ ...EMPTY_VENUE });
   const [isSavingVenue, setIsSavingVenue] = useState(false);
@@ -340,6 +349,38 @@ function HostMessagesContent() {
     }
   };
 
+  const loadOlderMessages = async () => {
+    if (!selectedConv?.has_more_messages || !selectedConv.before_cursor) return;
+    const convId = selectedConv.id;
+
+    setIsLoadingOlder(true);
+    try {
+      const token = getToken();
+      const params = new URLSearchParams({ before: selectedConv.before_cursor });
+      const res = await fetch(`${API_URL}/conversations/${convId}/messages?${params}`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
+
+      if (res.ok) {
+        const page: MessagePage = await res.json();
+        setSelectedConv((prev) =>
+          prev && prev.id === convId
+            ? {
+                ...prev,
+                messages: [...page.messages, ...prev.messages],
+                has_more_messages: page.has_more,
+                before_cursor: page.before_cursor,
+              }
+            : prev
+        );
+      }
+    } catch (err) {
+      console.error("Failed to load older messages:", err);
+    } finally {
+      setIsLoadingOlder(false);
+    }
+  };
+
   const sendNote = async () => {
     if (!newNote.trim() || !selectedConvId) return;
 
@@ -907,6 +948,16 @@ function HostMessagesContent() {
                     <p className="text-sm text-slate-400">No activity yet.</p>
                   ) : (
                     <div className="space-y-3 max-h-[400px] overflow-y-auto">
+                      {selectedConv.has_more_messages && (
+                        <button
+                          onClick={loadOlderMessages}
+                          disabled={isLoadingOlder}
+                          className="w-full flex items-center justify-center gap-1.5 py-1.5 text-xs font-medium text-primary-600 hover:text-primary-700 disabled:opacity-50"
+                        >
+                          {isLoadingOlder && <Loader2 size={12} className="animate-spin" />}
+                          Load older activity
+                        </button>
+                      )}
                       {selectedConv.messages.map((msg) => (
                         <div key={msg.id} className="flex gap-3 text-sm">
                           <div className="flex-shrink-0 pt-0.5">
@@ -48,10 +48,18 @@ interface ConversationDetail {
   booking_id: number;
   venue_info: Record<string, unknown> | null;
   messages: MessageItem[];
+  has_more_messages: boolean;
+  before_cursor: string | null;
   created_at: string;
   updated_at: string;
 }
 
+interface MessagePage {
+  messages: MessageItem[];
+  has_more: boolean;
+  before_cursor: string | null;
+}
+
 interface BookingDetail {
   id: number;
   status: string;
@@ -161,6 +169,7 @@ function ArtistMessagesContent() {
   const [bookingDetail, setBookingDetail] = useState<BookingDetail | null>(null);
   const [newMessage, setNewMessage] = useState("");
   const [isSending, setIsSending] = useState(false);
+  const [isLoadingOlder, setIsLoadingOlder] = useState(false);
   const [showVenueInfo, setShowVenueInfo] = useState(false);
   const [showBookingDetails, setShowBookingDetails] = useState(true);
   const [currentUserId, setCurrentUserId] = useState<number | null>(null);
@@ -176,9 +185,11 @@ function ArtistMessagesContent() {
     fetchCurrentUser();
   }, []);
 
+  // Follow new messages, but stay put when older ones are prepended
+  const lastMessageId = selectedConv?.messages[selectedConv.messages.length - 1]?.id;
   useEffect(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
-  }, [selectedConv?.messages]);
+  }, [selectedConv?.id, lastMessageId]);
 
   const getToken = () => localStorage.getItem("access_token");
 
@@ -267,6 +278,38 @@ function ArtistMessagesContent() {
     }
   };
 
+  const loadOlderMessages = async () => {
+    if (!selectedConv?.has_more_messages || !selectedConv.before_cursor) return;
+    const convId = selectedConv.id;
+
+    setIsLoadingOlder(true);
+    try {
+      const token = getToken();
+      const params = new URLSearchParams({ before: selectedConv.before_cursor });
+      const res = await fetch(`${API_URL}/conversations/${convId}/messages?${params}`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
+
+      if (res.ok) {
+        const page: MessagePage = await res.json();
+        setSelectedConv((prev) =>
+          prev && prev.id === convId
+            ? {
+                ...prev,
+                messages: [...page.messages, ...prev.messages],
+                has_more_messages: page.has_more,
+                before_cursor: page.before_cursor,
+              }
+            : prev
+        );
+      }
+    } catch (err) {
+      console.error("Failed to load older messages:", err);
+    } finally {
+      setIsLoadingOlder(false);
+    }
+  };
+
   const sendMessage = async () => {
     if (!newMessage.trim() || !selectedConvId) return;
 
@@ -670,6 +713,16 @@ function ArtistMessagesContent() {
 
                 {/* Messages */}
                 <div className="flex-1 overflow-y-auto p-4 space-y-3">
+                  {selectedConv.has_more_messages && (
+                    <button
+                      onClick={loadOlderMessages}
+                      disabled={isLoadingOlder}
+                      className="w-full flex items-center justify-center gap-1.5 py-1.5 text-xs font-medium text-primary-600 hover:text-primary-700 disabled:opacity-50"
+                    >
+                      {isLoadingOlder && <Loader2 size={12} className="animate-spin" />}
+                      Load older messages
+                    </button>
+                  )}
                   {selectedConv.messages.length === 0 ? (
                     <div className="text-center py-8">
                       <MessageSquare size={36} className="text-slate-300 mx-auto mb-3" />